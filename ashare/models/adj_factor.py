@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+import numpy as np
+
+@dataclass
+class AdjFactor:
+    """A股复权因子"""
+    ts_code: str            # TS代码
+    trade_date: date        # 交易日期
+    adj_factor: Decimal     # 复权因子
+
+@dataclass
+class AdjustedPrices:
+    """
+    一只股票在一段时间内的复权行情，各字段为按交易日升序排列、长度相同的向量
+    """
+    ts_code: str
+    mode: str                   # 'qfq' 前复权 / 'hfq' 后复权
+    trade_dates: np.ndarray     # datetime64[D]
+    open: np.ndarray            # float64，下同
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    adj_factor: np.ndarray      # 各交易日使用的复权因子，缺失时为 NaN
+
+    def __len__(self) -> int:
+        return len(self.trade_dates)
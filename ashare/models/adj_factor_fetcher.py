@@ -0,0 +1,59 @@
+from typing import List
+from datetime import date
+import pandas as pd
+
+from ashare.models.tushare_api import TushareAPI
+from ashare.models.frame_converter import frame_to_models
+from .adj_factor import AdjFactor
+from ashare.logger.setup_logger import get_logger
+
+ADJ_FACTOR_FIELDS = 'ts_code,trade_date,adj_factor'
+
+class AdjFactorFetcher:
+    def __init__(self, api_token: str):
+        """
+        Args:
+            api_token: Tushare API token
+        """
+        self.api = TushareAPI(api_token)
+        self.logger = get_logger()
+        self.logger.info("初始化 AdjFactorFetcher")
+
+    def _convert_date(self, date_obj: date) -> str:
+        """将date对象转换为tushare所需的日期字符串格式"""
+        return date_obj.strftime('%Y%m%d')
+
+    def fetch_adj_factors(self, ts_code: str, start_date: date, end_date: date) -> List[AdjFactor]:
+        """
+        获取指定股票在给定日期范围内的复权因子
+        
+        Args:
+            ts_code: 股票代码，如：'000001.SZ'
+            start_date: 开始日期
+            end_date: 结束日期
+            
+        Returns:
+            List[AdjFactor]: 复权因子列表
+        """
+        df = self.api.adj_factor(
+            ts_code=ts_code,
+            start_date=self._convert_date(start_date),
+            end_date=self._convert_date(end_date),
+            fields=ADJ_FACTOR_FIELDS
+        )
+        self.logger.info(f"获取 {ts_code} 在 {start_date} 到 {end_date} 的复权因子, 共 {len(df)} 条")
+        return frame_to_models(df, AdjFactor)
+
+    def fetch_adj_factors_frame_by_trade_date(self, trade_date: date) -> pd.DataFrame:
+        """
+        获取指定交易日全市场的复权因子原始数据，可直接交给 AdjFactorRepository.save_frame 保存
+        
+        Args:
+            trade_date: 交易日期
+            
+        Returns:
+            pd.DataFrame: tushare adj_factor 接口返回的数据
+        """
+        df = self.api.adj_factor(trade_date=self._convert_date(trade_date), fields=ADJ_FACTOR_FIELDS)
+        self.logger.info(f"获取 {trade_date} 全市场复权因子, 共 {len(df)} 条")
+        return df
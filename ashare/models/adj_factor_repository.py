@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime, date
+from typing import Dict, List, Optional, Sequence, Set
+from .frame_converter import to_strs, to_date_strs, to_floats
+from .adj_factor import AdjFactor, AdjustedPrices
+from decimal import Decimal
+from .sqlite_repository import SqliteRepository, UpsertResult
+
+ADJUST_MODES = ('qfq', 'hfq')
+
+class AdjFactorRepository(SqliteRepository):
+    """A股复权因子数据仓库"""
+    
+    VALUE_COLUMNS = ('adj_factor',)
+    KEY_COLUMNS = ('ts_code', 'trade_date')
+    COLUMNS = KEY_COLUMNS + VALUE_COLUMNS
+    
+    def save_many(self, factors: List[AdjFactor]) -> UpsertResult:
+        """
+        批量保存复权因子，内容未变化的记录不重写
+        
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        with self._connect() as conn:
+            return self._upsert(conn, 'adj_factors', self.COLUMNS, self.KEY_COLUMNS, [
+                (
+                    factor.ts_code,
+                    factor.trade_date.isoformat(),
+                    float(factor.adj_factor) if factor.adj_factor is not None else None
+                )
+                for factor in factors
+            ])
+    
+    def save_frame(self, df: pd.DataFrame) -> UpsertResult:
+        """
+        批量保存 tushare adj_factor 接口返回的原始数据，按列转换后直接写入，不构造 AdjFactor 对象
+        
+        Args:
+            df: 包含 ts_code、trade_date(YYYYMMDD)、adj_factor 的 DataFrame
+            
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        if df.empty:
+            return UpsertResult()
+        columns = [to_strs(df['ts_code']), to_date_strs(df['trade_date']), to_floats(df['adj_factor'])]
+        with self._connect() as conn:
+            return self._upsert(conn, 'adj_factors', self.COLUMNS, self.KEY_COLUMNS, zip(*columns))
+    
+    def find_by_code(self, ts_code: str) -> List[AdjFactor]:
+        """
+        查询指定股票的所有复权因子
+        
+        Args:
+            ts_code: 股票代码
+            
+        Returns:
+            按交易日期升序排列的AdjFactor对象列表
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT ts_code, trade_date, adj_factor FROM adj_factors WHERE ts_code = ? ORDER BY trade_date',
+                (ts_code,)
+            )
+            return [
+                AdjFactor(
+                    ts_code=row[0],
+                    trade_date=datetime.fromisoformat(row[1]).date(),
+                    adj_factor=Decimal(str(row[2])) if row[2] is not None else None
+                )
+                for row in cursor.fetchall()
+            ]
+    
+    def find_by_code_arrays(self, ts_code: str, start: Optional[date] = None, end: Optional[date] = None,
+                            columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        按列读取单只股票的复权因子，返回 NumPy 数组而不是 AdjFactor 对象，适合批量计算
+        
+        Args:
+            ts_code: 股票代码
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            columns: 要读取的数值列，默认 VALUE_COLUMNS 全部
+        
+        Returns:
+            列名 -> 按交易日升序排列的数组，trade_date 为 YYYYMMDD 的 int32，其余为 float64（空值为 NaN）
+        """
+        return self._find_arrays('adj_factors', self.VALUE_COLUMNS, ts_code, start, end, columns)
+    
+    def find_latest_trade_date(self) -> Optional[date]:
+        """
+        查询已保存复权因子中最新的交易日期
+        
+        Returns:
+            最新交易日期，如果没有任何数据返回None
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT MAX(trade_date) FROM adj_factors')
+            row = cursor.fetchone()
+            return datetime.fromisoformat(row[0]).date() if row and row[0] else None
+    
+    def find_latest_trade_dates(self) -> Dict[str, date]:
+        """
+        查询每只股票已保存复权因子的最新交易日期
+        
+        Returns:
+            股票代码 -> 最新交易日期
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT ts_code, MAX(trade_date) FROM adj_factors GROUP BY ts_code')
+            return {row[0]: datetime.fromisoformat(row[1]).date() for row in cursor.fetchall()}
+    
+    def find_ts_codes(self) -> Set[str]:
+        """
+        查询已有复权因子的股票代码集合
+        
+        Returns:
+            股票代码集合
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT DISTINCT ts_code FROM adj_factors')
+            return {row[0] for row in cursor.fetchall()}
+    
+    def find_adjusted(self, ts_code: str, start_date: date, end_date: date, mode: str = 'qfq') -> AdjustedPrices:
+        """
+        查询复权后的开高低收价格
+        
+        从同一数据库的 daily_quotes 表读取原始行情，与复权因子一次连接查询取出后整列计算，
+        不逐日回放分红送转事件。复权因子缺失的交易日沿用之前最近的因子（因子只在除权除息日变化），
+        之前也没有因子的交易日复权价格为 NaN。
+        
+        后复权价格 = 原始价格 × 当日因子；前复权价格 = 原始价格 × 当日因子 / 区间内最后一个交易日的因子，
+        即区间末尾的价格与原始价格一致。
+        
+        Args:
+            ts_code: 股票代码
+            start_date: 开始日期
+            end_date: 结束日期
+            mode: 'qfq' 前复权或 'hfq' 后复权
+            
+        Returns:
+            AdjustedPrices: 按交易日升序排列的复权价格向量
+            
+        Raises:
+            ValueError: mode 不是 'qfq' 或 'hfq'
+        """
+        if mode not in ADJUST_MODES:
+            raise ValueError(f"不支持的复权方式: {mode}，可选 {ADJUST_MODES}")
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT q.trade_date, q.open, q.high, q.low, q.close, a.adj_factor
+                FROM daily_quotes q
+                LEFT JOIN adj_factors a ON a.ts_code = q.ts_code AND a.trade_date = q.trade_date
+                WHERE q.ts_code = ? AND q.trade_date BETWEEN ? AND ?
+                ORDER BY q.trade_date
+            ''', (ts_code, start_date.isoformat(), end_date.isoformat()))
+            rows = cursor.fetchall()
+        
+        trade_dates = np.array([row[0] for row in rows], dtype='datetime64[D]')
+        # None 转为 NaN
+        values = np.array([row[1:] for row in rows], dtype=float).reshape(len(rows), 5)
+        prices, factors = values[:, :4], values[:, 4]
+        
+        # 向前填充缺失的因子
+        valid = ~np.isnan(factors)
+        last_valid = np.maximum.accumulate(np.where(valid, np.arange(len(factors)), -1))
+        factors = np.where(last_valid >= 0, factors[np.maximum(last_valid, 0)], np.nan)
+        
+        scale = factors if mode == 'hfq' or not len(factors) else factors / factors[-1]
+        adjusted = prices * scale[:, None]
+        return AdjustedPrices(
+            ts_code=ts_code,
+            mode=mode,
+            trade_dates=trade_dates,
+            open=adjusted[:, 0],
+            high=adjusted[:, 1],
+            low=adjusted[:, 2],
+            close=adjusted[:, 3],
+            adj_factor=factors
+        )
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from functools import partial
+from typing import Awaitable, Callable, Optional
+import aiohttp
+import pandas as pd
+from ashare.logger.setup_logger import get_logger
+from ashare.models.rate_limiter import RateLimiter
+from ashare.models.response_cache import ResponseCache
+from ashare.models.retry_policy import RetryPolicy, ErrorKind, TushareError, classify_error, parse_retry_after, retry_after_of
+from ashare.models.sync_metrics import SyncMetrics
+from ashare.models.tushare_api import TushareAPI, METRIC_KEY_PARAMS
+
+class AsyncTushareAPI:
+    """
+    基于 asyncio 的 Tushare 客户端
+
+    与 TushareAPI 接口一致，按属性调用接口：``df = await api.daily(ts_code='000001.SZ')``。
+    直接按 Tushare HTTP 协议发起非阻塞请求，用信号量限制同时在途的请求数，
+    与同步客户端共享进程内限流器，失败时按指数退避异步等待后重试。
+    通过 ``TushareAPI.use_backend`` 指定的后端同样生效，此时不发起 HTTP 请求。
+    """
+
+    DEFAULT_HTTP_URL = 'http://api.waditu.com/dataapi'
+
+    def __init__(self, api_token: str,
+                 max_concurrency: int = 50,
+                 max_retries: int = 3,
+                 retry_delay: float = 1.0,
+                 max_retry_delay: float = 60.0,
+                 timeout: float = 30.0,
+                 http_url: str = DEFAULT_HTTP_URL,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[SyncMetrics] = None):
+        """
+        Args:
+            api_token: Tushare API token
+            max_concurrency: 同时在途的最大请求数
+            max_retries: 最大重试次数
+            retry_delay: 临时错误首次重试的等待时间(秒)，之后指数退避
+            max_retry_delay: 重试等待时间上限(秒)
+            timeout: 单次请求超时时间(秒)
+            http_url: Tushare 数据接口地址
+            rate_limiter: 限流器，默认使用与 TushareAPI 共享的限流器
+            cache: 响应缓存，默认按 TUSHARE_CACHE_DIR/TUSHARE_CACHE_MODE 环境变量创建
+            retry_policy: 重试策略，默认按 max_retries/retry_delay/max_retry_delay 创建
+            metrics: 调用指标，默认使用与 TushareAPI 共享的指标
+        """
+        self.api_token = api_token
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=max_retry_delay,
+            rate_limit_delay=min(10 * retry_delay, max_retry_delay)
+        )
+        self.timeout = timeout
+        self.http_url = http_url.rstrip('/')
+        self.rate_limiter = rate_limiter or TushareAPI.get_rate_limiter()
+        self.metrics = metrics if metrics is not None else TushareAPI.get_metrics()
+        self.cache = cache if cache is not None else ResponseCache.from_env()
+        # 与 TushareAPI 一样，创建时已通过 TushareAPI.use_backend 指定后端的，不再发起 HTTP 请求
+        self.backend = TushareAPI._backend
+        self.logger = get_logger()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncTushareAPI':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """关闭底层 HTTP 会话"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # 会话和信号量需要在事件循环中创建，因此延迟到第一次请求时初始化
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _post(self, api_name: str, fields: str, params: dict) -> pd.DataFrame:
+        """按 Tushare HTTP 协议发起一次请求，指定了后端时改为在线程池中调用后端"""
+        if self.backend is not None:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                return await asyncio.to_thread(self.backend.query, api_name, fields, **params)
+        session = self._get_session()
+        payload = {
+            'api_name': api_name,
+            'token': self.api_token,
+            'params': params,
+            'fields': fields
+        }
+        async with self._semaphore:
+            async with session.post(f"{self.http_url}/{api_name}", json=payload) as response:
+                response.raise_for_status()
+                result = await response.json(content_type=None)
+                retry_after = response.headers.get('Retry-After')
+        if result['code'] != 0:
+            raise TushareError(result['msg'], code=result['code'],
+                               retry_after=parse_retry_after(retry_after))
+        data = result['data']
+        if not data:
+            return pd.DataFrame()
+        return pd.DataFrame(data['items'], columns=data['fields'])
+
+    async def query(self, api_name: str, fields: str = '', **params) -> pd.DataFrame:
+        """
+        调用指定接口
+
+        Args:
+            api_name: 接口名，如 'daily'
+            fields: 返回字段，逗号分隔
+            **params: 接口参数
+
+        Returns:
+            接口返回的数据
+        """
+        if self.cache is not None:
+            cache_params = dict(params, fields=fields)
+            started_at, start = time.time(), time.perf_counter()
+            df = self.cache.get(api_name, cache_params)
+            if df is not None:
+                self.logger.info(f"调用 {api_name} 方法命中缓存")
+                self.metrics.record_call(api_name, time.perf_counter() - start, len(df), key=self._metric_key(params),
+                                         cached=True, started_at=started_at)
+                return df
+            df = await self._query_with_retry(api_name, fields, params)
+            self.cache.put(api_name, cache_params, df)
+            return df
+        return await self._query_with_retry(api_name, fields, params)
+
+    @staticmethod
+    def _metric_key(params: dict) -> Optional[str]:
+        """调用的主要参数，用于在指标中区分同一接口的不同调用"""
+        return next((str(params[name]) for name in METRIC_KEY_PARAMS if params.get(name)), None)
+
+    async def _query_with_retry(self, api_name: str, fields: str, params: dict) -> pd.DataFrame:
+        """经过限流和重试发起请求，按错误类型决定是否重试，并记录调用指标"""
+        started_at = time.time()
+        latency, total_wait = 0.0, 0.0
+        key = self._metric_key(params)
+        for attempt in range(self.retry_policy.attempts):
+            waited = self.rate_limiter.reserve(api_name)
+            if waited > 0:
+                total_wait += waited
+                self.logger.info(f"调用 {api_name} 方法前限流等待 {waited:.2f} 秒")
+                await asyncio.sleep(waited)
+            start = time.perf_counter()
+            try:
+                df = await self._post(api_name, fields, params)
+            except Exception as e:
+                latency += time.perf_counter() - start
+                kind = classify_error(e)
+                if kind == ErrorKind.EMPTY:
+                    self.logger.info(f"调用 {api_name} 方法没有返回数据: {str(e)}")
+                    self.metrics.record_call(api_name, latency, 0, key=key, retries=attempt,
+                                             rate_limit_wait=total_wait, started_at=started_at)
+                    return pd.DataFrame()
+                if not self.retry_policy.should_retry(kind, attempt):
+                    self.logger.error(f"调用 {api_name} 方法失败({kind.value})，不再重试: {str(e)}")
+                    self.metrics.record_call(api_name, latency, 0, key=key, retries=attempt,
+                                             rate_limit_wait=total_wait, error=str(e), started_at=started_at)
+                    raise
+                delay = self.retry_policy.delay(kind, attempt, retry_after_of(e))
+                self.logger.warning(
+                    f"调用 {api_name} 方法失败({kind.value})，{delay:.2f} 秒后进行第 {attempt + 1} 次重试: {str(e)}")
+                await asyncio.sleep(delay)
+            else:
+                latency += time.perf_counter() - start
+                self.metrics.record_call(api_name, latency, len(df), key=key, retries=attempt,
+                                         rate_limit_wait=total_wait, started_at=started_at)
+                return df
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[pd.DataFrame]]:
+        """按属性调用接口，返回可等待的调用"""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return partial(self.query, name)
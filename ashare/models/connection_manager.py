@@ -0,0 +1,119 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+from .schema import migrate
+
+# 每个连接建立时执行的 PRAGMA：WAL 下读写互不阻塞，synchronous=NORMAL 在 WAL 下只在检查点时 fsync，
+# 页缓存 64MB（负数表示 KiB），内存映射 256MB，临时表和排序使用内存
+PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('cache_size', -65536),
+    ('mmap_size', 268435456),
+    ('temp_store', 'MEMORY'),
+)
+
+def apply_pragmas(conn: sqlite3.Connection):
+    """对连接执行 PRAGMAS"""
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+
+class ConnectionManager:
+    """
+    同一数据库文件的共享连接
+
+    每个线程复用一个长期打开的连接，连接建立时执行 PRAGMAS，避免每次查询都重新连接、重新读取表结构。
+    通过 for_database 取得，同一数据库文件的所有数据仓库共用一个实例。
+    数据库文件被删除或替换后，下次取连接时自动重新连接。
+    """
+
+    _managers: Dict[str, 'ConnectionManager'] = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            timeout: 等待其他连接释放写锁的时间(秒)
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._schema_file_id = None
+        self._schema_lock = threading.Lock()
+
+    @classmethod
+    def for_database(cls, db_path: str) -> 'ConnectionManager':
+        """取得数据库文件对应的共享实例"""
+        key = db_path if cls._is_memory(db_path) else os.path.abspath(db_path)
+        with cls._managers_lock:
+            manager = cls._managers.get(key)
+            if manager is None:
+                manager = cls(db_path)
+                cls._managers[key] = manager
+            return manager
+
+    @staticmethod
+    def _is_memory(db_path: str) -> bool:
+        return db_path == ':memory:' or db_path.startswith('file:')
+
+    def _file_id(self) -> Optional[Tuple[int, int]]:
+        """数据库文件的 (设备号, inode)，用于发现文件被删除或替换"""
+        if self._is_memory(self.db_path):
+            return None
+        try:
+            stat = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def connect(self) -> sqlite3.Connection:
+        """新建一个执行过 PRAGMAS 的独立连接，由调用方负责关闭"""
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+        apply_pragmas(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """当前线程的共享连接"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None and (self._is_memory(self.db_path) or self._local.file_id == self._file_id()):
+            return conn
+        if conn is not None:
+            conn.close()
+        conn = self.connect()
+        self._local.connection = conn
+        self._local.file_id = self._file_id()
+        return conn
+
+    def ensure_schema(self, conn: Optional[sqlite3.Connection] = None):
+        """
+        确保数据库已升级到最新的表结构版本
+
+        每个数据库文件只检查一次，之后只比较文件的 (设备号, inode)，文件被删除或替换后重新检查；
+        内存数据库每个连接都是独立的库，每次都检查。
+
+        Args:
+            conn: 在该连接上升级，默认使用当前线程的共享连接
+        """
+        if self._is_memory(self.db_path):
+            migrate(conn or self.connection())
+            return
+        if self._schema_file_id is not None and self._schema_file_id == self._file_id():
+            return
+        with self._schema_lock:
+            file_id = self._file_id()
+            if self._schema_file_id is not None and self._schema_file_id == file_id:
+                return
+            conn = conn or self.connection()
+            migrate(conn)
+            # 在调用方未提交的事务中升级时，事务可能被回滚，下次仍需检查
+            if not conn.in_transaction:
+                self._schema_file_id = self._file_id()
+
+    def close(self):
+        """关闭当前线程的共享连接"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
@@ -6,13 +6,27 @@ import pandas as pd
 import math
 
 from ashare.models.tushare_api import TushareAPI
+from ashare.models.frame_converter import frame_to_models
+from ashare.models.async_tushare_api import AsyncTushareAPI
 from .daily_indicator import DailyIndicator
 import logging
 from ashare.logger.setup_logger import get_logger
 
+DAILY_INDICATOR_FIELDS = (
+    'ts_code,trade_date,close,turnover_rate,turnover_rate_f,volume_ratio,'
+    'pe,pe_ttm,pb,ps,ps_ttm,dv_ratio,dv_ttm,total_share,float_share,'
+    'free_share,total_mv,circ_mv'
+)
+
 class DailyIndicatorFetcher:
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, async_api: Optional[AsyncTushareAPI] = None):
+        """
+        Args:
+            api_token: Tushare API token
+            async_api: 异步方法使用的客户端，默认按 api_token 创建
+        """
         self.api = TushareAPI(api_token)
+        self.async_api = async_api or AsyncTushareAPI(api_token)
         self.logger = get_logger()
         self.logger.info("初始化 DailyIndicatorFetcher")
 
@@ -48,6 +62,23 @@ class DailyIndicatorFetcher:
         Returns:
             List[DailyIndicator]: 每日指标数据列表
         """
+        return self._to_indicators(self.fetch_daily_indicators_frame(ts_code, start_date, end_date))
+
+    def fetch_daily_indicators_frame(self, ts_code: str,
+                                     start_date: date,
+                                     end_date: date) -> pd.DataFrame:
+        """
+        获取每日指标原始数据，不构造 DailyIndicator 对象，
+        可直接交给 DailyIndicatorRepository.save_frame 保存
+        
+        Args:
+            ts_code: 股票代码，如：'000001.SZ'
+            start_date: 开始日期
+            end_date: 结束日期
+            
+        Returns:
+            pd.DataFrame: tushare daily_basic 接口返回的数据
+        """
         # 转换日期格式
         start_date_str = self._convert_date(start_date)
         end_date_str = self._convert_date(end_date)
@@ -57,35 +88,24 @@ class DailyIndicatorFetcher:
             ts_code=ts_code,
             start_date=start_date_str,
             end_date=end_date_str,
-            fields='ts_code,trade_date,close,turnover_rate,turnover_rate_f,volume_ratio,'
-                  'pe,pe_ttm,pb,ps,ps_ttm,dv_ratio,dv_ttm,total_share,float_share,'
-                  'free_share,total_mv,circ_mv'
+            fields=DAILY_INDICATOR_FIELDS
         )
         self.logger.info(f"获取 {ts_code} 在 {start_date} 到 {end_date} 的每日指标数据, df=\n{df}")
-        
-        # 转换为DailyIndicator对象列表
-        indicators = []
-        for _, row in df.iterrows():
-            indicator = DailyIndicator(
-                ts_code=row['ts_code'],
-                trade_date=datetime.strptime(str(row['trade_date']), '%Y%m%d').date(),
-                close=self._convert_decimal(row['close']),
-                turnover_rate=self._convert_decimal(row['turnover_rate']),
-                turnover_rate_f=self._convert_decimal(row['turnover_rate_f']),
-                volume_ratio=self._convert_decimal(row['volume_ratio']),
-                pe=self._convert_decimal(row['pe']),
-                pe_ttm=self._convert_decimal(row['pe_ttm']),
-                pb=self._convert_decimal(row['pb']),
-                ps=self._convert_decimal(row['ps']),
-                ps_ttm=self._convert_decimal(row['ps_ttm']),
-                dv_ratio=self._convert_decimal(row['dv_ratio']),
-                dv_ttm=self._convert_decimal(row['dv_ttm']),
-                total_share=self._convert_decimal(row['total_share']),
-                float_share=self._convert_decimal(row['float_share']),
-                free_share=self._convert_decimal(row['free_share']),
-                total_mv=self._convert_decimal(row['total_mv']),
-                circ_mv=self._convert_decimal(row['circ_mv'])
-            )
-            indicators.append(indicator)
-            
-        return indicators
\ No newline at end of file
+        return df
+
+    async def fetch_daily_indicators_async(self, ts_code: str,
+                                           start_date: date,
+                                           end_date: date) -> List[DailyIndicator]:
+        """fetch_daily_indicators 的异步版本"""
+        df = await self.async_api.daily_basic(
+            ts_code=ts_code,
+            start_date=self._convert_date(start_date),
+            end_date=self._convert_date(end_date),
+            fields=DAILY_INDICATOR_FIELDS
+        )
+        self.logger.info(f"获取 {ts_code} 在 {start_date} 到 {end_date} 的每日指标数据, 共 {len(df)} 条")
+        return self._to_indicators(df)
+
+    def _to_indicators(self, df: pd.DataFrame) -> List[DailyIndicator]:
+        """将tushare返回的DataFrame转换为DailyIndicator对象列表"""
+        return frame_to_models(df, DailyIndicator)
@@ -1,53 +1,39 @@
 import sqlite3
+import numpy as np
+import pandas as pd
 from datetime import datetime
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
+from .frame_converter import to_strs, to_date_strs, to_floats
 from .daily_indicator import DailyIndicator
 from decimal import Decimal
+from .sqlite_repository import SqliteRepository, UpsertResult
+from .panel import Panel
 
-class DailyIndicatorRepository:
+class DailyIndicatorRepository(SqliteRepository):
     """A股每日指标数据仓库"""
     
-    def __init__(self, db_path: str):
-        """
-        初始化数据仓库
-        
-        Args:
-            db_path: SQLite数据库文件路径
-        """
-        self.db_path = db_path
-        self._init_db()
-    
-    def _init_db(self):
-        """初始化数据库表结构"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS daily_indicators (
-                    ts_code TEXT NOT NULL,
-                    trade_date TEXT NOT NULL,
-                    close DECIMAL(20,4),
-                    turnover_rate DECIMAL(20,4),
-                    turnover_rate_f DECIMAL(20,4),
-                    volume_ratio DECIMAL(20,4),
-                    pe DECIMAL(20,4),
-                    pe_ttm DECIMAL(20,4),
-                    pb DECIMAL(20,4),
-                    ps DECIMAL(20,4),
-                    ps_ttm DECIMAL(20,4),
-                    dv_ratio DECIMAL(20,4),
-                    dv_ttm DECIMAL(20,4),
-                    total_share DECIMAL(20,4),
-                    float_share DECIMAL(20,4),
-                    free_share DECIMAL(20,4),
-                    total_mv DECIMAL(20,4),
-                    circ_mv DECIMAL(20,4),
-                    PRIMARY KEY (ts_code, trade_date)
-                )
-            ''')
-            # 创建索引以提升查询性能
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trade_date ON daily_indicators(trade_date)')
-            conn.commit()
+    # 除 ts_code 和 trade_date 外按表中顺序排列的数值字段
+    VALUE_COLUMNS = (
+        'close',
+        'turnover_rate',
+        'turnover_rate_f',
+        'volume_ratio',
+        'pe',
+        'pe_ttm',
+        'pb',
+        'ps',
+        'ps_ttm',
+        'dv_ratio',
+        'dv_ttm',
+        'total_share',
+        'float_share',
+        'free_share',
+        'total_mv',
+        'circ_mv',
+    )
+    KEY_COLUMNS = ('ts_code', 'trade_date')
+    COLUMNS = KEY_COLUMNS + VALUE_COLUMNS
     
     def save(self, indicator: DailyIndicator) -> None:
         """
@@ -56,7 +42,7 @@ class DailyIndicatorRepository:
         Args:
             indicator: DailyIndicator对象
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT OR REPLACE INTO daily_indicators VALUES (
@@ -95,15 +81,15 @@ class DailyIndicatorRepository:
         """
         return float(value) if value is not None else None
     
-    def save_many(self, indicators: List[DailyIndicator]) -> None:
-        """批量保存每日指标数据"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.executemany('''
-                INSERT OR REPLACE INTO daily_indicators VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-            ''', [
+    def save_many(self, indicators: List[DailyIndicator]) -> UpsertResult:
+        """
+        批量保存每日指标数据，内容未变化的记录不重写
+        
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        with self._connect() as conn:
+            return self._upsert(conn, 'daily_indicators', self.COLUMNS, self.KEY_COLUMNS, [
                 (
                     ind.ts_code,
                     ind.trade_date.isoformat(),
@@ -127,6 +113,24 @@ class DailyIndicatorRepository:
                 for ind in indicators
             ])
     
+    def save_frame(self, df: pd.DataFrame) -> UpsertResult:
+        """
+        批量保存 tushare daily_basic 接口返回的原始数据，按列转换后直接写入，不构造 DailyIndicator 对象，
+        内容未变化的记录不重写
+        
+        Args:
+            df: 包含 ts_code、trade_date(YYYYMMDD) 及各数值字段的 DataFrame
+            
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        if df.empty:
+            return UpsertResult()
+        columns = [to_strs(df['ts_code']), to_date_strs(df['trade_date'])]
+        columns += [to_floats(df[name]) for name in self.VALUE_COLUMNS]
+        with self._connect() as conn:
+            return self._upsert(conn, 'daily_indicators', self.COLUMNS, self.KEY_COLUMNS, zip(*columns))
+    
     def find_by_code_and_date(self, ts_code: str, trade_date: date) -> Optional[DailyIndicator]:
         """
         查询指定股票在指定日期的指标数据
@@ -138,7 +142,7 @@ class DailyIndicatorRepository:
         Returns:
             DailyIndicator对象，如果未找到返回None
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM daily_indicators WHERE ts_code = ? AND trade_date = ?',
@@ -157,7 +161,7 @@ class DailyIndicatorRepository:
         Returns:
             DailyIndicator对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM daily_indicators WHERE ts_code = ? ORDER BY trade_date',
@@ -165,6 +169,39 @@ class DailyIndicatorRepository:
             )
             return [self._row_to_indicator(row) for row in cursor.fetchall()]
     
+    def find_by_code_arrays(self, ts_code: str, start: Optional[date] = None, end: Optional[date] = None,
+                            columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        按列读取单只股票的每日指标，返回 NumPy 数组而不是 DailyIndicator 对象，适合批量计算
+        
+        Args:
+            ts_code: 股票代码
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            columns: 要读取的数值列，默认 VALUE_COLUMNS 全部
+        
+        Returns:
+            列名 -> 按交易日升序排列的数组，trade_date 为 YYYYMMDD 的 int32，其余为 float64（空值为 NaN）
+        """
+        return self._find_arrays('daily_indicators', self.VALUE_COLUMNS, ts_code, start, end, columns)
+    
+    def load_panel(self, field: str, ts_codes: Optional[Sequence[str]] = None, start: Optional[date] = None,
+                   end: Optional[date] = None, cache_dir: Optional[str] = None) -> Panel:
+        """
+        读取一个每日指标字段的 交易日 × 股票 面板，用于全市场截面计算
+        
+        Args:
+            field: VALUE_COLUMNS 中的字段，如 'pe'
+            ts_codes: 列的股票代码及顺序，默认为区间内有数据的全部股票（按代码排序）
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            cache_dir: 传入时面板写入该目录并以内存映射方式返回，之后可用 Panel.load 直接打开
+        
+        Returns:
+            Panel: values 为 float64 二维数组，缺失为 NaN
+        """
+        return self._load_panel('daily_indicators', self.VALUE_COLUMNS, field, ts_codes, start, end, cache_dir)
+    
     def find_by_date(self, trade_date: date) -> List[DailyIndicator]:
         """
         查询指定日期的所有股票指标数据
@@ -175,7 +212,7 @@ class DailyIndicatorRepository:
         Returns:
             DailyIndicator对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM daily_indicators WHERE trade_date = ? ORDER BY ts_code',
@@ -183,6 +220,18 @@ class DailyIndicatorRepository:
             )
             return [self._row_to_indicator(row) for row in cursor.fetchall()]
     
+    def find_latest_trade_dates(self) -> Dict[str, date]:
+        """
+        查询每只股票已保存指标数据的最新交易日期
+        
+        Returns:
+            股票代码 -> 最新交易日期
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT ts_code, MAX(trade_date) FROM daily_indicators GROUP BY ts_code')
+            return {row[0]: datetime.fromisoformat(row[1]).date() for row in cursor.fetchall()}
+    
     def _row_to_indicator(self, row: tuple) -> DailyIndicator:
         """将数据库行转换为DailyIndicator对象"""
         def to_decimal(value) -> Optional[Decimal]:
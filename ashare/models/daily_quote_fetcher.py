@@ -6,12 +6,20 @@ import tushare as ts
 import pandas as pd
 from .daily_quote import DailyQuote
 from .tushare_api import TushareAPI
+from .frame_converter import frame_to_models
+from .async_tushare_api import AsyncTushareAPI
 import logging
 from ashare.logger.setup_logger import get_logger
 
 class DailyQuoteFetcher:
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, async_api: Optional[AsyncTushareAPI] = None):
+        """
+        Args:
+            api_token: Tushare API token
+            async_api: 异步方法使用的客户端，默认按 api_token 创建
+        """
         self.api = TushareAPI(api_token)
+        self.async_api = async_api or AsyncTushareAPI(api_token)
         self.logger = get_logger()
         self.logger.info("初始化 DailyQuoteFetcher")
 
@@ -49,22 +57,53 @@ class DailyQuoteFetcher:
         )
         self.logger.info(f"获取 {ts_codes} 在 {start_date} 到 {end_date} 的日行情数据, df=\n{df}")
         
-        # 转换为DailyQuote对象列表
-        quotes = []
-        for _, row in df.iterrows():
-            quote = DailyQuote(
-                ts_code=row['ts_code'],
-                trade_date=datetime.strptime(str(row['trade_date']), '%Y%m%d').date(),
-                open=self._convert_decimal(row['open']),
-                high=self._convert_decimal(row['high']),
-                low=self._convert_decimal(row['low']),
-                close=self._convert_decimal(row['close']),
-                pre_close=self._convert_decimal(row['pre_close']),
-                change=self._convert_decimal(row['change']),
-                pct_chg=self._convert_decimal(row['pct_chg']),
-                vol=self._convert_decimal(row['vol']),
-                amount=self._convert_decimal(row['amount'])
-            )
-            quotes.append(quote)
+        return self._to_quotes(df)
+
+    def fetch_daily_quotes_by_trade_date(self, trade_date: date) -> List[DailyQuote]:
+        """
+        获取指定交易日全市场的日行情数据（一次调用返回整个截面）
+        
+        Args:
+            trade_date: 交易日期
+            
+        Returns:
+            List[DailyQuote]: 日行情数据列表
+        """
+        return self._to_quotes(self.fetch_daily_quotes_frame_by_trade_date(trade_date))
+
+    def fetch_daily_quotes_frame_by_trade_date(self, trade_date: date) -> pd.DataFrame:
+        """
+        获取指定交易日全市场的日行情原始数据，不构造 DailyQuote 对象，
+        可直接交给 DailyQuoteRepository.save_frame 保存
+        
+        Args:
+            trade_date: 交易日期
             
-        return quotes
\ No newline at end of file
+        Returns:
+            pd.DataFrame: tushare daily 接口返回的数据
+        """
+        df = self.api.daily(trade_date=self._convert_date(trade_date))
+        self.logger.info(f"获取 {trade_date} 全市场日行情数据, 共 {len(df)} 条")
+        return df
+
+    async def fetch_daily_quotes_async(self, ts_codes: str,
+                                       start_date: date,
+                                       end_date: date) -> List[DailyQuote]:
+        """fetch_daily_quotes 的异步版本"""
+        df = await self.async_api.daily(
+            ts_code=ts_codes,
+            start_date=self._convert_date(start_date),
+            end_date=self._convert_date(end_date)
+        )
+        self.logger.info(f"获取 {ts_codes} 在 {start_date} 到 {end_date} 的日行情数据, 共 {len(df)} 条")
+        return self._to_quotes(df)
+
+    async def fetch_daily_quotes_by_trade_date_async(self, trade_date: date) -> List[DailyQuote]:
+        """fetch_daily_quotes_by_trade_date 的异步版本"""
+        df = await self.async_api.daily(trade_date=self._convert_date(trade_date))
+        self.logger.info(f"获取 {trade_date} 全市场日行情数据, 共 {len(df)} 条")
+        return self._to_quotes(df)
+
+    def _to_quotes(self, df: pd.DataFrame) -> List[DailyQuote]:
+        """将tushare返回的DataFrame转换为DailyQuote对象列表"""
+        return frame_to_models(df, DailyQuote)
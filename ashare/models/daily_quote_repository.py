@@ -1,45 +1,31 @@
 import sqlite3
+import numpy as np
+import pandas as pd
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set
+from .frame_converter import to_strs, to_date_strs, to_floats
 from .daily_quote import DailyQuote
 from decimal import Decimal
+from .sqlite_repository import SqliteRepository, UpsertResult
+from .panel import Panel
 
-class DailyQuoteRepository:
+class DailyQuoteRepository(SqliteRepository):
     """A股日行情数据仓库"""
     
-    def __init__(self, db_path: str):
-        """
-        初始化数据仓库
-        
-        Args:
-            db_path: SQLite数据库文件路径
-        """
-        self.db_path = db_path
-        self._init_db()
-    
-    def _init_db(self):
-        """初始化数据库表结构"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS daily_quotes (
-                    ts_code TEXT NOT NULL,
-                    trade_date TEXT NOT NULL,
-                    open DECIMAL(20,4),
-                    high DECIMAL(20,4),
-                    low DECIMAL(20,4),
-                    close DECIMAL(20,4),
-                    pre_close DECIMAL(20,4),
-                    change DECIMAL(20,4),
-                    pct_chg DECIMAL(20,4),
-                    vol DECIMAL(20,4),
-                    amount DECIMAL(20,4),
-                    PRIMARY KEY (ts_code, trade_date)
-                )
-            ''')
-            # 创建索引以提升查询性能
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_daily_quotes_trade_date ON daily_quotes(trade_date)')
-            conn.commit()
+    # 除 ts_code 和 trade_date 外按表中顺序排列的数值字段
+    VALUE_COLUMNS = (
+        'open',
+        'high',
+        'low',
+        'close',
+        'pre_close',
+        'change',
+        'pct_chg',
+        'vol',
+        'amount',
+    )
+    KEY_COLUMNS = ('ts_code', 'trade_date')
+    COLUMNS = KEY_COLUMNS + VALUE_COLUMNS
     
     def save(self, quote: DailyQuote) -> None:
         """
@@ -48,7 +34,7 @@ class DailyQuoteRepository:
         Args:
             quote: DailyQuote对象
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT OR REPLACE INTO daily_quotes VALUES (
@@ -68,20 +54,18 @@ class DailyQuoteRepository:
                 float(quote.amount)
             ))
     
-    def save_many(self, quotes: List[DailyQuote]) -> None:
+    def save_many(self, quotes: List[DailyQuote]) -> UpsertResult:
         """
-        批量保存日行情数据
+        批量保存日行情数据，内容未变化的记录不重写
         
         Args:
             quotes: DailyQuote对象列表
+            
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.executemany('''
-                INSERT OR REPLACE INTO daily_quotes VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-            ''', [
+        with self._connect() as conn:
+            return self._upsert(conn, 'daily_quotes', self.COLUMNS, self.KEY_COLUMNS, [
                 (
                     quote.ts_code,
                     quote.trade_date.isoformat(),
@@ -98,6 +82,24 @@ class DailyQuoteRepository:
                 for quote in quotes
             ])
     
+    def save_frame(self, df: pd.DataFrame) -> UpsertResult:
+        """
+        批量保存 tushare daily 接口返回的原始数据，按列转换后直接写入，不构造 DailyQuote 对象，
+        内容未变化的记录不重写
+        
+        Args:
+            df: 包含 ts_code、trade_date(YYYYMMDD) 及各数值字段的 DataFrame
+            
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        if df.empty:
+            return UpsertResult()
+        columns = [to_strs(df['ts_code']), to_date_strs(df['trade_date'])]
+        columns += [to_floats(df[name]) for name in self.VALUE_COLUMNS]
+        with self._connect() as conn:
+            return self._upsert(conn, 'daily_quotes', self.COLUMNS, self.KEY_COLUMNS, zip(*columns))
+    
     def find_by_code_and_date(self, ts_code: str, trade_date: date) -> Optional[DailyQuote]:
         """
         查询指定股票在指定日期的行情数据
@@ -109,7 +111,7 @@ class DailyQuoteRepository:
         Returns:
             DailyQuote对象，如果未找到返回None
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM daily_quotes WHERE ts_code = ? AND trade_date = ?',
@@ -128,7 +130,7 @@ class DailyQuoteRepository:
         Returns:
             DailyQuote对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM daily_quotes WHERE ts_code = ? ORDER BY trade_date',
@@ -136,6 +138,39 @@ class DailyQuoteRepository:
             )
             return [self._row_to_quote(row) for row in cursor.fetchall()]
     
+    def find_by_code_arrays(self, ts_code: str, start: Optional[date] = None, end: Optional[date] = None,
+                            columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        按列读取单只股票的行情数据，返回 NumPy 数组而不是 DailyQuote 对象，适合批量计算
+        
+        Args:
+            ts_code: 股票代码
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            columns: 要读取的数值列，默认 VALUE_COLUMNS 全部
+        
+        Returns:
+            列名 -> 按交易日升序排列的数组，trade_date 为 YYYYMMDD 的 int32，其余为 float64（空值为 NaN）
+        """
+        return self._find_arrays('daily_quotes', self.VALUE_COLUMNS, ts_code, start, end, columns)
+    
+    def load_panel(self, field: str, ts_codes: Optional[Sequence[str]] = None, start: Optional[date] = None,
+                   end: Optional[date] = None, cache_dir: Optional[str] = None) -> Panel:
+        """
+        读取一个行情字段的 交易日 × 股票 面板，用于全市场截面计算
+        
+        Args:
+            field: VALUE_COLUMNS 中的字段，如 'close'
+            ts_codes: 列的股票代码及顺序，默认为区间内有数据的全部股票（按代码排序）
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            cache_dir: 传入时面板写入该目录并以内存映射方式返回，之后可用 Panel.load 直接打开
+        
+        Returns:
+            Panel: values 为 float64 二维数组，缺失为 NaN
+        """
+        return self._load_panel('daily_quotes', self.VALUE_COLUMNS, field, ts_codes, start, end, cache_dir)
+    
     def find_by_date(self, trade_date: date) -> List[DailyQuote]:
         """
         查询指定日期的所有股票行情数据
@@ -146,7 +181,7 @@ class DailyQuoteRepository:
         Returns:
             DailyQuote对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM daily_quotes WHERE trade_date = ? ORDER BY ts_code',
@@ -154,6 +189,43 @@ class DailyQuoteRepository:
             )
             return [self._row_to_quote(row) for row in cursor.fetchall()]
     
+    def find_latest_trade_date(self) -> Optional[date]:
+        """
+        查询已保存行情数据中最新的交易日期
+        
+        Returns:
+            最新交易日期，如果没有任何数据返回None
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT MAX(trade_date) FROM daily_quotes')
+            row = cursor.fetchone()
+            return datetime.fromisoformat(row[0]).date() if row and row[0] else None
+    
+    def find_latest_trade_dates(self) -> Dict[str, date]:
+        """
+        查询每只股票已保存行情数据的最新交易日期
+        
+        Returns:
+            股票代码 -> 最新交易日期
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT ts_code, MAX(trade_date) FROM daily_quotes GROUP BY ts_code')
+            return {row[0]: datetime.fromisoformat(row[1]).date() for row in cursor.fetchall()}
+    
+    def find_ts_codes(self) -> Set[str]:
+        """
+        查询已有行情数据的股票代码集合
+        
+        Returns:
+            股票代码集合
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT DISTINCT ts_code FROM daily_quotes')
+            return {row[0] for row in cursor.fetchall()}
+    
     def _row_to_quote(self, row: tuple) -> DailyQuote:
         """将数据库行转换为DailyQuote对象"""
         return DailyQuote(
@@ -1,17 +1,31 @@
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 import tushare as ts
 import pandas as pd
 
 from ashare.models.tushare_api import TushareAPI
+from ashare.models.frame_converter import frame_to_models
+from ashare.models.async_tushare_api import AsyncTushareAPI
 from .dividend import Dividend
 import logging
 from ashare.logger.setup_logger import get_logger
 
+DIVIDEND_FIELDS = (
+    'ts_code,end_date,ann_date,div_proc,stk_div,stk_bo_rate,stk_co_rate,'
+    'cash_div,cash_div_tax,record_date,ex_date,pay_date,div_listdate,'
+    'imp_ann_date,base_date,base_share'
+)
+
 class DividendFetcher:
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, async_api: Optional[AsyncTushareAPI] = None):
+        """
+        Args:
+            api_token: Tushare API token
+            async_api: 异步方法使用的客户端，默认按 api_token 创建
+        """
         self.api = TushareAPI(api_token)
+        self.async_api = async_api or AsyncTushareAPI(api_token)
         self.logger = get_logger()
         self.logger.info("初始化 DividendFetcher")
 
@@ -38,33 +52,40 @@ class DividendFetcher:
         # 调用tushare API获取数据
         df = self.api.dividend(
             ts_code=ts_code,
-            fields='ts_code,end_date,ann_date,div_proc,stk_div,stk_bo_rate,stk_co_rate,'
-                  'cash_div,cash_div_tax,record_date,ex_date,pay_date,div_listdate,'
-                  'imp_ann_date,base_date,base_share'
+            fields=DIVIDEND_FIELDS
         )
         self.logger.info(f"获取 {ts_code} 的所有分红送股数据, df=\n{df}")
+        return self._to_dividends(df)
+
+    def fetch_dividends_by_date(self, ann_date: Optional[date] = None,
+                                ex_date: Optional[date] = None) -> List[Dividend]:
+        """
+        获取全市场在指定公告日或除权除息日的分红送股数据
         
-        # 转换为Dividend对象列表
-        dividends = []
-        for _, row in df.iterrows():
-            dividend = Dividend(
-                ts_code=row['ts_code'],
-                end_date=self._convert_date(row['end_date']),
-                ann_date=self._convert_date(row['ann_date']),
-                div_proc=row['div_proc'],
-                stk_div=self._convert_decimal(row['stk_div']),
-                stk_bo_rate=self._convert_decimal(row['stk_bo_rate']),
-                stk_co_rate=self._convert_decimal(row['stk_co_rate']),
-                cash_div=self._convert_decimal(row['cash_div']),
-                cash_div_tax=self._convert_decimal(row['cash_div_tax']),
-                record_date=self._convert_date(row['record_date']),
-                ex_date=self._convert_date(row['ex_date']),
-                pay_date=self._convert_date(row['pay_date']),
-                div_listdate=self._convert_date(row['div_listdate']),
-                imp_ann_date=self._convert_date(row['imp_ann_date']),
-                base_date=self._convert_date(row['base_date']),
-                base_share=self._convert_decimal(row['base_share'])
-            )
-            dividends.append(dividend)
+        Args:
+            ann_date: 公告日期
+            ex_date: 除权除息日
             
-        return dividends
\ No newline at end of file
+        Returns:
+            List[Dividend]: 分红送股数据列表
+        """
+        if ann_date is None and ex_date is None:
+            raise ValueError("ann_date 和 ex_date 至少指定一个")
+        params = {}
+        if ann_date:
+            params['ann_date'] = ann_date.strftime('%Y%m%d')
+        if ex_date:
+            params['ex_date'] = ex_date.strftime('%Y%m%d')
+        df = self.api.dividend(fields=DIVIDEND_FIELDS, **params)
+        self.logger.info(f"获取公告日 {ann_date} 除权除息日 {ex_date} 的全市场分红送股数据, 共 {len(df)} 条")
+        return self._to_dividends(df)
+
+    async def fetch_dividends_async(self, ts_code: str) -> List[Dividend]:
+        """fetch_dividends 的异步版本"""
+        df = await self.async_api.dividend(ts_code=ts_code, fields=DIVIDEND_FIELDS)
+        self.logger.info(f"获取 {ts_code} 的所有分红送股数据, 共 {len(df)} 条")
+        return self._to_dividends(df)
+
+    def _to_dividends(self, df: pd.DataFrame) -> List[Dividend]:
+        """将tushare返回的DataFrame转换为Dividend对象列表"""
+        return frame_to_models(df, Dividend)
@@ -3,109 +3,59 @@ from datetime import datetime, date
 from typing import List, Optional
 from .dividend import Dividend
 from decimal import Decimal
+from .sqlite_repository import SqliteRepository, UpsertResult
 
-class DividendRepository:
+class DividendRepository(SqliteRepository):
     """A股分红送股数据仓库"""
     
-    def __init__(self, db_path: str):
-        """
-        初始化数据仓库
-        
-        Args:
-            db_path: SQLite数据库文件路径
-        """
-        self.db_path = db_path
-        self._init_db()
-    
-    def _init_db(self):
-        """初始化数据库表结构"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS dividends (
-                    ts_code TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
-                    ann_date TEXT,
-                    div_proc TEXT,
-                    stk_div DECIMAL(20,4),
-                    stk_bo_rate DECIMAL(20,4),
-                    stk_co_rate DECIMAL(20,4),
-                    cash_div DECIMAL(20,4),
-                    cash_div_tax DECIMAL(20,4),
-                    record_date TEXT,
-                    ex_date TEXT,
-                    pay_date TEXT,
-                    div_listdate TEXT,
-                    imp_ann_date TEXT,
-                    base_date TEXT,
-                    base_share DECIMAL(20,4),
-                    PRIMARY KEY (ts_code, end_date)
-                )
-            ''')
-            # 创建索引以提升查询性能
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_dividends_ex_date ON dividends(ex_date)')
-            conn.commit()
+    # 按表中顺序排列的字段
+    COLUMNS = (
+        'ts_code', 'end_date', 'ann_date', 'div_proc', 'stk_div', 'stk_bo_rate', 'stk_co_rate',
+        'cash_div', 'cash_div_tax', 'record_date', 'ex_date', 'pay_date', 'div_listdate',
+        'imp_ann_date', 'base_date', 'base_share'
+    )
     
     def _convert_float(self, value) -> Optional[float]:
         """将值转换为float类型，如果值为None则返回None"""
         return float(value) if value is not None else None
     
+    def _to_row(self, dividend: Dividend) -> tuple:
+        """将Dividend对象转换为数据库行"""
+        return (
+            dividend.ts_code,
+            dividend.end_date.isoformat() if dividend.end_date else None,
+            dividend.ann_date.isoformat() if dividend.ann_date else None,
+            dividend.div_proc,
+            self._convert_float(dividend.stk_div),
+            self._convert_float(dividend.stk_bo_rate),
+            self._convert_float(dividend.stk_co_rate),
+            self._convert_float(dividend.cash_div),
+            self._convert_float(dividend.cash_div_tax),
+            dividend.record_date.isoformat() if dividend.record_date else None,
+            dividend.ex_date.isoformat() if dividend.ex_date else None,
+            dividend.pay_date.isoformat() if dividend.pay_date else None,
+            dividend.div_listdate.isoformat() if dividend.div_listdate else None,
+            dividend.imp_ann_date.isoformat() if dividend.imp_ann_date else None,
+            dividend.base_date.isoformat() if dividend.base_date else None,
+            self._convert_float(dividend.base_share)
+        )
+    
     def save(self, dividend: Dividend) -> None:
         """保存分红送股数据"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO dividends VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-            ''', (
-                dividend.ts_code,
-                dividend.end_date.isoformat() if dividend.end_date else None,
-                dividend.ann_date.isoformat() if dividend.ann_date else None,
-                dividend.div_proc,
-                self._convert_float(dividend.stk_div),
-                self._convert_float(dividend.stk_bo_rate),
-                self._convert_float(dividend.stk_co_rate),
-                self._convert_float(dividend.cash_div),
-                self._convert_float(dividend.cash_div_tax),
-                dividend.record_date.isoformat() if dividend.record_date else None,
-                dividend.ex_date.isoformat() if dividend.ex_date else None,
-                dividend.pay_date.isoformat() if dividend.pay_date else None,
-                dividend.div_listdate.isoformat() if dividend.div_listdate else None,
-                dividend.imp_ann_date.isoformat() if dividend.imp_ann_date else None,
-                dividend.base_date.isoformat() if dividend.base_date else None,
-                self._convert_float(dividend.base_share)
-            ))
+        self.save_many([dividend])
     
-    def save_many(self, dividends: List[Dividend]) -> None:
-        """批量保存分红送股数据"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.executemany('''
-                INSERT OR REPLACE INTO dividends VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-            ''', [
-                (
-                    div.ts_code,
-                    div.end_date.isoformat() if div.end_date else None,
-                    div.ann_date.isoformat() if div.ann_date else None,
-                    div.div_proc,
-                    self._convert_float(div.stk_div),
-                    self._convert_float(div.stk_bo_rate),
-                    self._convert_float(div.stk_co_rate),
-                    self._convert_float(div.cash_div),
-                    self._convert_float(div.cash_div_tax),
-                    div.record_date.isoformat() if div.record_date else None,
-                    div.ex_date.isoformat() if div.ex_date else None,
-                    div.pay_date.isoformat() if div.pay_date else None,
-                    div.div_listdate.isoformat() if div.div_listdate else None,
-                    div.imp_ann_date.isoformat() if div.imp_ann_date else None,
-                    div.base_date.isoformat() if div.base_date else None,
-                    self._convert_float(div.base_share)
-                )
-                for div in dividends
-            ])
+    def save_many(self, dividends: List[Dividend]) -> UpsertResult:
+        """
+        批量保存分红送股数据，内容未变化的记录不重写
+        
+        同一 (ts_code, end_date) 出现多次时以最后一条为准。
+        
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        with self._connect() as conn:
+            return self._upsert(conn, 'dividends', self.COLUMNS, ('ts_code', 'end_date'),
+                                [self._to_row(div) for div in dividends])
     
     def find_by_code_and_end_date(self, ts_code: str, end_date: date) -> Optional[Dividend]:
         """
@@ -118,7 +68,7 @@ class DividendRepository:
         Returns:
             Dividend对象，如果未找到返回None
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM dividends WHERE ts_code = ? AND end_date = ?',
@@ -137,7 +87,7 @@ class DividendRepository:
         Returns:
             Dividend对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM dividends WHERE ts_code = ? ORDER BY end_date DESC',
@@ -155,7 +105,7 @@ class DividendRepository:
         Returns:
             Dividend对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 'SELECT * FROM dividends WHERE ex_date = ? ORDER BY ts_code',
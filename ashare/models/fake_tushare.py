@@ -0,0 +1,438 @@
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import date, timedelta
+from functools import partial
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from ashare.models.response_cache import ResponseCache, CacheMissError
+from ashare.models.stock_fetchers import STOCK_FIELDS
+from ashare.models.daily_indicator_fetcher import DAILY_INDICATOR_FIELDS
+from ashare.models.dividend_fetcher import DIVIDEND_FIELDS
+from ashare.models.trade_calendar_fetcher import TRADE_CAL_FIELDS
+from ashare.models.adj_factor_fetcher import ADJ_FACTOR_FIELDS
+from ashare.models.financial_report_fetcher import (
+    INCOME_FIELDS, BALANCE_SHEET_FIELDS, CASH_FLOW_FIELDS, FINANCIAL_INDICATOR_FIELDS
+)
+
+DAILY_FIELDS = 'ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount'
+
+# 未传 fields 参数时各接口返回的字段
+DEFAULT_FIELDS = {
+    'stock_basic': STOCK_FIELDS,
+    'trade_cal': TRADE_CAL_FIELDS,
+    'daily': DAILY_FIELDS,
+    'daily_basic': DAILY_INDICATOR_FIELDS,
+    'adj_factor': ADJ_FACTOR_FIELDS,
+    'dividend': DIVIDEND_FIELDS,
+    'income': INCOME_FIELDS,
+    'balancesheet': BALANCE_SHEET_FIELDS,
+    'cashflow': CASH_FLOW_FIELDS,
+    'fina_indicator': FINANCIAL_INDICATOR_FIELDS,
+    'income_vip': INCOME_FIELDS,
+    'balancesheet_vip': BALANCE_SHEET_FIELDS,
+    'cashflow_vip': CASH_FLOW_FIELDS,
+    'fina_indicator_vip': FINANCIAL_INDICATOR_FIELDS,
+}
+
+RATE_LIMIT_MESSAGE = '抱歉，您每分钟最多访问该接口500次，权限的具体详情访问：https://tushare.pro/document/1?doc_id=108。'
+
+class FakeProApi:
+    """
+    离线的 Tushare pro_api 替身
+
+    按 ``fields`` 参数生成列，返回确定性的合成数据（同样的种子和参数总是得到同样的结果），
+    也可以从 ResponseCache 录制的真实响应中回放。支持注入延迟和错误，
+    通过 ``TushareAPI.use_backend`` 接入后，fetcher 和同步任务无需 token 即可端到端运行。
+    """
+
+    def __init__(self, num_stocks: int = 100,
+                 start_date: Optional[date] = None,
+                 end_date: Optional[date] = None,
+                 seed: int = 0,
+                 latency: float = 0.0,
+                 latencies: Optional[Dict[str, float]] = None,
+                 error_rate: float = 0.0,
+                 error_rates: Optional[Dict[str, float]] = None,
+                 error_message: str = RATE_LIMIT_MESSAGE,
+                 recordings: Optional[ResponseCache] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            num_stocks: 合成的股票数量
+            start_date: 合成数据的起始日期，默认一年前，也是所有股票的上市日期
+            end_date: 合成数据的截止日期，默认今天
+            seed: 随机种子
+            latency: 每次调用的模拟延迟(秒)
+            latencies: 接口名 -> 模拟延迟(秒)，覆盖 latency
+            error_rate: 每次调用失败的概率
+            error_rates: 接口名 -> 失败概率，覆盖 error_rate
+            error_message: 注入错误的异常信息，默认模拟限流错误
+            recordings: 录制的响应，命中时优先返回录制的数据
+            sleep: 等待函数，便于测试时替换
+        """
+        self.end_date = end_date or date.today()
+        self.start_date = start_date or self.end_date - timedelta(days=365)
+        self.seed = seed
+        self.latency = latency
+        self.latencies = dict(latencies or {})
+        self.error_rate = error_rate
+        self.error_rates = dict(error_rates or {})
+        self.error_message = error_message
+        self.recordings = recordings
+        self._sleep = sleep
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._series: Dict[tuple, pd.DataFrame] = {}
+        self.calls: Counter = Counter()
+        self.trade_dates = np.array([d.strftime('%Y%m%d') for d in pd.bdate_range(self.start_date, self.end_date)])
+        self.ts_codes = [
+            f"{i + 1:06d}.SZ" if i % 2 == 0 else f"{600000 + i:06d}.SH"
+            for i in range(num_stocks)
+        ]
+        self._handlers = {
+            'stock_basic': self._stock_basic,
+            'trade_cal': self._trade_cal,
+            'daily': partial(self._time_series, self._daily_series),
+            'daily_basic': partial(self._time_series, self._daily_basic_series),
+            'adj_factor': partial(self._time_series, self._adj_factor_series),
+            'dividend': self._dividend,
+            'income': partial(self._statement, 'income', 1e8),
+            'balancesheet': partial(self._statement, 'balancesheet', 1e9),
+            'cashflow': partial(self._statement, 'cashflow', 1e8),
+            'fina_indicator': partial(self._statement, 'fina_indicator', 10),
+        }
+        # *_vip 接口按报告期返回全市场数据，数据与单只股票的接口一致
+        for api_name in ('income', 'balancesheet', 'cashflow', 'fina_indicator'):
+            self._handlers[f"{api_name}_vip"] = self._handlers[api_name]
+
+    def __getattr__(self, name: str) -> Callable[..., pd.DataFrame]:
+        """与 pro_api 一致，按属性调用接口"""
+        if name.startswith('_') or name not in self._handlers:
+            raise AttributeError(name)
+        return partial(self.query, name)
+
+    def query(self, api_name: str, fields: str = '', **params) -> pd.DataFrame:
+        """
+        调用指定接口
+
+        Args:
+            api_name: 接口名
+            fields: 返回字段，逗号分隔，为空时返回接口的默认字段
+            **params: 接口参数
+
+        Returns:
+            接口返回的数据
+
+        Raises:
+            Exception: 按 error_rate 注入的错误
+        """
+        with self._lock:
+            self.calls[api_name] += 1
+            failed = self._random.random() < self.error_rates.get(api_name, self.error_rate)
+        delay = self.latencies.get(api_name, self.latency)
+        if delay > 0:
+            self._sleep(delay)
+        if failed:
+            raise Exception(self.error_message)
+        if self.recordings is not None:
+            try:
+                df = self.recordings.get(api_name, dict(params, fields=fields))
+            except CacheMissError:
+                df = None
+            if df is not None:
+                return df
+        columns = [name.strip() for name in (fields or DEFAULT_FIELDS[api_name]).split(',') if name.strip()]
+        return self._handlers[api_name](columns, params)
+
+    def _rng(self, *keys: str) -> np.random.Generator:
+        """按种子和键生成确定性的随机数生成器，与调用顺序和线程无关"""
+        return np.random.default_rng([self.seed] + [zlib.crc32(key.encode('utf-8')) for key in keys])
+
+    def _codes(self, params: dict) -> List[str]:
+        ts_code = params.get('ts_code')
+        if not ts_code:
+            return self.ts_codes
+        known = set(self.ts_codes)
+        return [code.strip() for code in ts_code.split(',') if code.strip() in known]
+
+    def _build(self, columns: List[str], known: Dict[str, object], size: int,
+               rng: np.random.Generator, scale: float) -> pd.DataFrame:
+        """按请求的字段组装 DataFrame，未知字段填充随机数值"""
+        data = {}
+        for column in columns:
+            if column in known:
+                data[column] = known[column]
+            else:
+                data[column] = np.round(rng.uniform(0, scale, size), 4)
+        return pd.DataFrame(data, columns=columns)
+
+    def _cached(self, key: tuple, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        with self._lock:
+            df = self._series.get(key)
+        if df is None:
+            df = build()
+            with self._lock:
+                self._series[key] = df
+        return df
+
+    def _stock_basic(self, columns: List[str], params: dict) -> pd.DataFrame:
+        codes = self._codes(params)
+        size = len(codes)
+        known = {
+            'ts_code': codes,
+            'symbol': [code.split('.')[0] for code in codes],
+            'name': [f"股票{code.split('.')[0]}" for code in codes],
+            'area': ['深圳' if code.endswith('.SZ') else '上海' for code in codes],
+            'industry': ['银行'] * size,
+            'fullname': [f"股票{code.split('.')[0]}股份有限公司" for code in codes],
+            'enname': [f"Stock {code.split('.')[0]} Co., Ltd." for code in codes],
+            'cnspell': ['gp'] * size,
+            'market': ['主板'] * size,
+            'exchange': ['SZSE' if code.endswith('.SZ') else 'SSE' for code in codes],
+            'curr_type': ['CNY'] * size,
+            'list_status': ['L'] * size,
+            'list_date': [self.start_date.strftime('%Y%m%d')] * size,
+            'delist_date': [None] * size,
+            'is_hs': ['N'] * size,
+            'act_name': [None] * size,
+            'act_ent_type': [None] * size,
+        }
+        return self._build(columns, known, size, self._rng('stock_basic'), 1)
+
+    def _trade_cal(self, columns: List[str], params: dict) -> pd.DataFrame:
+        """交易日历，工作日为交易日（与合成行情的交易日一致），与 Tushare 一样按日期倒序返回"""
+        start = pd.Timestamp(params.get('start_date') or self.start_date)
+        end = pd.Timestamp(params.get('end_date') or self.end_date)
+        days = pd.date_range(start, end, freq='D')
+        is_open = days.dayofweek < 5
+        cal_dates = np.array(days.strftime('%Y%m%d'))
+        # 每一天之前最近的交易日
+        open_dates = pd.Series(np.where(is_open, cal_dates, None)).ffill().shift(1)
+        df = pd.DataFrame({
+            'exchange': params.get('exchange') or 'SSE',
+            'cal_date': cal_dates,
+            'is_open': is_open.astype(int),
+            'pretrade_date': open_dates.to_numpy(),
+        })
+        return df.iloc[::-1].reset_index(drop=True).reindex(columns=columns)
+
+    def _daily_series(self, ts_code: str) -> pd.DataFrame:
+        """单只股票全部交易日的行情，收盘价为随机游走"""
+        def build() -> pd.DataFrame:
+            rng = self._rng('daily', ts_code)
+            size = len(self.trade_dates)
+            base = rng.uniform(5, 50)
+            close = np.round(base * np.cumprod(1 + np.clip(rng.normal(0, 0.02, size), -0.1, 0.1)), 2)
+            pre_close = np.concatenate([[round(base, 2)], close[:-1]])
+            open_ = np.round(pre_close * (1 + rng.normal(0, 0.01, size)), 2)
+            high = np.round(np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, size))), 2)
+            low = np.round(np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, size))), 2)
+            vol = np.round(rng.uniform(1e4, 1e6, size), 2)
+            return pd.DataFrame({
+                'ts_code': ts_code,
+                'trade_date': self.trade_dates,
+                'open': open_,
+                'high': high,
+                'low': low,
+                'close': close,
+                'pre_close': pre_close,
+                'change': np.round(close - pre_close, 2),
+                'pct_chg': np.round((close - pre_close) / pre_close * 100, 4),
+                'vol': vol,
+                'amount': np.round(vol * close / 10, 3),
+            })
+        return self._cached(('daily', ts_code), build)
+
+    def _daily_basic_series(self, ts_code: str) -> pd.DataFrame:
+        """单只股票全部交易日的每日指标，收盘价与行情一致"""
+        def build() -> pd.DataFrame:
+            rng = self._rng('daily_basic', ts_code)
+            quotes = self._daily_series(ts_code)
+            size = len(quotes)
+            total_share = round(rng.uniform(1e4, 1e6), 4)
+            float_share = round(total_share * rng.uniform(0.5, 1), 4)
+            close = quotes['close'].to_numpy()
+            return pd.DataFrame({
+                'ts_code': ts_code,
+                'trade_date': self.trade_dates,
+                'close': close,
+                'turnover_rate': np.round(rng.uniform(0, 10, size), 4),
+                'turnover_rate_f': np.round(rng.uniform(0, 10, size), 4),
+                'volume_ratio': np.round(rng.uniform(0.5, 2, size), 2),
+                'pe': np.round(rng.uniform(5, 50, size), 4),
+                'pe_ttm': np.round(rng.uniform(5, 50, size), 4),
+                'pb': np.round(rng.uniform(0.5, 10, size), 4),
+                'ps': np.round(rng.uniform(0.5, 10, size), 4),
+                'ps_ttm': np.round(rng.uniform(0.5, 10, size), 4),
+                'dv_ratio': np.round(rng.uniform(0, 5, size), 4),
+                'dv_ttm': np.round(rng.uniform(0, 5, size), 4),
+                'total_share': total_share,
+                'float_share': float_share,
+                'free_share': float_share,
+                'total_mv': np.round(close * total_share, 4),
+                'circ_mv': np.round(close * float_share, 4),
+            })
+        return self._cached(('daily_basic', ts_code), build)
+
+    def _adj_factor_series(self, ts_code: str) -> pd.DataFrame:
+        """单只股票全部交易日的复权因子，平均每年除权四五次，每次因子上调"""
+        def build() -> pd.DataFrame:
+            rng = self._rng('adj_factor', ts_code)
+            size = len(self.trade_dates)
+            steps = np.where(rng.random(size) < 0.02, rng.uniform(1.01, 1.3, size), 1.0)
+            return pd.DataFrame({
+                'ts_code': ts_code,
+                'trade_date': self.trade_dates,
+                'adj_factor': np.round(rng.uniform(1, 5) * np.cumprod(steps), 3),
+            })
+        return self._cached(('adj_factor', ts_code), build)
+
+    def _time_series(self, series: Callable[[str], pd.DataFrame],
+                     columns: List[str], params: dict) -> pd.DataFrame:
+        """按 ts_code、trade_date 或 start_date/end_date 选取行，与 Tushare 一样按日期倒序返回"""
+        codes = self._codes(params)
+        trade_date = params.get('trade_date')
+        if trade_date:
+            pos = np.searchsorted(self.trade_dates, trade_date)
+            if pos >= len(self.trade_dates) or self.trade_dates[pos] != trade_date:
+                return pd.DataFrame(columns=columns)
+            df = pd.concat([series(code).iloc[pos:pos + 1] for code in codes], ignore_index=True)
+        else:
+            start = np.searchsorted(self.trade_dates, params.get('start_date') or '', side='left')
+            end = np.searchsorted(self.trade_dates, params.get('end_date') or '99999999', side='right')
+            frames = [series(code).iloc[start:end].iloc[::-1] for code in codes]
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        return df.reindex(columns=columns)
+
+    def _years(self) -> range:
+        return range(self.start_date.year - 1, self.end_date.year + 1)
+
+    def _dividend_series(self, ts_code: str) -> pd.DataFrame:
+        """单只股票每年一次的年度分红，只包含截止日期前已公告的记录"""
+        def build() -> pd.DataFrame:
+            rng = self._rng('dividend', ts_code)
+            rows = []
+            for year in self._years():
+                ann_date = f"{year + 1}0420"
+                if ann_date > self.end_date.strftime('%Y%m%d'):
+                    continue
+                rows.append({
+                    'ts_code': ts_code,
+                    'end_date': f"{year}1231",
+                    'ann_date': ann_date,
+                    'div_proc': '实施',
+                    'stk_div': 0.0,
+                    'stk_bo_rate': None,
+                    'stk_co_rate': None,
+                    'cash_div': round(rng.uniform(0.05, 1), 4),
+                    'cash_div_tax': round(rng.uniform(0.05, 1), 4),
+                    'record_date': f"{year + 1}0610",
+                    'ex_date': f"{year + 1}0611",
+                    'pay_date': f"{year + 1}0611",
+                    'div_listdate': None,
+                    'imp_ann_date': f"{year + 1}0601",
+                    'base_date': f"{year}1231",
+                    'base_share': round(rng.uniform(1e4, 1e6), 4),
+                })
+            return pd.DataFrame(rows, columns=DIVIDEND_FIELDS.split(','))
+        return self._cached(('dividend', ts_code), build)
+
+    def _dividend(self, columns: List[str], params: dict) -> pd.DataFrame:
+        """按 ts_code 以及 ann_date/record_date/ex_date/imp_ann_date 过滤分红记录"""
+        frames = [self._dividend_series(code) for code in self._codes(params)]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        for column in ('ann_date', 'record_date', 'ex_date', 'imp_ann_date'):
+            if params.get(column):
+                df = df[df[column] == params[column]]
+        return df.reindex(columns=columns).reset_index(drop=True)
+
+    def _periods(self) -> List[tuple]:
+        """报告期及其公告日期：一季报和三季报在季末后一个月，半年报在8月底，年报在次年4月底"""
+        announce = {'0331': '0430', '0630': '0830', '0930': '1030', '1231': '0430'}
+        periods = []
+        for year in self._years():
+            for quarter, month_day in enumerate(('0331', '0630', '0930', '1231'), start=1):
+                ann_year = year + 1 if month_day == '1231' else year
+                periods.append((f"{year}{month_day}", f"{ann_year}{announce[month_day]}", str(quarter)))
+        end = self.end_date.strftime('%Y%m%d')
+        return [period for period in periods if period[1] <= end]
+
+    def _statement_series(self, api_name: str, scale: float, ts_code: str, columns: List[str]) -> pd.DataFrame:
+        """单只股票全部已公告报告期的报表，数据只与股票和报告期有关，与查询区间无关"""
+        def build() -> pd.DataFrame:
+            periods = self._periods()
+            size = len(periods)
+            known = {
+                'ts_code': [ts_code] * size,
+                'ann_date': [period[1] for period in periods],
+                'f_ann_date': [period[1] for period in periods],
+                'end_date': [period[0] for period in periods],
+                'report_type': ['1'] * size,
+                'comp_type': ['1'] * size,
+                'end_type': [period[2] for period in periods],
+                'update_flag': ['1'] * size,
+            }
+            return self._build(columns, known, size, self._rng(api_name, ts_code), scale)
+        return self._cached((api_name, ts_code, tuple(columns)), build)
+
+    def _statement(self, api_name: str, scale: float, columns: List[str], params: dict) -> pd.DataFrame:
+        """财务报表类接口：按 ts_code 和报告期 period 过滤，start_date/end_date 按公告日期过滤"""
+        frames = []
+        for code in self._codes(params):
+            df = self._statement_series(api_name, scale, code, columns)
+            periods = pd.DataFrame({
+                'end_date': [period[0] for period in self._periods()],
+                'ann_date': [period[1] for period in self._periods()],
+            })
+            mask = np.ones(len(periods), dtype=bool)
+            if params.get('period'):
+                mask &= (periods['end_date'] == params['period']).to_numpy()
+            if params.get('start_date'):
+                mask &= (periods['ann_date'] >= params['start_date']).to_numpy()
+            if params.get('end_date'):
+                mask &= (periods['ann_date'] <= params['end_date']).to_numpy()
+            frames.append(df[mask].iloc[::-1])
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
+
+def create_fake_server_app(backend: FakeProApi):
+    """
+    创建按 Tushare HTTP 协议提供 FakeProApi 数据的 aiohttp 应用，供 AsyncTushareAPI 离线使用
+
+    请求 ``POST /{api_name}``，请求体为 ``{api_name, token, params, fields}``，
+    后端抛出的异常以 ``code != 0`` 的响应返回。
+
+    Args:
+        backend: 提供数据的 FakeProApi
+
+    Returns:
+        aiohttp.web.Application
+    """
+    import asyncio
+    from aiohttp import web
+
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        api_name = request.match_info['api_name']
+        loop = asyncio.get_running_loop()
+        try:
+            # 模拟延迟使用阻塞等待，放到线程池中执行以免阻塞事件循环
+            df = await loop.run_in_executor(
+                None, partial(backend.query, api_name, payload.get('fields', ''), **payload.get('params', {})))
+        except Exception as e:
+            return web.json_response({'code': 40203, 'msg': str(e), 'data': None})
+        df = df.astype(object).where(df.notna(), None)
+        return web.json_response({
+            'code': 0,
+            'msg': '',
+            'data': {'fields': list(df.columns), 'items': df.values.tolist()}
+        })
+
+    app = web.Application()
+    app.router.add_post('/{api_name}', handle)
+    return app
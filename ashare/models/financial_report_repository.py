@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import date
 from .financial_report import (
     FinancialReport,
@@ -8,63 +8,32 @@ from .financial_report import (
     CashFlowStatement,
     FinancialIndicators
 )
+from .sqlite_repository import SqliteRepository, UpsertResult
 
-class FinancialReportRepository:
+class FinancialReportRepository(SqliteRepository):
     """财务报告仓库类"""
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-        self._init_db()
     
-    def _init_db(self):
-        """初始化数据库表"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS financial_reports (
-                    ts_code TEXT NOT NULL,
-                    report_date DATE NOT NULL,
-                    ann_date DATE,
-                    report_type TEXT NOT NULL,
-                    end_type TEXT NOT NULL,
-                    income_statement TEXT,
-                    balance_sheet TEXT,
-                    cash_flow_statement TEXT,
-                    financial_indicators TEXT,
-                    PRIMARY KEY (ts_code, report_date, report_type)
-                )
-            ''')
+    KEY_COLUMNS = ('ts_code', 'report_date', 'report_type')
+    COLUMNS = (
+        'ts_code', 'report_date', 'ann_date', 'report_type', 'end_type',
+        'income_statement', 'balance_sheet', 'cash_flow_statement', 'financial_indicators'
+    )
+    STATEMENT_COLUMNS = COLUMNS[5:]
 
     def save(self, report: FinancialReport) -> None:
-        """保存财务报告"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO financial_reports (
-                    ts_code, report_date, ann_date, report_type, end_type,
-                    income_statement, balance_sheet,
-                    cash_flow_statement, financial_indicators
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                report.ts_code,
-                report.report_date.isoformat(),
-                report.ann_date.isoformat() if report.ann_date else None,
-                report.report_type,
-                report.end_type,
-                report.income_statement.to_json() if report.income_statement else None,
-                report.balance_sheet.to_json() if report.balance_sheet else None,
-                report.cash_flow_statement.to_json() if report.cash_flow_statement else None,
-                report.financial_indicators.to_json() if report.financial_indicators else None
-            ))
+        """保存财务报告，见 save_many"""
+        self.save_many([report])
+
+    def save_many(self, reports: List[FinancialReport]) -> UpsertResult:
+        """
+        批量保存财务报告，内容未变化的记录不重写
 
-    def save_many(self, reports: List[FinancialReport]) -> None:
-        """批量保存财务报告"""
-        with sqlite3.connect(self.db_path) as conn:
-            for report in reports:
-                conn.execute('''
-                    INSERT OR REPLACE INTO financial_reports (
-                        ts_code, report_date, ann_date, report_type, end_type,
-                        income_statement, balance_sheet,
-                        cash_flow_statement, financial_indicators
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+        报表为 None 的列不覆盖已保存的报表：按公告日期增量同步时，更正公告可能只带一张报表
+        （如只更正资产负债表），其余报表保留原值。
+        """
+        with self._connect() as conn:
+            return self._upsert(conn, 'financial_reports', self.COLUMNS, self.KEY_COLUMNS, [
+                (
                     report.ts_code,
                     report.report_date.isoformat(),
                     report.ann_date.isoformat() if report.ann_date else None,
@@ -74,12 +43,13 @@ class FinancialReportRepository:
                     report.balance_sheet.to_json() if report.balance_sheet else None,
                     report.cash_flow_statement.to_json() if report.cash_flow_statement else None,
                     report.financial_indicators.to_json() if report.financial_indicators else None
-                ))
-            conn.commit()
+                )
+                for report in reports
+            ], merge_columns=self.STATEMENT_COLUMNS)
 
     def get(self, ts_code: str, report_date: date, report_type: str) -> Optional[FinancialReport]:
         """获取财务报告"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute('''
                 SELECT ts_code, report_date, ann_date, report_type, end_type,
                        income_statement, balance_sheet, cash_flow_statement, 
@@ -106,7 +76,7 @@ class FinancialReportRepository:
     
     def get_all(self, ts_code: str) -> List[FinancialReport]:
         """获取指定股票代码的所有财务报告"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute('''
                 SELECT ts_code, report_date, ann_date, report_type, end_type,
                        income_statement, balance_sheet, cash_flow_statement, 
@@ -128,9 +98,24 @@ class FinancialReportRepository:
                 for row in cursor.fetchall()
             ]
     
+    def find_report_dates(self) -> Set[date]:
+        """获取已保存财务报告的所有报告期"""
+        with self._connect() as conn:
+            cursor = conn.execute('SELECT DISTINCT report_date FROM financial_reports')
+            return {date.fromisoformat(row[0]) for row in cursor.fetchall()}
+
+    def find_latest_ann_dates(self) -> Dict[str, date]:
+        """获取每只股票已保存财务报告的最新公告日期"""
+        with self._connect() as conn:
+            cursor = conn.execute('''
+                SELECT ts_code, MAX(ann_date) FROM financial_reports
+                WHERE ann_date IS NOT NULL
+                GROUP BY ts_code''')
+            return {row[0]: date.fromisoformat(row[1]) for row in cursor.fetchall()}
+
     def delete(self, ts_code: str, report_date: date, report_type: str) -> bool:
         """删除财务报告"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute('''
                 DELETE FROM financial_reports 
                 WHERE ts_code = ? AND report_date = ? AND report_type = ?
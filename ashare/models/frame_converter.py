@@ -0,0 +1,78 @@
+import dataclasses
+import typing
+from datetime import date
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Type, TypeVar
+import numpy as np
+import pandas as pd
+
+T = TypeVar('T')
+
+def to_dates(series: pd.Series) -> list:
+    """
+    将 YYYYMMDD 格式的日期列转换为 date 列表，空值和无法解析的值转换为 None
+
+    每个不同的日期只解析一次，全市场截面中同一交易日的数千行共用一次解析。
+    """
+    codes, uniques = pd.factorize(series.astype(str))
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format='%Y%m%d', errors='coerce')
+    # 末尾追加 None，factorize 对空值返回的 -1 正好取到它
+    values = np.array([ts.date() if not pd.isna(ts) else None for ts in parsed] + [None], dtype=object)
+    return values[codes].tolist()
+
+def to_decimals(series: pd.Series) -> list:
+    """将数值列转换为 Decimal 列表，空值转换为 None"""
+    return [Decimal(str(value)) if value is not None and value == value else None
+            for value in series.tolist()]
+
+def to_strs(series: pd.Series) -> list:
+    """将文本列转换为列表，空值转换为 None"""
+    return [value if value is not None and value == value else None for value in series.tolist()]
+
+def to_date_strs(series: pd.Series) -> list:
+    """将 YYYYMMDD 格式的日期列转换为数据库中保存的 ISO 日期字符串"""
+    return [value.isoformat() if value is not None else None for value in to_dates(series)]
+
+def to_floats(series: pd.Series) -> list:
+    """将数值列转换为 float 列表，空值转换为 None，供直接写入数据库"""
+    values = pd.to_numeric(series, errors='coerce').astype(float).to_numpy()
+    return np.where(np.isnan(values), None, values).tolist()
+
+_CONVERTERS_BY_TYPE: Dict[type, Callable[[pd.Series], list]] = {
+    date: to_dates,
+    Decimal: to_decimals,
+    str: to_strs,
+}
+
+def _field_type(hint) -> type:
+    """取出 Optional[X] 中的 X"""
+    args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+    return args[0] if typing.get_origin(hint) is typing.Union and len(args) == 1 else hint
+
+def frame_to_models(df: pd.DataFrame, model: Type[T],
+                    converters: Optional[Dict[str, Callable[[pd.Series], list]]] = None) -> List[T]:
+    """
+    按列将 tushare 返回的 DataFrame 转换为 dataclass 对象列表
+
+    按字段的类型注解整列转换（date 字段按 YYYYMMDD 解析，Decimal 字段转为 Decimal），
+    再按行组装对象，避免 iterrows 逐行构造 Series 的开销。DataFrame 中缺少的字段为 None。
+
+    Args:
+        df: tushare 返回的数据
+        model: dataclass 类型，字段名与 DataFrame 列名一致
+        converters: 字段名 -> 转换函数，覆盖按类型注解选择的转换函数
+
+    Returns:
+        model 对象列表
+    """
+    hints = typing.get_type_hints(model)
+    converters = converters or {}
+    size = len(df)
+    columns = []
+    for field in dataclasses.fields(model):
+        if field.name not in df.columns:
+            columns.append([None] * size)
+            continue
+        converter = converters.get(field.name) or _CONVERTERS_BY_TYPE.get(_field_type(hints[field.name]), to_strs)
+        columns.append(converter(df[field.name]))
+    return [model(*values) for values in zip(*columns)] if columns else []
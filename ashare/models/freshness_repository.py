@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from typing import Optional
+from .sqlite_repository import SqliteRepository
+
+class FreshnessRepository(SqliteRepository):
+    """查询各数据表中已有数据的最新日期"""
+
+    def find_latest_date(self, table: str, column: str) -> Optional[date]:
+        """
+        查询表中日期列的最大值
+
+        Args:
+            table: 表名
+            column: 保存 ISO 日期的列名
+
+        Returns:
+            最新日期，表不存在或没有数据时返回None
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute(f"SELECT MAX({column}) FROM {table}")
+            row = cursor.fetchone()
+            return datetime.fromisoformat(row[0]).date() if row and row[0] else None
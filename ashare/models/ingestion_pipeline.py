@@ -0,0 +1,131 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+from ashare.logger.setup_logger import get_logger
+
+T = TypeVar('T')
+
+class IngestionPipeline(Generic[T]):
+    """
+    并发拉取、单线程写入的数据导入流水线
+
+    多个拉取线程并发调用 fetch（调用仍受 TushareAPI 共享限流器约束），结果放入有界队列；
+    调用 run 的线程作为唯一的写入线程，从队列取出结果，累积到 batch_size 行后调用一次 save，
+    即一个大事务提交一批股票的数据。队列满时拉取线程阻塞，形成背压，内存占用有上限。
+    """
+
+    def __init__(self,
+                 fetch: Callable[[T], list],
+                 save: Callable[[list], None],
+                 concurrency: int = 4,
+                 queue_size: int = 16,
+                 batch_size: int = 5000,
+                 on_committed: Optional[Callable[[List[Tuple[T, list]]], None]] = None):
+        """
+        Args:
+            fetch: 拉取单个任务数据的函数，返回待写入的记录列表
+            save: 批量写入记录的函数，每次调用为一个事务
+            concurrency: 拉取线程数
+            queue_size: 已拉取待写入结果的队列长度上限
+            batch_size: 每次写入累积的最少记录数
+            on_committed: 每批写入完成后的回调，参数为本批 (任务, 记录列表)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency 必须大于等于1")
+        self.fetch = fetch
+        self.save = save
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.on_committed = on_committed
+        self.logger = get_logger()
+
+    def run(self, items: Iterable[T]) -> int:
+        """
+        执行流水线，任一任务拉取失败时停止，先写入已拉取的结果（包括仍在队列中的），再抛出该异常，
+        已提交的批次不会回滚
+
+        Args:
+            items: 任务列表，如股票列表
+
+        Returns:
+            写入的记录数
+        """
+        items = list(items)
+        results: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def worker(item: T):
+            if stop.is_set():
+                return
+            try:
+                results.put((item, self.fetch(item), None))
+            except Exception as e:
+                results.put((item, None, e))
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='ingest-fetch')
+        futures = [executor.submit(worker, item) for item in items]
+        pending: List[Tuple[T, list]] = []
+        pending_rows = 0
+        written = 0
+        error: Optional[Exception] = None
+        try:
+            for _ in range(len(items)):
+                item, rows, item_error = results.get()
+                if item_error is not None:
+                    self.logger.error(f"拉取 {item} 失败，停止流水线: {item_error}")
+                    error = item_error
+                    break
+                pending.append((item, rows))
+                pending_rows += len(rows)
+                if pending_rows >= self.batch_size:
+                    # 写入前先取出本批，写入失败时不会再次写入，也不会回调 on_committed
+                    batch, pending, pending_rows = pending, [], 0
+                    written += self._flush(batch)
+        finally:
+            fetched = self._shutdown(executor, futures, stop, results)
+        # 正常结束时队列已取空；拉取失败时一起写入已拉取的结果，重新执行时从检查点继续
+        batch, pending = pending + fetched, []
+        written += self._flush(batch)
+        if error is not None:
+            raise error
+        return written
+
+    @staticmethod
+    def _shutdown(executor: ThreadPoolExecutor, futures: list, stop: threading.Event,
+                  results: queue.Queue) -> List[Tuple[T, list]]:
+        """停止拉取线程并返回队列中剩余的拉取成功的结果"""
+        stop.set()
+        for future in futures:
+            future.cancel()
+        fetched = []
+
+        def take(block: bool) -> bool:
+            try:
+                item, rows, error = results.get(timeout=0.1) if block else results.get_nowait()
+            except queue.Empty:
+                return False
+            if error is None:
+                fetched.append((item, rows))
+            return True
+
+        # 继续取走队列中的结果，避免阻塞在 put 上的拉取线程无法退出
+        while not all(future.done() for future in futures):
+            take(block=True)
+        executor.shutdown(wait=True)
+        while take(block=False):
+            pass
+        return fetched
+
+    def _flush(self, pending: List[Tuple[T, list]]) -> int:
+        """将累积的结果作为一个批次写入，写入成功后才回调 on_committed"""
+        if not pending:
+            return 0
+        rows = [row for _, item_rows in pending for row in item_rows]
+        if rows:
+            self.save(rows)
+        if self.on_committed:
+            self.on_committed(pending)
+        self.logger.info(f"写入 {len(pending)} 个任务共 {len(rows)} 条记录")
+        return len(rows)
@@ -0,0 +1,126 @@
+import os
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+@dataclass
+class Panel:
+    """
+    一个字段在一段时间内的 交易日 × 股票 二维面板
+    """
+    field: str
+    trade_dates: np.ndarray     # int32，YYYYMMDD，升序
+    ts_codes: np.ndarray        # 股票代码，列的顺序
+    values: np.ndarray          # float64，形状为 (len(trade_dates), len(ts_codes))，缺失为 NaN
+
+    @property
+    def shape(self) -> tuple:
+        return self.values.shape
+
+    def column(self, ts_code: str) -> np.ndarray:
+        """单只股票按交易日排列的序列"""
+        matches = np.flatnonzero(self.ts_codes == ts_code)
+        if not len(matches):
+            raise KeyError(ts_code)
+        return self.values[:, matches[0]]
+
+    def row(self, trade_date: int) -> np.ndarray:
+        """单个交易日（YYYYMMDD）的全部股票截面"""
+        index = np.searchsorted(self.trade_dates, trade_date)
+        if index >= len(self.trade_dates) or self.trade_dates[index] != trade_date:
+            raise KeyError(trade_date)
+        return self.values[index]
+
+    @classmethod
+    def from_records(cls, field: str, codes: Iterable[np.ndarray], trade_dates: Iterable[np.ndarray],
+                     values: Iterable[np.ndarray], ts_codes: Optional[Sequence[str]] = None,
+                     cache_dir: Optional[str] = None) -> 'Panel':
+        """
+        由分块读取的 (股票代码, 交易日, 值) 记录构造面板
+
+        Args:
+            field: 字段名
+            codes: 各块的股票代码数组
+            trade_dates: 各块的 YYYYMMDD 整数日期数组
+            values: 各块的值数组
+            ts_codes: 列的股票代码及顺序，没有数据的股票整列为 NaN，其余股票的记录丢弃；
+                      为空时为有数据的全部股票，按代码排序
+            cache_dir: 传入时面板写入该目录并以内存映射方式返回，见 save
+
+        Returns:
+            Panel
+        """
+        code_ids, date_parts, value_parts = [], [], []
+        code_index = {code: i for i, code in enumerate(ts_codes)} if ts_codes is not None else {}
+        for chunk_codes, chunk_dates, chunk_values in zip(codes, trade_dates, values):
+            # 每块内先去重，只对不同的代码查表
+            local_ids, uniques = pd.factorize(np.asarray(chunk_codes, dtype=object))
+            if ts_codes is None:
+                mapping = np.array([code_index.setdefault(code, len(code_index)) for code in uniques], dtype=np.int64)
+            else:
+                mapping = np.array([code_index.get(code, -1) for code in uniques], dtype=np.int64)
+            code_ids.append(mapping[local_ids] if len(uniques) else np.empty(0, dtype=np.int64))
+            date_parts.append(np.asarray(chunk_dates, dtype=np.int32))
+            value_parts.append(np.asarray(chunk_values, dtype=np.float64))
+        code_ids = np.concatenate(code_ids) if code_ids else np.empty(0, dtype=np.int64)
+        dates = np.concatenate(date_parts) if date_parts else np.empty(0, dtype=np.int32)
+        data = np.concatenate(value_parts) if value_parts else np.empty(0, dtype=np.float64)
+        keep = code_ids >= 0
+        code_ids, dates, data = code_ids[keep], dates[keep], data[keep]
+
+        if ts_codes is None:
+            columns = np.array(sorted(code_index), dtype=str)
+            order = np.empty(len(code_index), dtype=np.int64)
+            order[[code_index[code] for code in columns]] = np.arange(len(columns))
+            code_ids = order[code_ids]
+        else:
+            columns = np.array(list(ts_codes), dtype=str)
+        trade_date_index = np.unique(dates).astype(np.int32)
+        shape = (len(trade_date_index), len(columns))
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            panel_values = np.lib.format.open_memmap(os.path.join(cache_dir, 'values.npy'), mode='w+',
+                                                     dtype=np.float64, shape=shape)
+            panel_values[:] = np.nan
+        else:
+            panel_values = np.full(shape, np.nan)
+        panel_values[np.searchsorted(trade_date_index, dates), code_ids] = data
+        panel = cls(field, trade_date_index, columns, panel_values)
+        if cache_dir is not None:
+            panel_values.flush()
+            panel._save_index(cache_dir)
+            return cls.load(cache_dir)
+        return panel
+
+    def _save_index(self, directory: str):
+        np.save(os.path.join(directory, 'trade_dates.npy'), self.trade_dates)
+        np.save(os.path.join(directory, 'ts_codes.npy'), self.ts_codes)
+        with open(os.path.join(directory, 'field'), 'w', encoding='utf-8') as f:
+            f.write(self.field)
+
+    def save(self, directory: str):
+        """
+        保存到目录：values.npy（可内存映射）、trade_dates.npy、ts_codes.npy 和字段名
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'values.npy'), self.values)
+        self._save_index(directory)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Optional[str] = 'r') -> 'Panel':
+        """
+        读取 save 保存的面板，默认以只读内存映射方式打开 values，只在访问时读取用到的页
+
+        Args:
+            directory: save 或 load_panel 的 cache_dir 保存的目录
+            mmap_mode: 传给 numpy.load，为None时整个读入内存
+        """
+        with open(os.path.join(directory, 'field'), encoding='utf-8') as f:
+            field = f.read()
+        return cls(
+            field=field,
+            trade_dates=np.load(os.path.join(directory, 'trade_dates.npy')),
+            ts_codes=np.load(os.path.join(directory, 'ts_codes.npy')),
+            values=np.load(os.path.join(directory, 'values.npy'), mmap_mode=mmap_mode)
+        )
@@ -0,0 +1,9 @@
+from .daily_indicator import DailyIndicator
+from .daily_indicator_repository import DailyIndicatorRepository
+from .parquet_repository import ParquetRepository
+
+class ParquetDailyIndicatorRepository(ParquetRepository):
+    """A股每日指标数据仓库（Parquet 按年分区存储），接口与 DailyIndicatorRepository 相同"""
+    dataset = 'daily_indicators'
+    model = DailyIndicator
+    VALUE_COLUMNS = DailyIndicatorRepository.VALUE_COLUMNS
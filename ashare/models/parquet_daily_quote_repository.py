@@ -0,0 +1,9 @@
+from .daily_quote import DailyQuote
+from .daily_quote_repository import DailyQuoteRepository
+from .parquet_repository import ParquetRepository
+
+class ParquetDailyQuoteRepository(ParquetRepository):
+    """A股日行情数据仓库（Parquet 按年分区存储），接口与 DailyQuoteRepository 相同"""
+    dataset = 'daily_quotes'
+    model = DailyQuote
+    VALUE_COLUMNS = DailyQuoteRepository.VALUE_COLUMNS
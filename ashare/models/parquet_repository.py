@@ -0,0 +1,346 @@
+import os
+import glob
+import threading
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from .sqlite_repository import UpsertResult
+from .panel import Panel
+
+class ParquetRepository:
+    """
+    按年分区的 Parquet 时间序列数据仓库基类
+
+    与对应的 SQLite 数据仓库接口相同（save_many、save_frame、find_by_code 等），数据保存在
+    <root>/<dataset>/year=YYYY/ 目录下：data.parquet 为按 (ts_code, trade_date) 排序的主文件，
+    append-*.parquet 为增量追加的文件。列式存储只读取用到的列，按年分区和行组统计信息跳过不相关的数据，
+    适合长区间、少数几列的全市场读取（见 read_frame）。
+
+    写入时，新数据都晚于分区中的最新交易日（按交易日增量同步）或者都是分区中没有的股票（新股回补）时直接写为追加文件；
+    否则读出整个分区按主键合并后重写，内容未变化的记录不计入写入。追加文件超过 MAX_APPEND_FILES 个时合并进主文件。
+    文件先写到临时文件再原子替换，写到一半中断不会留下损坏的分区。同一进程内对同一目录的写入串行执行，
+    多个进程同时写入由调用方（如同步锁）保证互斥。
+    """
+
+    # 子目录名，由子类指定
+    dataset: str = None
+    # 数据对象类型和数值字段，由子类指定
+    model = None
+    VALUE_COLUMNS: Sequence[str] = ()
+    KEY_COLUMNS = ('ts_code', 'trade_date')
+    # 每个分区中追加文件的数量上限
+    MAX_APPEND_FILES = 32
+    # 主文件的行组大小，行组按股票代码有序，按股票读取时可跳过其他行组
+    ROW_GROUP_SIZE = 65536
+    COMPRESSION = 'zstd'
+
+    _write_locks: Dict[str, threading.Lock] = {}
+    _write_locks_lock = threading.Lock()
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: 数据目录，各数据集保存在其下以 dataset 命名的子目录中
+        """
+        self.root = root
+        self.path = os.path.join(root, self.dataset)
+        self.columns = tuple(self.KEY_COLUMNS) + tuple(self.VALUE_COLUMNS)
+        self.schema = pa.schema([('ts_code', pa.string()), ('trade_date', pa.date32())] +
+                                [(name, pa.float64()) for name in self.VALUE_COLUMNS])
+        os.makedirs(self.path, exist_ok=True)
+        with self._write_locks_lock:
+            self._write_lock = self._write_locks.setdefault(os.path.abspath(self.path), threading.Lock())
+
+    def _partition_path(self, year: int) -> str:
+        return os.path.join(self.path, f"year={year}")
+
+    def _partition_files(self, year: int) -> List[str]:
+        """分区中的主文件和追加文件"""
+        partition = self._partition_path(year)
+        files = glob.glob(os.path.join(partition, 'append-*.parquet'))
+        base = os.path.join(partition, 'data.parquet')
+        return ([base] if os.path.exists(base) else []) + sorted(files)
+
+    def _years(self) -> List[int]:
+        """已有数据的年份，从小到大排列"""
+        years = []
+        for name in os.listdir(self.path):
+            if name.startswith('year=') and self._partition_files(int(name[5:])):
+                years.append(int(name[5:]))
+        return sorted(years)
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """转换为 ts_code、trade_date(datetime64) 和 float 数值列，同一批中主键重复时保留最后一条"""
+        result = pd.DataFrame({
+            'ts_code': df['ts_code'].astype(str).to_numpy(),
+            'trade_date': pd.to_datetime(df['trade_date']).to_numpy().astype('datetime64[ms]'),
+        })
+        for name in self.VALUE_COLUMNS:
+            result[name] = (pd.to_numeric(df[name], errors='coerce').astype(float).to_numpy()
+                            if name in df.columns else np.nan)
+        return result.drop_duplicates(list(self.KEY_COLUMNS), keep='last')
+
+    def _read_partition(self, year: int) -> pd.DataFrame:
+        table = pq.read_table(self._partition_files(year), schema=self.schema)
+        return table.to_pandas(date_as_object=False)
+
+    def _write_file(self, df: pd.DataFrame, path: str):
+        """按主键排序后写入临时文件，再原子替换目标文件"""
+        df = df.sort_values(list(self.KEY_COLUMNS))
+        table = pa.Table.from_pandas(df[list(self.columns)], schema=self.schema, preserve_index=False)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        pq.write_table(table, temp_path, compression=self.COMPRESSION, row_group_size=self.ROW_GROUP_SIZE)
+        os.replace(temp_path, path)
+
+    def _rewrite_partition(self, year: int, df: pd.DataFrame):
+        """把分区重写为只有一个主文件"""
+        old_files = self._partition_files(year)
+        base = os.path.join(self._partition_path(year), 'data.parquet')
+        self._write_file(df, base)
+        for path in old_files:
+            if path != base:
+                os.remove(path)
+
+    def _merge(self, existing: pd.DataFrame, incoming: pd.DataFrame) -> tuple:
+        """
+        按主键合并分区中已有的数据和新写入的数据
+
+        Returns:
+            (合并后的数据, UpsertResult)
+        """
+        keys = list(self.KEY_COLUMNS)
+        values = list(self.VALUE_COLUMNS)
+        old = existing.set_index(keys)
+        new = incoming.set_index(keys)
+        exists = new.index.isin(old.index)
+        old_values = old.loc[new.index[exists], values].to_numpy()
+        new_values = new.loc[exists, values].to_numpy()
+        same = ((old_values == new_values) | (np.isnan(old_values) & np.isnan(new_values))).all(axis=1)
+        result = UpsertResult(inserted=int((~exists).sum()), updated=int((~same).sum()), unchanged=int(same.sum()))
+        changed = new[~exists].index.append(new[exists][~same].index)
+        if len(changed) == 0:
+            return existing, result
+        merged = pd.concat([old[~old.index.isin(changed)], new.loc[changed]]).reset_index()
+        return merged, result
+
+    def _save(self, df: pd.DataFrame) -> UpsertResult:
+        """按年分区写入规范化后的数据"""
+        total = UpsertResult()
+        if df.empty:
+            return total
+        with self._write_lock:
+            for year, part in df.groupby(df['trade_date'].dt.year):
+                year = int(year)
+                files = self._partition_files(year)
+                if not files:
+                    os.makedirs(self._partition_path(year), exist_ok=True)
+                    self._write_file(part, os.path.join(self._partition_path(year), 'data.parquet'))
+                    total += UpsertResult(inserted=len(part))
+                    continue
+                if self._is_disjoint(files, part):
+                    self._write_file(part, os.path.join(
+                        self._partition_path(year), f"append-{uuid.uuid4().hex}.parquet"))
+                    total += UpsertResult(inserted=len(part))
+                    if len(files) > self.MAX_APPEND_FILES:
+                        self._rewrite_partition(year, self._read_partition(year))
+                    continue
+                merged, result = self._merge(self._read_partition(year), part)
+                if result.written:
+                    self._rewrite_partition(year, merged)
+                total += result
+        return total
+
+    def _is_disjoint(self, files: List[str], part: pd.DataFrame) -> bool:
+        """新数据是否都晚于分区中的最新交易日，或者都是分区中没有的股票，此时可以直接追加"""
+        keys = pq.read_table(files, columns=['ts_code', 'trade_date'], schema=self.schema)
+        latest = pc.max(keys['trade_date'])
+        if latest.is_valid and part['trade_date'].min() > pd.Timestamp(latest.as_py()):
+            return True
+        codes = pa.array(part['ts_code'].unique(), pa.string())
+        return not pc.any(pc.is_in(keys['ts_code'], value_set=codes)).as_py()
+
+    def compact(self):
+        """把每个分区的追加文件合并进主文件"""
+        with self._write_lock:
+            for year in self._years():
+                if len(self._partition_files(year)) > 1:
+                    self._rewrite_partition(year, self._read_partition(year))
+
+    def save(self, model) -> None:
+        """保存一条记录"""
+        self.save_many([model])
+
+    def save_many(self, models: List) -> UpsertResult:
+        """
+        批量保存数据对象，内容未变化的记录不重写
+
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        if not models:
+            return UpsertResult()
+        df = pd.DataFrame([[getattr(model, name) for name in self.columns] for model in models],
+                          columns=list(self.columns))
+        for name in self.VALUE_COLUMNS:
+            df[name] = [float(value) if value is not None else None for value in df[name]]
+        return self._save(self._normalize(df))
+
+    def save_frame(self, df: pd.DataFrame) -> UpsertResult:
+        """
+        批量保存 tushare 接口返回的原始数据，按列转换后直接写入，不构造数据对象
+
+        Args:
+            df: 包含 ts_code、trade_date(YYYYMMDD) 及各数值字段的 DataFrame
+
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        if df.empty:
+            return UpsertResult()
+        df = df.assign(trade_date=pd.to_datetime(df['trade_date'].astype(str), format='%Y%m%d'))
+        return self._save(self._normalize(df))
+
+    def _filter(self, ts_codes: Optional[Iterable[str]], start: Optional[date], end: Optional[date]):
+        """按股票代码和日期区间过滤的表达式，日期条件同时作用于分区列以跳过整个年份"""
+        conditions = []
+        if ts_codes is not None:
+            conditions.append(ds.field('ts_code').isin(list(ts_codes)))
+        if start is not None:
+            conditions.append(ds.field('year') >= start.year)
+            conditions.append(ds.field('trade_date') >= pa.scalar(start, pa.date32()))
+        if end is not None:
+            conditions.append(ds.field('year') <= end.year)
+            conditions.append(ds.field('trade_date') <= pa.scalar(end, pa.date32()))
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def read_table(self, columns: Optional[Sequence[str]] = None, ts_codes: Optional[Iterable[str]] = None,
+                   start: Optional[date] = None, end: Optional[date] = None) -> pa.Table:
+        """
+        读取部分列和部分数据，只读取 columns 中的列，过滤条件下推到文件扫描
+
+        Args:
+            columns: 要读取的列，默认全部
+            ts_codes: 只读取这些股票，默认全部
+            start: 起始交易日（含）
+            end: 截止交易日（含）
+
+        Returns:
+            pyarrow Table，行的顺序不固定
+        """
+        columns = list(columns or self.columns)
+        files = [path for year in self._years() for path in self._partition_files(year)]
+        if not files:
+            return self.schema.empty_table().select(columns)
+        dataset = ds.dataset(files, schema=self.schema.append(pa.field('year', pa.int32())), format='parquet',
+                             partitioning=ds.partitioning(pa.schema([('year', pa.int32())]), flavor='hive'),
+                             partition_base_dir=self.path)
+        return dataset.to_table(columns=columns, filter=self._filter(ts_codes, start, end))
+
+    def read_frame(self, columns: Optional[Sequence[str]] = None, ts_codes: Optional[Iterable[str]] = None,
+                   start: Optional[date] = None, end: Optional[date] = None) -> pd.DataFrame:
+        """
+        以 DataFrame 读取部分列和部分数据（参数同 read_table），trade_date 为 datetime64，
+        结果按 (ts_code, trade_date) 排序
+        """
+        df = self.read_table(columns, ts_codes, start, end).to_pandas(date_as_object=False)
+        sort_columns = [name for name in self.KEY_COLUMNS if name in df.columns]
+        return df.sort_values(sort_columns, ignore_index=True) if sort_columns else df
+
+    @staticmethod
+    def _date_ints(dates) -> np.ndarray:
+        """date32 日期转换为 YYYYMMDD 整数"""
+        ints = pc.add(pc.add(pc.multiply(pc.year(dates), 10000), pc.multiply(pc.month(dates), 100)), pc.day(dates))
+        return ints.to_numpy().astype(np.int32)
+
+    def find_by_code_arrays(self, ts_code: str, start: Optional[date] = None, end: Optional[date] = None,
+                            columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        按列读取单只股票的数据，返回 NumPy 数组而不是数据对象（与 SQLite 数据仓库的同名方法相同）
+
+        Returns:
+            列名 -> 按交易日升序排列的数组，trade_date 为 YYYYMMDD 的 int32，其余为 float64（空值为 NaN）
+
+        Raises:
+            ValueError: columns 中有不在 VALUE_COLUMNS 中的列
+        """
+        columns = list(self.VALUE_COLUMNS if columns is None else columns)
+        unknown = [column for column in columns if column not in self.VALUE_COLUMNS]
+        if unknown:
+            raise ValueError(f"未知的列: {unknown}，可选 {tuple(self.VALUE_COLUMNS)}")
+        table = self.read_table(['trade_date'] + columns, [ts_code], start, end).sort_by('trade_date')
+        trade_dates = table['trade_date']
+        result = {'trade_date': self._date_ints(trade_dates)}
+        for column in columns:
+            result[column] = table[column].to_numpy().astype(np.float64)
+        return result
+
+    def load_panel(self, field: str, ts_codes: Optional[Sequence[str]] = None, start: Optional[date] = None,
+                   end: Optional[date] = None, cache_dir: Optional[str] = None) -> Panel:
+        """
+        读取一个字段的 交易日 × 股票 面板（参数和返回值与 SQLite 数据仓库的同名方法相同），
+        只读取 ts_code、trade_date 和该字段三列，逐批转换
+
+        Raises:
+            ValueError: field 不在 VALUE_COLUMNS 中
+        """
+        if field not in self.VALUE_COLUMNS:
+            raise ValueError(f"未知的列: {field}，可选 {tuple(self.VALUE_COLUMNS)}")
+        table = self.read_table(['ts_code', 'trade_date', field], ts_codes, start, end)
+        batches = table.to_batches()
+        return Panel.from_records(
+            field,
+            (batch['ts_code'].to_numpy(zero_copy_only=False) for batch in batches),
+            (self._date_ints(batch['trade_date']) for batch in batches),
+            (batch[field].to_numpy(zero_copy_only=False) for batch in batches),
+            ts_codes, cache_dir)
+
+    def _to_models(self, table: pa.Table) -> List:
+        """按 (ts_code, trade_date) 排序后转换为数据对象"""
+        table = table.sort_by([(name, 'ascending') for name in self.KEY_COLUMNS])
+        columns = [table['ts_code'].to_pylist(), table['trade_date'].to_pylist()]
+        for name in self.VALUE_COLUMNS:
+            columns.append([Decimal(str(value)) if value is not None and value == value else None
+                            for value in table[name].to_pylist()])
+        return [self.model(*values) for values in zip(*columns)]
+
+    def find_by_code_and_date(self, ts_code: str, trade_date: date):
+        """查询指定股票在指定日期的数据，未找到返回None"""
+        models = self._to_models(self.read_table(ts_codes=[ts_code], start=trade_date, end=trade_date))
+        return models[0] if models else None
+
+    def find_by_code(self, ts_code: str) -> List:
+        """查询指定股票的所有数据，按交易日期排序"""
+        return self._to_models(self.read_table(ts_codes=[ts_code]))
+
+    def find_by_date(self, trade_date: date) -> List:
+        """查询指定日期所有股票的数据，按股票代码排序"""
+        return self._to_models(self.read_table(start=trade_date, end=trade_date))
+
+    def find_latest_trade_date(self) -> Optional[date]:
+        """已保存数据中最新的交易日期，没有数据时返回None"""
+        years = self._years()
+        if not years:
+            return None
+        latest = pc.max(pq.read_table(self._partition_files(years[-1]), columns=['trade_date'],
+                                      schema=self.schema)['trade_date'])
+        return latest.as_py() if latest.is_valid else None
+
+    def find_latest_trade_dates(self) -> Dict[str, date]:
+        """每只股票已保存数据的最新交易日期"""
+        table = self.read_table(['ts_code', 'trade_date'])
+        latest = table.group_by('ts_code').aggregate([('trade_date', 'max')])
+        return dict(zip(latest['ts_code'].to_pylist(), latest['trade_date_max'].to_pylist()))
+
+    def find_ts_codes(self) -> Set[str]:
+        """已有数据的股票代码集合"""
+        return set(pc.unique(self.read_table(['ts_code'])['ts_code']).to_pylist())
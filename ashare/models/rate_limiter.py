@@ -0,0 +1,161 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Tushare 各接口每分钟调用上限（按2000积分档位），未列出的接口使用默认值
+DEFAULT_CALLS_PER_MINUTE = 200
+DEFAULT_QUOTAS = {
+    'stock_basic': 200,
+    'trade_cal': 200,
+    'daily': 500,
+    'daily_basic': 200,
+    'dividend': 200,
+    'income': 200,
+    'balancesheet': 200,
+    'cashflow': 200,
+    'fina_indicator': 200,
+    'income_vip': 200,
+    'balancesheet_vip': 200,
+    'cashflow_vip': 200,
+    'fina_indicator_vip': 200,
+}
+
+class TokenBucket:
+    """令牌桶：按固定速率补充令牌，取不到令牌时阻塞到令牌可用"""
+
+    def __init__(self, calls_per_minute: float, burst: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            calls_per_minute: 每分钟允许的调用次数
+            burst: 桶容量，即允许的最大突发调用次数
+            clock: 单调时钟，便于测试时替换
+            sleep: 等待函数，便于测试时替换
+        """
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute 必须大于0")
+        self.rate = calls_per_minute / 60.0
+        self.capacity = max(burst, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预占一个令牌但不等待
+
+        在锁内预占令牌并计算需要等待的时间，多个调用方按到达顺序排队。
+
+        Returns:
+            调用方在发起请求前需要等待的秒数
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """
+        获取一个令牌，令牌不足时阻塞等待
+
+        Returns:
+            本次调用等待的秒数
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+class RateLimiter:
+    """按接口分别限流的令牌桶集合，进程内所有 TushareAPI 实例共享"""
+
+    def __init__(self, quotas: Optional[Dict[str, float]] = None,
+                 default_calls_per_minute: float = DEFAULT_CALLS_PER_MINUTE,
+                 safety_factor: float = 0.9,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            quotas: 接口名 -> 每分钟调用上限
+            default_calls_per_minute: 未配置接口的每分钟调用上限
+            safety_factor: 实际使用的配额比例，留出余量以免触发服务端限流
+            clock: 单调时钟
+            sleep: 等待函数
+        """
+        self.quotas = dict(DEFAULT_QUOTAS if quotas is None else quotas)
+        self.default_calls_per_minute = default_calls_per_minute
+        self.safety_factor = safety_factor
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, endpoint: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                calls_per_minute = self.quotas.get(endpoint, self.default_calls_per_minute)
+                bucket = TokenBucket(calls_per_minute * self.safety_factor,
+                                     clock=self._clock, sleep=self._sleep)
+                self._buckets[endpoint] = bucket
+            return bucket
+
+    def configure(self, quotas: Dict[str, float],
+                  default_calls_per_minute: float = DEFAULT_CALLS_PER_MINUTE,
+                  safety_factor: float = 0.9):
+        """重新配置各接口配额，已有的令牌桶会被重建"""
+        with self._lock:
+            self.quotas = dict(quotas)
+            self.default_calls_per_minute = default_calls_per_minute
+            self.safety_factor = safety_factor
+            self._buckets.clear()
+
+    def calls_per_minute(self, endpoint: str) -> float:
+        """指定接口配置的每分钟调用上限（未乘 safety_factor）"""
+        with self._lock:
+            return self.quotas.get(endpoint, self.default_calls_per_minute)
+
+    def set_quota(self, endpoint: str, calls_per_minute: float):
+        """设置指定接口的每分钟调用上限，已有的令牌桶会被重建"""
+        with self._lock:
+            self.quotas[endpoint] = calls_per_minute
+            self._buckets.pop(endpoint, None)
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        预占指定接口的调用许可但不等待，供异步客户端用 asyncio.sleep 等待
+
+        Returns:
+            调用方在发起请求前需要等待的秒数
+        """
+        wait = self._get_bucket(endpoint).reserve()
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {'calls': 0, 'waited_calls': 0, 'total_wait': 0.0})
+            stats['calls'] += 1
+            if wait > 0:
+                stats['waited_calls'] += 1
+                stats['total_wait'] += wait
+        return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        获取指定接口的调用许可，配额不足时阻塞等待
+
+        Returns:
+            本次调用等待的秒数
+        """
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """返回各接口的调用次数、等待次数和累计等待秒数"""
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+import pandas as pd
+
+class CacheMode(Enum):
+    READ_WRITE = "read_write"  # 命中且未过期时直接返回，否则请求接口并写入缓存
+    REPLAY = "replay"          # 只读缓存，永不访问网络，未命中时抛出 CacheMissError
+
+class CacheMissError(Exception):
+    """回放模式下缓存未命中"""
+
+class ResponseCache:
+    """
+    Tushare 接口响应的磁盘缓存
+
+    以 (接口名, 规范化后的参数) 为键，DataFrame 以 gzip 压缩的 pickle 文件保存在
+    cache_dir/<接口名>/<键>.pkl.gz，每个接口可以设置不同的过期时间。
+    """
+
+    DEFAULT_TTL = 24 * 3600
+
+    def __init__(self, cache_dir: str,
+                 mode: CacheMode = CacheMode.READ_WRITE,
+                 ttls: Optional[Dict[str, Optional[float]]] = None,
+                 default_ttl: Optional[float] = DEFAULT_TTL,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            cache_dir: 缓存目录
+            mode: 缓存模式
+            ttls: 接口名 -> 过期时间(秒)，None 表示永不过期
+            default_ttl: 未配置接口的过期时间(秒)，None 表示永不过期
+            clock: 时钟，便于测试时替换
+        """
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self._clock = clock
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """
+        按环境变量创建缓存，未设置 TUSHARE_CACHE_DIR 时返回 None
+
+        TUSHARE_CACHE_DIR: 缓存目录
+        TUSHARE_CACHE_MODE: read_write（默认）或 replay
+        """
+        cache_dir = os.getenv('TUSHARE_CACHE_DIR')
+        if not cache_dir:
+            return None
+        mode = CacheMode(os.getenv('TUSHARE_CACHE_MODE', CacheMode.READ_WRITE.value))
+        return cls(cache_dir, mode=mode)
+
+    @property
+    def replay_only(self) -> bool:
+        return self.mode == CacheMode.REPLAY
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        """规范化参数值，使等价的参数得到相同的键"""
+        if isinstance(value, (date, datetime)):
+            return value.strftime('%Y%m%d')
+        if isinstance(value, str):
+            return ','.join(part.strip() for part in value.split(',')) if ',' in value else value.strip()
+        return value
+
+    def make_key(self, api_name: str, params: Dict[str, Any]) -> str:
+        """根据接口名和参数生成缓存键，忽略值为 None 或空字符串的参数"""
+        normalized = {
+            name: self._normalize(value)
+            for name, value in params.items()
+            if value is not None and value != ''
+        }
+        payload = json.dumps([api_name, normalized], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, api_name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, api_name, f"{key}.pkl.gz")
+
+    def _ttl(self, api_name: str) -> Optional[float]:
+        return self.ttls.get(api_name, self.default_ttl)
+
+    def get(self, api_name: str, params: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """
+        读取缓存
+
+        Returns:
+            缓存的数据；未命中或已过期时返回 None
+
+        Raises:
+            CacheMissError: 回放模式下未命中
+        """
+        path = self._path(api_name, self.make_key(api_name, params))
+        if not os.path.exists(path):
+            if self.replay_only:
+                raise CacheMissError(f"回放模式下缓存未命中: {api_name} {params}")
+            return None
+        ttl = self._ttl(api_name)
+        # 回放模式不考虑过期，保证离线运行结果稳定
+        if not self.replay_only and ttl is not None and self._clock() - os.path.getmtime(path) > ttl:
+            return None
+        return pd.read_pickle(path, compression='gzip')
+
+    def put(self, api_name: str, params: Dict[str, Any], df: pd.DataFrame):
+        """
+        写入缓存，先写临时文件再原子替换，避免并发读到不完整的文件
+
+        空结果不缓存：数据尚未发布时（如收盘前请求当天的 daily）接口返回空表，
+        缓存后在过期前会一直返回空表，导致当天的数据被跳过
+        """
+        if self.replay_only or df.empty:
+            return
+        path = self._path(api_name, self.make_key(api_name, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        os.close(fd)
+        try:
+            df.to_pickle(tmp_path, compression='gzip')
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
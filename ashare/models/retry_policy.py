@@ -0,0 +1,172 @@
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Callable, Optional
+import aiohttp
+import requests
+
+class ErrorKind(Enum):
+    RATE_LIMIT = "rate_limit"  # 触发接口限流，等待配额恢复后重试
+    TRANSIENT = "transient"    # 网络抖动、超时、服务端5xx等临时错误，退避后重试
+    PERMANENT = "permanent"    # 参数错误、无权限、积分不足、每日配额用尽，重试无意义，立即失败
+    EMPTY = "empty"            # 接口没有数据，按空结果返回，不重试
+
+class TushareError(Exception):
+    """Tushare 接口返回的错误（code 不为 0）"""
+
+    def __init__(self, message: str, code: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: 接口返回的错误信息
+            code: 接口返回的错误码
+            retry_after: 服务端建议的重试等待时间(秒)
+        """
+        super().__init__(message)
+        self.code = code
+        self.retry_after = retry_after
+
+# 按顺序匹配错误信息：限流提示中也含有“权限”字样，因此要先判断每日配额和限流
+DAILY_QUOTA_PATTERNS = ('每天最多访问', '每日最多访问')
+RATE_LIMIT_PATTERNS = ('每分钟最多访问', '每小时最多访问', '访问频繁', 'too many requests', 'rate limit')
+EMPTY_PATTERNS = ('无数据', '数据为空', 'no data')
+PERMANENT_PATTERNS = ('权限', '积分', 'token', '参数', '接口名', 'permission', 'invalid')
+
+def _status_of(error: Exception) -> Optional[int]:
+    """取出 HTTP 错误的状态码，兼容 aiohttp 和 requests"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+def classify_error(error: Exception) -> ErrorKind:
+    """
+    判断接口调用错误的类型
+
+    Args:
+        error: 调用接口时抛出的异常
+
+    Returns:
+        ErrorKind: 错误类型，无法识别的错误按临时错误处理
+    """
+    message = str(error).lower()
+    if any(pattern in message for pattern in DAILY_QUOTA_PATTERNS):
+        return ErrorKind.PERMANENT
+    if any(pattern in message for pattern in RATE_LIMIT_PATTERNS):
+        return ErrorKind.RATE_LIMIT
+    if any(pattern in message for pattern in EMPTY_PATTERNS):
+        return ErrorKind.EMPTY
+    status = _status_of(error)
+    if status is not None:
+        if status == 429:
+            return ErrorKind.RATE_LIMIT
+        if status >= 500 or status == 408:
+            return ErrorKind.TRANSIENT
+        return ErrorKind.PERMANENT
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError,
+                          aiohttp.ClientError, requests.exceptions.RequestException)):
+        return ErrorKind.TRANSIENT
+    if any(pattern in message for pattern in PERMANENT_PATTERNS):
+        return ErrorKind.PERMANENT
+    if isinstance(error, (ValueError, TypeError, KeyError, AttributeError)):
+        return ErrorKind.PERMANENT
+    return ErrorKind.TRANSIENT
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 头，支持秒数和 HTTP 日期两种格式，无法解析时返回 None"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+def retry_after_of(error: Exception) -> Optional[float]:
+    """
+    取出服务端建议的重试等待时间
+
+    Returns:
+        等待秒数；服务端没有给出时返回 None
+    """
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after is not None:
+        return retry_after
+    headers = getattr(error, 'headers', None)
+    if headers is None:
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+    return parse_retry_after(headers.get('Retry-After')) if headers else None
+
+class RetryPolicy:
+    """
+    按错误类型决定是否重试以及等待时间
+
+    限流和临时错误按指数退避重试，等待时间有上限并加入随机抖动，避免多个线程同时重试；
+    服务端给出 Retry-After 时按其等待（不超过 max_delay）。永久错误立即失败。
+    """
+
+    def __init__(self, max_retries: int = 3,
+                 base_delay: float = 1.0,
+                 max_delay: float = 60.0,
+                 rate_limit_delay: float = 10.0,
+                 jitter: bool = True,
+                 random_func: Callable[[], float] = random.random):
+        """
+        Args:
+            max_retries: 最多尝试次数（包括第一次调用），为0时与1相同，只调用一次不重试
+            base_delay: 临时错误首次重试的等待时间(秒)，之后每次翻倍
+            max_delay: 重试等待时间上限(秒)
+            rate_limit_delay: 限流错误首次重试的等待时间(秒)，之后每次翻倍
+            jitter: 是否加入随机抖动，等待时间在退避时间的一半到全部之间
+            random_func: 返回 [0, 1) 随机数的函数，便于测试时替换
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries 必须大于等于0")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limit_delay = rate_limit_delay
+        self.jitter = jitter
+        self._random = random_func
+
+    @property
+    def attempts(self) -> int:
+        """实际尝试次数，至少调用一次"""
+        return max(self.max_retries, 1)
+
+    def should_retry(self, kind: ErrorKind, attempt: int) -> bool:
+        """
+        第 attempt 次尝试（从0开始）失败后是否重试
+        """
+        return kind in (ErrorKind.RATE_LIMIT, ErrorKind.TRANSIENT) and attempt < self.max_retries - 1
+
+    def backoff(self, kind: ErrorKind, attempt: int) -> float:
+        """第 attempt 次重试前的退避时间上界（不含抖动）"""
+        base = self.rate_limit_delay if kind == ErrorKind.RATE_LIMIT else self.base_delay
+        return min(base * (2 ** attempt), self.max_delay)
+
+    def delay(self, kind: ErrorKind, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        第 attempt 次重试前的等待时间
+
+        Args:
+            kind: 错误类型
+            attempt: 已失败的尝试序号，从0开始
+            retry_after: 服务端建议的等待时间(秒)，给出时优先使用，但不超过 max_delay
+
+        Returns:
+            等待秒数
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        backoff = self.backoff(kind, attempt)
+        if not self.jitter:
+            return backoff
+        return backoff / 2 + self._random() * backoff / 2
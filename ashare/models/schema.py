@@ -0,0 +1,226 @@
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Tuple
+
+@dataclass(frozen=True)
+class Migration:
+    """一次表结构变更"""
+    version: int                    # 变更后的版本号，从1开始连续递增
+    description: str                # 变更说明
+    statements: Tuple[str, ...]     # 依次执行的 SQL
+
+# 所有表结构变更，按版本号排列。已发布的变更不能修改，只能追加新的版本。
+# 修改列类型时按 SQLite 的做法重建表：建新表、INSERT ... SELECT 转换数据、删除旧表、重命名新表。
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(1, '初始表结构', (
+        '''
+        CREATE TABLE IF NOT EXISTS stocks (
+            ts_code TEXT PRIMARY KEY,
+            symbol TEXT NOT NULL,
+            name TEXT NOT NULL,
+            area TEXT,
+            industry TEXT,
+            fullname TEXT,
+            enname TEXT,
+            cnspell TEXT,
+            market TEXT,
+            exchange TEXT,
+            curr_type TEXT,
+            list_status TEXT,
+            list_date TEXT,
+            delist_date TEXT,
+            is_hs TEXT,
+            act_name TEXT,
+            act_ent_type TEXT
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS trade_calendar (
+            exchange TEXT NOT NULL,
+            cal_date TEXT NOT NULL,
+            is_open INTEGER NOT NULL,
+            pretrade_date TEXT,
+            PRIMARY KEY (exchange, cal_date)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS daily_quotes (
+            ts_code TEXT NOT NULL,
+            trade_date TEXT NOT NULL,
+            open DECIMAL(20,4),
+            high DECIMAL(20,4),
+            low DECIMAL(20,4),
+            close DECIMAL(20,4),
+            pre_close DECIMAL(20,4),
+            change DECIMAL(20,4),
+            pct_chg DECIMAL(20,4),
+            vol DECIMAL(20,4),
+            amount DECIMAL(20,4),
+            PRIMARY KEY (ts_code, trade_date)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_daily_quotes_trade_date ON daily_quotes(trade_date)',
+        '''
+        CREATE TABLE IF NOT EXISTS adj_factors (
+            ts_code TEXT NOT NULL,
+            trade_date TEXT NOT NULL,
+            adj_factor DECIMAL(20,6),
+            PRIMARY KEY (ts_code, trade_date)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_adj_factors_trade_date ON adj_factors(trade_date)',
+        '''
+        CREATE TABLE IF NOT EXISTS daily_indicators (
+            ts_code TEXT NOT NULL,
+            trade_date TEXT NOT NULL,
+            close DECIMAL(20,4),
+            turnover_rate DECIMAL(20,4),
+            turnover_rate_f DECIMAL(20,4),
+            volume_ratio DECIMAL(20,4),
+            pe DECIMAL(20,4),
+            pe_ttm DECIMAL(20,4),
+            pb DECIMAL(20,4),
+            ps DECIMAL(20,4),
+            ps_ttm DECIMAL(20,4),
+            dv_ratio DECIMAL(20,4),
+            dv_ttm DECIMAL(20,4),
+            total_share DECIMAL(20,4),
+            float_share DECIMAL(20,4),
+            free_share DECIMAL(20,4),
+            total_mv DECIMAL(20,4),
+            circ_mv DECIMAL(20,4),
+            PRIMARY KEY (ts_code, trade_date)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_trade_date ON daily_indicators(trade_date)',
+        '''
+        CREATE TABLE IF NOT EXISTS dividends (
+            ts_code TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            ann_date TEXT,
+            div_proc TEXT,
+            stk_div DECIMAL(20,4),
+            stk_bo_rate DECIMAL(20,4),
+            stk_co_rate DECIMAL(20,4),
+            cash_div DECIMAL(20,4),
+            cash_div_tax DECIMAL(20,4),
+            record_date TEXT,
+            ex_date TEXT,
+            pay_date TEXT,
+            div_listdate TEXT,
+            imp_ann_date TEXT,
+            base_date TEXT,
+            base_share DECIMAL(20,4),
+            PRIMARY KEY (ts_code, end_date)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_dividends_ex_date ON dividends(ex_date)',
+        '''
+        CREATE TABLE IF NOT EXISTS financial_reports (
+            ts_code TEXT NOT NULL,
+            report_date DATE NOT NULL,
+            ann_date DATE,
+            report_type TEXT NOT NULL,
+            end_type TEXT NOT NULL,
+            income_statement TEXT,
+            balance_sheet TEXT,
+            cash_flow_statement TEXT,
+            financial_indicators TEXT,
+            PRIMARY KEY (ts_code, report_date, report_type)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS sync_tasks (
+            sync_type TEXT PRIMARY KEY,
+            last_sync_time TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS sync_watermarks (
+            sync_type TEXT NOT NULL,
+            ts_code TEXT NOT NULL,
+            watermark TEXT NOT NULL,
+            PRIMARY KEY (sync_type, ts_code)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS sync_checkpoints (
+            sync_type TEXT NOT NULL,
+            ts_code TEXT NOT NULL,
+            run_key TEXT NOT NULL,
+            PRIMARY KEY (sync_type, ts_code)
+        )
+        ''',
+    )),
+    # 新鲜度检查按公告日期取最大值
+    Migration(2, '分红和财报的公告日期索引', (
+        'CREATE INDEX IF NOT EXISTS idx_dividends_ann_date ON dividends(ann_date)',
+        'CREATE INDEX IF NOT EXISTS idx_financial_reports_ann_date ON financial_reports(ann_date)',
+    )),
+    # 检查点按持久化的同步轮次记录，中断后跨过截止日期再恢复时仍沿用原来的轮次
+    Migration(3, '同步轮次表', (
+        '''
+        CREATE TABLE IF NOT EXISTS sync_runs (
+            sync_type TEXT PRIMARY KEY,
+            run_key TEXT NOT NULL,
+            started_at TEXT NOT NULL
+        )
+        ''',
+    )),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """数据库当前的表结构版本，没有 schema_version 表（新库或旧版本建的库）时为0"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    ).fetchone()
+    if row is None:
+        return 0
+    return conn.execute('SELECT MAX(version) FROM schema_version').fetchone()[0] or 0
+
+def migrate(conn: sqlite3.Connection, target_version: int = LATEST_VERSION) -> int:
+    """
+    把数据库升级到 target_version
+
+    每个版本的变更和版本记录在同一个事务中完成，中途失败时该版本整体回滚。
+    连接上没有未提交的事务时，用 BEGIN IMMEDIATE 取得写锁后重新读取版本号，多个进程同时升级时只有一个执行；
+    已在事务中时（如 SyncSession 的连接）直接在该事务中执行，由连接的持有者提交。
+    第1版的建表语句都带 IF NOT EXISTS，引入版本表之前建的库会直接被认定为第1版。
+
+    Args:
+        conn: 数据库连接
+        target_version: 目标版本
+
+    Returns:
+        升级后的版本号
+    """
+    own_transaction = not conn.in_transaction
+    if own_transaction:
+        conn.execute('BEGIN IMMEDIATE')
+    try:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+        ''')
+        version = current_version(conn)
+        for migration in MIGRATIONS:
+            if migration.version <= version or migration.version > target_version:
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            conn.execute('INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)',
+                         (migration.version, migration.description, datetime.now().isoformat()))
+            version = migration.version
+        if own_transaction:
+            conn.commit()
+        return version
+    except Exception:
+        if own_transaction:
+            conn.rollback()
+        raise
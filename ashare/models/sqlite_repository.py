@@ -0,0 +1,213 @@
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+import json
+import numpy as np
+from .connection_manager import ConnectionManager
+from .panel import Panel
+
+@dataclass
+class UpsertResult:
+    """一次批量写入中新增、更新和内容未变化的记录数"""
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def written(self) -> int:
+        """实际写入的记录数"""
+        return self.inserted + self.updated
+
+    def __add__(self, other: 'UpsertResult') -> 'UpsertResult':
+        return UpsertResult(self.inserted + other.inserted,
+                            self.updated + other.updated,
+                            self.unchanged + other.unchanged)
+
+class SqliteRepository:
+    """
+    SQLite 数据仓库基类
+
+    表结构由 schema 模块统一创建和升级，每个数据库文件只在第一次创建仓库时检查一次。
+    默认使用 ConnectionManager 中当前线程的共享连接，每次操作结束时提交；传入 connection 时所有操作都在该连接上
+    执行且不提交，由连接的持有者（如 SyncSession）决定何时提交，多个仓库的写入可以合并到同一个事务中。
+    """
+
+    def __init__(self, db_path: str, connection: Optional[sqlite3.Connection] = None):
+        """
+        初始化数据仓库
+
+        Args:
+            db_path: SQLite数据库文件路径
+            connection: 共享的数据库连接，为None时使用同一数据库文件共用的 ConnectionManager
+        """
+        self.db_path = db_path
+        self.connection = connection
+        self.connection_manager = ConnectionManager.for_database(db_path)
+        self.connection_manager.ensure_schema(connection)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """取得本次操作使用的连接"""
+        if self.connection is not None:
+            yield self.connection
+            return
+        conn = self.connection_manager.connection()
+        with conn:
+            yield conn
+
+    def _upsert(self, conn: sqlite3.Connection, table: str, columns: Sequence[str],
+                key_columns: Sequence[str], rows: Iterable[tuple],
+                merge_columns: Sequence[str] = ()) -> UpsertResult:
+        """
+        只写入新增或内容有变化的记录
+
+        先用 INSERT OR IGNORE 插入主键不存在的记录，再对主键已存在且任一列不同的记录执行 UPDATE。
+        与 INSERT OR REPLACE 相比，内容相同的记录不会被删除重插，不改写索引页，也不产生日志写入。
+        同一批中主键重复时以最后一条为准。
+
+        Args:
+            conn: 数据库连接
+            table: 表名
+            columns: 写入的列名，包括主键列
+            key_columns: 主键列名
+            rows: 按 columns 顺序排列的记录
+            merge_columns: 更新已有记录时，这些列的新值为 NULL 则保留原值（只带部分内容的记录合并到已有记录）
+
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        rows = list(rows)
+        if not rows:
+            return UpsertResult()
+        key_indexes = [columns.index(column) for column in key_columns]
+        value_indexes = [i for i, column in enumerate(columns) if column not in key_columns]
+
+        before = conn.total_changes
+        conn.executemany(
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows
+        )
+        inserted = conn.total_changes - before
+
+        new_values = {
+            columns[i]: f'COALESCE(?, {columns[i]})' if columns[i] in merge_columns else '?'
+            for i in value_indexes
+        }
+        before = conn.total_changes
+        conn.executemany(
+            f"UPDATE {table} SET {', '.join(f'{column} = {value}' for column, value in new_values.items())} "
+            f"WHERE {' AND '.join(f'{column} = ?' for column in key_columns)} "
+            f"AND ({' OR '.join(f'{column} IS NOT {value}' for column, value in new_values.items())})",
+            [
+                [row[i] for i in value_indexes] + [row[i] for i in key_indexes] + [row[i] for i in value_indexes]
+                for row in rows
+            ]
+        )
+        updated = conn.total_changes - before
+        return UpsertResult(inserted, updated, len(rows) - inserted - updated)
+
+    def _find_arrays(self, table: str, value_columns: Sequence[str], ts_code: str,
+                     start: Optional[date] = None, end: Optional[date] = None,
+                     columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        按列读取单只股票的时间序列，不构造数据对象
+
+        日期在 SQL 中转换为 YYYYMMDD 整数，所有列一次取出后整体转换为 float64 矩阵再按列拆分，
+        不逐个值解析 Decimal 和日期。
+
+        Args:
+            table: 表名，主键为 (ts_code, trade_date)
+            value_columns: 表中可读取的数值列
+            ts_code: 股票代码
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            columns: 要读取的数值列，默认 value_columns 全部
+
+        Returns:
+            列名 -> 按交易日升序排列的数组，trade_date 为 int32，其余为 float64（空值为 NaN）
+
+        Raises:
+            ValueError: columns 中有不在 value_columns 中的列
+        """
+        columns = list(value_columns if columns is None else columns)
+        unknown = [column for column in columns if column not in value_columns]
+        if unknown:
+            raise ValueError(f"未知的列: {unknown}，可选 {tuple(value_columns)}")
+        conditions, params = ['ts_code = ?'], [ts_code]
+        if start is not None:
+            conditions.append('trade_date >= ?')
+            params.append(start.isoformat())
+        if end is not None:
+            conditions.append('trade_date <= ?')
+            params.append(end.isoformat())
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT CAST(REPLACE(trade_date, '-', '') AS INTEGER){''.join(', ' + column for column in columns)} "
+                f"FROM {table} WHERE {' AND '.join(conditions)} ORDER BY trade_date",
+                params
+            ).fetchall()
+        # None 转为 NaN，转置后每列在内存中连续
+        values = np.array(rows, dtype=np.float64).reshape(len(rows), len(columns) + 1).T.copy()
+        result = {'trade_date': values[0].astype(np.int32)}
+        for i, column in enumerate(columns, 1):
+            result[column] = values[i]
+        return result
+
+    # load_panel 每次从游标取出的行数
+    PANEL_CHUNK_SIZE = 100000
+
+    def _load_panel(self, table: str, value_columns: Sequence[str], field: str,
+                    ts_codes: Optional[Sequence[str]] = None, start: Optional[date] = None,
+                    end: Optional[date] = None, cache_dir: Optional[str] = None) -> Panel:
+        """
+        读取一个字段的 交易日 × 股票 面板
+
+        只执行一次查询，按 PANEL_CHUNK_SIZE 分块从游标取出 (股票代码, 日期, 值)，每块整体转换为数组，
+        不把全部行同时保留为 Python 对象。指定股票时通过 json_each 传入代码列表，不受参数个数限制。
+
+        Args:
+            table: 表名，主键为 (ts_code, trade_date)
+            value_columns: 表中可读取的数值列
+            field: 要读取的列
+            ts_codes: 列的股票代码及顺序，默认为区间内有数据的全部股票
+            start: 起始交易日（含），为空时不限
+            end: 截止交易日（含），为空时不限
+            cache_dir: 传入时面板写入该目录并以内存映射方式返回，之后可用 Panel.load 直接打开
+
+        Returns:
+            Panel
+
+        Raises:
+            ValueError: field 不在 value_columns 中
+        """
+        if field not in value_columns:
+            raise ValueError(f"未知的列: {field}，可选 {tuple(value_columns)}")
+        conditions, params = [], []
+        if ts_codes is not None:
+            conditions.append('ts_code IN (SELECT value FROM json_each(?))')
+            params.append(json.dumps(list(ts_codes)))
+        if start is not None:
+            conditions.append('trade_date >= ?')
+            params.append(start.isoformat())
+        if end is not None:
+            conditions.append('trade_date <= ?')
+            params.append(end.isoformat())
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        codes, trade_dates, values = [], [], []
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"SELECT ts_code, CAST(REPLACE(trade_date, '-', '') AS INTEGER), {field} FROM {table} {where}",
+                params
+            )
+            while True:
+                rows = cursor.fetchmany(self.PANEL_CHUNK_SIZE)
+                if not rows:
+                    break
+                chunk_codes, chunk_dates, chunk_values = zip(*rows)
+                codes.append(np.array(chunk_codes, dtype=object))
+                trade_dates.append(np.array(chunk_dates, dtype=np.int32))
+                # None 转为 NaN
+                values.append(np.array(chunk_values, dtype=np.float64))
+        return Panel.from_records(field, codes, trade_dates, values, ts_codes, cache_dir)
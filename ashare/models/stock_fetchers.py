@@ -7,42 +7,40 @@ import logging
 from ashare.logger.setup_logger import get_logger
 
 from ashare.models.tushare_api import TushareAPI
+from ashare.models.frame_converter import frame_to_models
+from ashare.models.async_tushare_api import AsyncTushareAPI
+
+STOCK_FIELDS = 'ts_code,symbol,name,area,industry,fullname,enname,cnspell,market,exchange,curr_type,list_status,list_date,delist_date,is_hs,act_name,act_ent_type'
 
 class AShareFetcher():
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, async_api: Optional[AsyncTushareAPI] = None):
+        """
+        Args:
+            api_token: Tushare API token
+            async_api: 异步方法使用的客户端，默认按 api_token 创建
+        """
         self.api = TushareAPI(api_token)
+        self.async_api = async_api or AsyncTushareAPI(api_token)
         self.logger = get_logger()
         self.logger.info("初始化 AShareFetcher")
 
     def _convert_date(self, date_str: str) -> Optional[date]:
         """转换日期字符串为date对象"""
-        if not date_str:
+        if not date_str or pd.isna(date_str):
             return None
         return datetime.strptime(str(date_str), '%Y%m%d').date()
 
     def fetch_stock_list(self) -> List[Stock]:
-        df = self.api.stock_basic(exchange='', list_status='L', 
-                                fields='ts_code,symbol,name,area,industry,fullname,enname,cnspell,market,exchange,curr_type,list_status,list_date,delist_date,is_hs,act_name,act_ent_type')
+        df = self.api.stock_basic(exchange='', list_status='L', fields=STOCK_FIELDS)
+        self.logger.info(f"获取到 {len(df)} 只股票")
+        return self._to_stocks(df)
+
+    async def fetch_stock_list_async(self) -> List[Stock]:
+        """fetch_stock_list 的异步版本"""
+        df = await self.async_api.stock_basic(exchange='', list_status='L', fields=STOCK_FIELDS)
         self.logger.info(f"获取到 {len(df)} 只股票")
-        return [
-            Stock(
-                ts_code=row['ts_code'],
-                symbol=row['symbol'],
-                name=row['name'],
-                area=row['area'],
-                industry=row['industry'],
-                fullname=row['fullname'],
-                enname=row['enname'],
-                cnspell=row['cnspell'],
-                market=row['market'],
-                exchange=row['exchange'],
-                curr_type=row['curr_type'],
-                list_status=row['list_status'],
-                list_date=self._convert_date(row['list_date']),
-                delist_date=self._convert_date(row['delist_date']),
-                is_hs=row['is_hs'],
-                act_name=row['act_name'],
-                act_ent_type=row['act_ent_type'],
-            )
-            for _, row in df.iterrows()
-        ]
\ No newline at end of file
+        return self._to_stocks(df)
+
+    def _to_stocks(self, df: pd.DataFrame) -> List[Stock]:
+        """将tushare返回的DataFrame转换为Stock对象列表"""
+        return frame_to_models(df, Stock)
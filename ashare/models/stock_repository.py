@@ -2,46 +2,16 @@ import sqlite3
 from datetime import datetime
 from typing import List, Optional
 from .stock import Stock
+from .sqlite_repository import SqliteRepository, UpsertResult
 
-class StockRepository:
+class StockRepository(SqliteRepository):
     """股票数据仓库，负责股票数据的存储和读取"""
     
-    def __init__(self, db_path: str):
-        """
-        初始化股票数据仓库
-        
-        Args:
-            db_path: SQLite数据库文件路径
-        """
-        self.db_path = db_path
-        self._init_db()
-    
-    def _init_db(self):
-        """初始化数据库表结构"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS stocks (
-                    ts_code TEXT PRIMARY KEY,
-                    symbol TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    area TEXT,
-                    industry TEXT,
-                    fullname TEXT,
-                    enname TEXT,
-                    cnspell TEXT,
-                    market TEXT,
-                    exchange TEXT,
-                    curr_type TEXT,
-                    list_status TEXT,
-                    list_date TEXT,
-                    delist_date TEXT,
-                    is_hs TEXT,
-                    act_name TEXT,
-                    act_ent_type TEXT
-                )
-            ''')
-            conn.commit()
+    COLUMNS = (
+        'ts_code', 'symbol', 'name', 'area', 'industry', 'fullname', 'enname',
+        'cnspell', 'market', 'exchange', 'curr_type', 'list_status',
+        'list_date', 'delist_date', 'is_hs', 'act_name', 'act_ent_type'
+    )
     
     def save(self, stock: Stock) -> None:
         """
@@ -50,7 +20,7 @@ class StockRepository:
         Args:
             stock: Stock对象
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT OR REPLACE INTO stocks (
@@ -67,22 +37,18 @@ class StockRepository:
                 stock.is_hs, stock.act_name, stock.act_ent_type
             ))
     
-    def save_many(self, stocks: List[Stock]) -> None:
+    def save_many(self, stocks: List[Stock]) -> UpsertResult:
         """
-        批量保存股票信息
+        批量保存股票信息，内容未变化的记录不重写
         
         Args:
             stocks: Stock对象列表
+            
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.executemany('''
-                INSERT OR REPLACE INTO stocks (
-                    ts_code, symbol, name, area, industry, fullname, enname,
-                    cnspell, market, exchange, curr_type, list_status,
-                    list_date, delist_date, is_hs, act_name, act_ent_type
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', [
+        with self._connect() as conn:
+            return self._upsert(conn, 'stocks', self.COLUMNS, ('ts_code',), [
                 (stock.ts_code, stock.symbol, stock.name, stock.area,
                  stock.industry, stock.fullname, stock.enname, stock.cnspell,
                  stock.market, stock.exchange, stock.curr_type, stock.list_status,
@@ -102,7 +68,7 @@ class StockRepository:
         Returns:
             Stock对象，如果未找到返回None
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM stocks WHERE ts_code = ?', (ts_code,))
             row = cursor.fetchone()
@@ -117,7 +83,7 @@ class StockRepository:
         Returns:
             Stock对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM stocks')
             return [self._row_to_stock(row) for row in cursor.fetchall()]
@@ -132,7 +98,7 @@ class StockRepository:
         Returns:
             Stock对象列表
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM stocks WHERE industry = ?', (industry,))
             return [self._row_to_stock(row) for row in cursor.fetchall()]
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Iterable, Set
+import sqlite3
+from .sync_type import SyncType
+from .sqlite_repository import SqliteRepository
+
+class SyncCheckpointRepository(SqliteRepository):
+    """
+    记录同步任务中已提交的股票代码，任务中断后重新执行时跳过已完成的股票
+
+    检查点属于一个同步轮次，轮次在第一次记录时持久化，直到 clear 才结束，
+    中断后隔天（同步截止日期已变化）恢复时仍属于同一轮次。
+    """
+
+    def start_run(self, sync_type: SyncType, run_key: str) -> str:
+        """
+        取得同步类型当前的轮次，没有未完成的轮次时以 run_key 开始新的轮次
+
+        Args:
+            sync_type: 同步类型
+            run_key: 新轮次的标识（如同步截止日期）
+
+        Returns:
+            当前轮次的标识：有未完成的轮次时为该轮次的标识，否则为 run_key
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO sync_runs (sync_type, run_key, started_at) VALUES (?, ?, ?)",
+                (sync_type.value, run_key, datetime.now().isoformat())
+            )
+            return conn.execute(
+                "SELECT run_key FROM sync_runs WHERE sync_type = ?", (sync_type.value,)
+            ).fetchone()[0]
+
+    def get_done_codes(self, sync_type: SyncType, run_key: str) -> Set[str]:
+        """
+        查询本轮同步已完成的股票代码
+
+        Args:
+            sync_type: 同步类型
+            run_key: 同步轮次标识（如同步截止日期），其他轮次遗留的检查点不计入
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT ts_code FROM sync_checkpoints WHERE sync_type = ? AND run_key = ?",
+                (sync_type.value, run_key)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_done(self, sync_type: SyncType, ts_codes: Iterable[str], run_key: str):
+        """记录股票代码在本轮同步中已提交"""
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO sync_checkpoints (sync_type, ts_code, run_key)
+                VALUES (?, ?, ?)
+                ON CONFLICT(sync_type, ts_code) DO UPDATE SET run_key = excluded.run_key
+                """,
+                [(sync_type.value, ts_code, run_key) for ts_code in ts_codes]
+            )
+
+    def clear(self, sync_type: SyncType):
+        """同步任务全部完成后清除检查点并结束当前轮次"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sync_checkpoints WHERE sync_type = ?", (sync_type.value,))
+            conn.execute("DELETE FROM sync_runs WHERE sync_type = ?", (sync_type.value,))
@@ -0,0 +1,71 @@
+import fcntl
+import os
+from typing import Optional
+
+class SyncLockedError(RuntimeError):
+    """同步锁已被其他进程持有"""
+
+class SyncLock:
+    """
+    跨进程的同步互斥锁
+
+    基于 fcntl.flock 文件锁，同一数据库同时只允许一个同步运行（调度器或手动执行的脚本），
+    持有锁的进程退出时操作系统会自动释放，不会留下失效的锁。锁文件中记录持有者的进程号。
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 锁文件路径，通常为数据库文件路径加 .lock
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @classmethod
+    def for_database(cls, db_path: str) -> 'SyncLock':
+        """数据库对应的同步锁"""
+        return cls(f"{db_path}.lock")
+
+    @property
+    def locked(self) -> bool:
+        """当前实例是否持有锁"""
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        """
+        获取锁
+
+        Args:
+            blocking: 为True时等待到其他进程释放锁
+
+        Returns:
+            是否获取成功，非阻塞模式下锁被占用时返回False
+        """
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        """释放锁"""
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self) -> 'SyncLock':
+        if not self.acquire():
+            raise SyncLockedError(f"同步锁 {self.path} 已被其他进程持有")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
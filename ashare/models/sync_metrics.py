@@ -0,0 +1,190 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+import numpy as np
+
+@dataclass
+class CallRecord:
+    """一次接口调用"""
+    endpoint: str                   # 接口名
+    key: Optional[str]              # 调用的主要参数（ts_code、trade_date 或 period），用于定位慢股票
+    started_at: float               # 开始时间(time.time())
+    latency: float                  # 各次尝试中接口本身的耗时之和(秒)，不含限流和重试等待
+    rows: int                       # 返回的行数
+    retries: int = 0                # 重试次数
+    rate_limit_wait: float = 0.0    # 限流等待时间(秒)
+    cached: bool = False            # 是否命中响应缓存
+    error: Optional[str] = None     # 最终失败时的错误信息
+
+@dataclass
+class WriteRecord:
+    """一次数据库写入或提交"""
+    sync_type: str                  # 同步类型
+    started_at: float               # 开始时间(time.time())
+    seconds: float                  # 耗时(秒)
+    rows: int                       # 提交写入的行数，提交事务时为0
+    written: int                    # 实际写入（新增或有变化）的行数
+
+class SyncMetrics:
+    """
+    同步过程的结构化指标
+
+    TushareAPI 记录每次接口调用的耗时、返回行数、重试次数和限流等待，BaseSync 记录每批写入的耗时和行数。
+    线程安全，进程内默认共用 TushareAPI.get_metrics() 返回的实例。
+    """
+
+    def __init__(self):
+        self._calls: List[CallRecord] = []
+        self._writes: List[WriteRecord] = []
+        self._lock = threading.Lock()
+
+    def record_call(self, endpoint: str, latency: float, rows: int, key: Optional[str] = None,
+                    retries: int = 0, rate_limit_wait: float = 0.0, cached: bool = False,
+                    error: Optional[str] = None, started_at: Optional[float] = None):
+        """记录一次接口调用"""
+        record = CallRecord(endpoint, key, started_at if started_at is not None else time.time(),
+                            latency, rows, retries, rate_limit_wait, cached, error)
+        with self._lock:
+            self._calls.append(record)
+
+    def record_write(self, sync_type: str, seconds: float, rows: int, written: Optional[int] = None,
+                     started_at: Optional[float] = None):
+        """记录一次数据库写入，written 为空时按 rows 计"""
+        record = WriteRecord(sync_type, started_at if started_at is not None else time.time(),
+                             seconds, rows, rows if written is None else written)
+        with self._lock:
+            self._writes.append(record)
+
+    def reset(self):
+        """清空已记录的指标"""
+        with self._lock:
+            self._calls.clear()
+            self._writes.clear()
+
+    @property
+    def calls(self) -> List[CallRecord]:
+        with self._lock:
+            return list(self._calls)
+
+    @property
+    def writes(self) -> List[WriteRecord]:
+        with self._lock:
+            return list(self._writes)
+
+    def endpoint_summary(self, rate_limiter=None) -> List[Dict]:
+        """
+        按接口汇总调用指标，按累计耗时从高到低排列
+
+        Args:
+            rate_limiter: 传入时按其配额计算配额使用率（实际每分钟调用次数 / 每分钟调用上限）
+
+        Returns:
+            每个接口一行的汇总
+        """
+        by_endpoint: Dict[str, List[CallRecord]] = {}
+        for call in self.calls:
+            by_endpoint.setdefault(call.endpoint, []).append(call)
+        summary = []
+        for endpoint, calls in by_endpoint.items():
+            remote = [call for call in calls if not call.cached]
+            latencies = np.array([call.latency for call in remote]) if remote else np.zeros(1)
+            total_latency = float(latencies.sum())
+            rows = sum(call.rows for call in calls)
+            row = {
+                'endpoint': endpoint,
+                'calls': len(calls),
+                'cached': len(calls) - len(remote),
+                'errors': sum(1 for call in calls if call.error),
+                'retries': sum(call.retries for call in calls),
+                'rows': rows,
+                'total_latency': total_latency,
+                'avg_latency': total_latency / len(remote) if remote else 0.0,
+                'p95_latency': float(np.percentile(latencies, 95)),
+                'rate_limit_wait': sum(call.rate_limit_wait for call in calls),
+                'rows_per_second': rows / total_latency if total_latency > 0 else 0.0,
+                'quota_usage': None,
+            }
+            if rate_limiter is not None and remote:
+                # 调用跨度不足一分钟时按一分钟计
+                span = max(max(call.started_at + call.latency for call in remote) -
+                           min(call.started_at for call in remote), 60.0)
+                row['quota_usage'] = len(remote) / (span / 60.0) / rate_limiter.calls_per_minute(endpoint)
+            summary.append(row)
+        return sorted(summary, key=lambda row: row['total_latency'], reverse=True)
+
+    def write_summary(self) -> List[Dict]:
+        """按同步类型汇总数据库写入指标，按累计耗时从高到低排列"""
+        by_type: Dict[str, List[WriteRecord]] = {}
+        for write in self.writes:
+            by_type.setdefault(write.sync_type, []).append(write)
+        summary = []
+        for sync_type, writes in by_type.items():
+            seconds = sum(write.seconds for write in writes)
+            rows = sum(write.rows for write in writes)
+            summary.append({
+                'sync_type': sync_type,
+                'batches': sum(1 for write in writes if write.rows),
+                'rows': rows,
+                'written': sum(write.written for write in writes),
+                'seconds': seconds,
+                'rows_per_second': rows / seconds if seconds > 0 else 0.0,
+            })
+        return sorted(summary, key=lambda row: row['seconds'], reverse=True)
+
+    def slowest_calls(self, limit: int = 10) -> List[CallRecord]:
+        """耗时最长的若干次接口调用"""
+        return sorted((call for call in self.calls if not call.cached),
+                      key=lambda call: call.latency, reverse=True)[:limit]
+
+    def format_summary(self, rate_limiter=None) -> str:
+        """
+        生成文本汇总表：各接口的调用指标、各同步类型的写入指标和最慢的几次调用
+        """
+        lines = [f"{'接口':<20}{'调用':>8}{'缓存':>6}{'错误':>6}{'重试':>6}{'行数':>10}"
+                 f"{'累计耗时':>10}{'平均':>8}{'P95':>8}{'限流等待':>10}{'行/秒':>10}{'配额':>8}"]
+        for row in self.endpoint_summary(rate_limiter):
+            quota = f"{row['quota_usage']:.0%}" if row['quota_usage'] is not None else '-'
+            lines.append(
+                f"{row['endpoint']:<20}{row['calls']:>8}{row['cached']:>6}{row['errors']:>6}{row['retries']:>6}"
+                f"{row['rows']:>10}{row['total_latency']:>10.2f}{row['avg_latency']:>8.3f}"
+                f"{row['p95_latency']:>8.3f}{row['rate_limit_wait']:>10.2f}{row['rows_per_second']:>10.0f}"
+                f"{quota:>8}")
+        lines.append('')
+        lines.append(f"{'同步类型':<20}{'批次':>8}{'行数':>10}{'实际写入':>10}{'写入耗时':>10}{'行/秒':>10}")
+        for row in self.write_summary():
+            lines.append(f"{row['sync_type']:<20}{row['batches']:>8}{row['rows']:>10}{row['written']:>10}"
+                         f"{row['seconds']:>10.2f}{row['rows_per_second']:>10.0f}")
+        slowest = self.slowest_calls(5)
+        if slowest:
+            lines.append('')
+            lines.append('最慢的调用: ' + ', '.join(
+                f"{call.endpoint}({call.key or '-'}) {call.latency:.2f}s" for call in slowest))
+        return '\n'.join(lines)
+
+    def to_dict(self, rate_limiter=None) -> Dict:
+        """全部指标（汇总和明细）"""
+        return {
+            'endpoints': self.endpoint_summary(rate_limiter),
+            'writes': self.write_summary(),
+            'calls': [asdict(call) for call in self.calls],
+            'write_batches': [asdict(write) for write in self.writes],
+        }
+
+    def to_json(self, path: Optional[str] = None, rate_limiter=None) -> str:
+        """
+        导出为 JSON
+
+        Args:
+            path: 传入时同时写入该文件
+            rate_limiter: 用于计算配额使用率的限流器
+
+        Returns:
+            JSON 文本
+        """
+        text = json.dumps(self.to_dict(rate_limiter), ensure_ascii=False, indent=2)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        return text
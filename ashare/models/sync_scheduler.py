@@ -0,0 +1,279 @@
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+import logging
+from .sync_type import SyncType
+from .sync_service import SyncService
+from .sync_lock import SyncLock
+from .trading_calendar import TradingCalendar
+from .freshness_repository import FreshnessRepository
+from .parquet_daily_quote_repository import ParquetDailyQuoteRepository
+from .parquet_daily_indicator_repository import ParquetDailyIndicatorRepository
+
+@dataclass(frozen=True)
+class SyncSchedule:
+    """一个同步类型的触发时间"""
+    run_at: dtime                               # 当天的触发时间
+    trading_days_only: bool = True              # 只在交易日触发
+    weekdays: Optional[FrozenSet[int]] = None   # 只在这些星期几触发（0为周一），为空时不限
+    sla: timedelta = timedelta(hours=2)         # 触发后多久内数据应当同步完成
+
+# Tushare 日线行情和复权因子在收盘后 15:00-16:00 入库，每日指标在 17:00 前入库；
+# 分红和财报公告在非交易日也会发布，财报逐只拉取调用次数多，每周六同步一次
+DEFAULT_SCHEDULE: Dict[SyncType, SyncSchedule] = {
+    SyncType.STOCK_LIST: SyncSchedule(dtime(16, 0)),
+    SyncType.TRADE_CALENDAR: SyncSchedule(dtime(16, 0)),
+    SyncType.DAILY_QUOTE: SyncSchedule(dtime(16, 30)),
+    SyncType.ADJ_FACTOR: SyncSchedule(dtime(16, 30)),
+    SyncType.DAILY_INDICATOR: SyncSchedule(dtime(17, 30)),
+    SyncType.DIVIDEND: SyncSchedule(dtime(19, 0), trading_days_only=False),
+    SyncType.FINANCIAL_REPORT: SyncSchedule(dtime(20, 0), trading_days_only=False, weekdays=frozenset({5}),
+                                            sla=timedelta(hours=12)),
+}
+
+# 各同步类型对应的数据表和表示数据新鲜度的日期列
+FRESHNESS_COLUMNS: Dict[SyncType, tuple] = {
+    SyncType.TRADE_CALENDAR: ('trade_calendar', 'cal_date'),
+    SyncType.DAILY_QUOTE: ('daily_quotes', 'trade_date'),
+    SyncType.ADJ_FACTOR: ('adj_factors', 'trade_date'),
+    SyncType.DAILY_INDICATOR: ('daily_indicators', 'trade_date'),
+    SyncType.DIVIDEND: ('dividends', 'ann_date'),
+    SyncType.FINANCIAL_REPORT: ('financial_reports', 'ann_date'),
+}
+
+# 设置了 parquet_dir 时保存为 Parquet 的数据集
+PARQUET_DATASETS = {
+    SyncType.DAILY_QUOTE: ParquetDailyQuoteRepository,
+    SyncType.DAILY_INDICATOR: ParquetDailyIndicatorRepository,
+}
+
+# 按交易日组织的数据集，最新交易日必须达到最近一次触发对应的交易日
+TRADE_DATE_DATASETS = (SyncType.DAILY_QUOTE, SyncType.ADJ_FACTOR, SyncType.DAILY_INDICATOR)
+
+@dataclass
+class DatasetFreshness:
+    """一个数据集的新鲜度"""
+    sync_type: SyncType
+    latest_date: Optional[date]             # 表中已有数据的最新日期
+    last_sync_time: Optional[datetime]      # 最后一次同步完成的时间
+    expected_date: Optional[date]           # 按时间表此时应当已有数据的交易日，不按交易日组织的数据集为None
+    is_fresh: bool                          # 是否满足时效要求
+
+class SyncScheduler:
+    """
+    按交易日历触发同步的常驻调度器
+
+    每个同步类型在时间表配置的时间（默认为收盘后，只在交易日）触发。调度器定期检查：某类型最近一次
+    应触发的时间晚于它最后一次同步完成的时间即为到期，所有到期的类型合并为一次 sync_all 执行。
+    停机期间错过的多次触发只补跑一次（同步本身是增量的，一次即可补齐）。执行前获取数据库的同步锁，
+    其他进程（如手动执行的同步脚本）正在同步时跳过本轮，不会重叠执行。
+    按交易日组织的数据集同步完成后最新交易日仍未达到该次触发应同步到的交易日时（数据源尚未入库），
+    该次触发不算完成，每隔 retry_interval 重试，最多 max_stale_retries 次。
+    """
+
+    # 向前查找最近一次触发的最大天数
+    LOOKBACK_DAYS = 31
+
+    def __init__(self, sync_service: SyncService, db_path: str,
+                 schedule: Optional[Dict[SyncType, SyncSchedule]] = None,
+                 lock: Optional[SyncLock] = None,
+                 poll_interval: float = 60.0,
+                 retry_interval: timedelta = timedelta(minutes=30),
+                 max_stale_retries: int = 6,
+                 clock: Callable[[], datetime] = datetime.now,
+                 parquet_dir: Optional[str] = None):
+        """
+        Args:
+            sync_service: 执行同步的服务
+            db_path: SQLite数据库文件路径
+            schedule: 同步类型 -> 触发时间，默认 DEFAULT_SCHEDULE，不在其中的类型不会被调度
+            lock: 同步锁，默认为数据库文件旁的 .lock 文件
+            poll_interval: 检查是否有到期任务的间隔(秒)
+            retry_interval: 同步失败或同步后数据仍不是最新时，再次尝试前的等待时间
+            max_stale_retries: 同步后数据仍不是最新时，同一次触发最多重试的次数
+            clock: 当前时间，便于测试时替换
+            parquet_dir: 同步服务保存 Parquet 数据的目录，PARQUET_DATASETS 中的数据集从这里检查新鲜度
+        """
+        self.sync_service = sync_service
+        self.db_path = db_path
+        self.schedule = dict(DEFAULT_SCHEDULE if schedule is None else schedule)
+        self.lock = lock or SyncLock.for_database(db_path)
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self.max_stale_retries = max_stale_retries
+        self._clock = clock
+        self.parquet_dir = parquet_dir
+        self._failed_at: Dict[SyncType, datetime] = {}
+        # 同步类型 -> (触发时间, 同步后数据仍不是最新的次数)
+        self._stale_runs: Dict[SyncType, Tuple[datetime, int]] = {}
+        self._stop = threading.Event()
+        self.logger = logging.getLogger(__name__)
+
+    def _is_run_day(self, schedule: SyncSchedule, day: date, calendar: TradingCalendar) -> bool:
+        """指定日期是否触发，交易日历未覆盖时按工作日判断"""
+        if schedule.weekdays is not None and day.weekday() not in schedule.weekdays:
+            return False
+        if not schedule.trading_days_only:
+            return True
+        return calendar.is_trading_day(day) if calendar.covers(day) else day.weekday() < 5
+
+    def last_run_time(self, sync_type: SyncType, now: datetime,
+                      calendar: Optional[TradingCalendar] = None) -> Optional[datetime]:
+        """
+        指定类型在 now 之前（含）最近一次应触发的时间
+
+        Returns:
+            触发时间，LOOKBACK_DAYS 天内没有触发时返回None
+        """
+        schedule = self.schedule[sync_type]
+        calendar = calendar or TradingCalendar.load(self.db_path)
+        for offset in range(self.LOOKBACK_DAYS + 1):
+            day = now.date() - timedelta(days=offset)
+            run_time = datetime.combine(day, schedule.run_at)
+            if run_time <= now and self._is_run_day(schedule, day, calendar):
+                return run_time
+        return None
+
+    def due_types(self, now: Optional[datetime] = None) -> List[SyncType]:
+        """
+        到期需要同步的类型：最近一次应触发的时间晚于最后一次同步完成的时间，
+        或该次触发后同步过但数据仍不是最新且未超过重试次数，并且不在上次尝试后的重试等待期内
+        """
+        now = now or self._clock()
+        calendar = TradingCalendar.load(self.db_path)
+        due = []
+        for sync_type in self.schedule:
+            run_time = self.last_run_time(sync_type, now, calendar)
+            if run_time is None:
+                continue
+            failed_at = self._failed_at.get(sync_type)
+            if failed_at is not None and now - failed_at < self.retry_interval:
+                continue
+            last_sync_time = self._last_sync_time(sync_type)
+            if last_sync_time is None or last_sync_time < run_time:
+                due.append(sync_type)
+            elif self._stale_count(sync_type, run_time) < self.max_stale_retries and \
+                    self._is_stale(sync_type, run_time, calendar):
+                due.append(sync_type)
+        return due
+
+    def _latest_date(self, sync_type: SyncType, repository: Optional[FreshnessRepository] = None) -> Optional[date]:
+        """数据集已有数据的最新日期"""
+        if self.parquet_dir and sync_type in PARQUET_DATASETS:
+            return PARQUET_DATASETS[sync_type](self.parquet_dir).find_latest_trade_date()
+        table_column = FRESHNESS_COLUMNS.get(sync_type)
+        if not table_column:
+            return None
+        return (repository or FreshnessRepository(self.db_path)).find_latest_date(*table_column)
+
+    def _is_stale(self, sync_type: SyncType, run_time: datetime, calendar: TradingCalendar) -> bool:
+        """按交易日组织的数据集的最新交易日是否早于 run_time 触发的同步应同步到的交易日"""
+        if sync_type not in TRADE_DATE_DATASETS:
+            return False
+        latest_date = self._latest_date(sync_type)
+        return latest_date is None or latest_date < self._expected_trade_date(run_time.date(), calendar)
+
+    def _stale_count(self, sync_type: SyncType, run_time: datetime) -> int:
+        """run_time 这次触发同步后数据仍不是最新的次数"""
+        stale_run = self._stale_runs.get(sync_type)
+        return stale_run[1] if stale_run and stale_run[0] == run_time else 0
+
+    def _last_sync_time(self, sync_type: SyncType) -> Optional[datetime]:
+        task = self.sync_service.sync_task_repo.get_task(sync_type)
+        return task.last_sync_time if task else None
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[SyncType]:
+        """
+        执行所有到期的同步类型
+
+        Returns:
+            本轮执行的同步类型，同步锁被占用或没有到期的类型时为空
+        """
+        now = now or self._clock()
+        due = self.due_types(now)
+        if not due:
+            return []
+        if not self.lock.acquire():
+            self.logger.info(f"其他进程正在同步，跳过本轮: {[sync_type.value for sync_type in due]}")
+            return []
+        try:
+            self.logger.info(f"开始同步到期的类型: {[sync_type.value for sync_type in due]}")
+            before = {sync_type: self._last_sync_time(sync_type) for sync_type in due}
+            try:
+                self.sync_service.sync_all(due, force=True)
+            except Exception as e:
+                self.logger.error(f"同步失败: {e}")
+            # 同步完成时间没有更新的类型（本身失败或依赖失败）等待 retry_interval 后重试；
+            # 同步完成但数据仍不是最新的类型（数据源尚未入库）同样等待后重试，次数有上限
+            calendar = TradingCalendar.load(self.db_path)
+            for sync_type in due:
+                run_time = self.last_run_time(sync_type, now, calendar)
+                if self._last_sync_time(sync_type) == before[sync_type]:
+                    self._failed_at[sync_type] = now
+                elif self._is_stale(sync_type, run_time, calendar):
+                    count = self._stale_count(sync_type, run_time) + 1
+                    self._stale_runs[sync_type] = (run_time, count)
+                    self._failed_at[sync_type] = now
+                    self.logger.warning(f"{sync_type.value} 同步后数据仍不是最新，第 {count} 次，"
+                                        f"最多重试 {self.max_stale_retries} 次")
+                else:
+                    self._failed_at.pop(sync_type, None)
+                    self._stale_runs.pop(sync_type, None)
+        finally:
+            self.lock.release()
+        return due
+
+    def run_forever(self):
+        """循环检查并执行到期的同步，直到调用 stop"""
+        self.logger.info("同步调度器启动")
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                self.logger.error(f"调度检查失败: {e}")
+            self._stop.wait(self.poll_interval)
+        self.logger.info("同步调度器停止")
+
+    def stop(self):
+        """让 run_forever 在当前一轮结束后退出"""
+        self._stop.set()
+
+    def _expected_trade_date(self, run_day: date, calendar: TradingCalendar) -> date:
+        """在 run_day 触发的同步应同步到的交易日"""
+        if self.sync_service.include_today:
+            return run_day
+        if calendar.covers(run_day):
+            return calendar.prev_trading_day(run_day) or run_day - timedelta(days=1)
+        day = run_day - timedelta(days=1)
+        while day.weekday() >= 5:
+            day -= timedelta(days=1)
+        return day
+
+    def freshness(self, now: Optional[datetime] = None) -> List[DatasetFreshness]:
+        """
+        各数据集的新鲜度
+
+        数据在触发时间加 SLA 之后仍未同步完成即不满足时效：所有类型都要求最后一次同步晚于该触发时间，
+        按交易日组织的数据集还要求表中最新交易日不早于该次触发应同步到的交易日
+        （同步服务 include_today 时为触发当天，否则为触发当天之前的交易日）。
+
+        Returns:
+            按时间表顺序排列的各数据集新鲜度
+        """
+        now = now or self._clock()
+        calendar = TradingCalendar.load(self.db_path)
+        repository = FreshnessRepository(self.db_path)
+        result = []
+        for sync_type, schedule in self.schedule.items():
+            latest_date = self._latest_date(sync_type, repository)
+            last_sync_time = self._last_sync_time(sync_type)
+            deadline_run = self.last_run_time(sync_type, now - schedule.sla, calendar)
+            expected_date = None
+            if deadline_run and sync_type in TRADE_DATE_DATASETS:
+                expected_date = self._expected_trade_date(deadline_run.date(), calendar)
+            is_fresh = deadline_run is None or (last_sync_time is not None and last_sync_time >= deadline_run)
+            if expected_date is not None:
+                is_fresh = is_fresh and latest_date is not None and latest_date >= expected_date
+            result.append(DatasetFreshness(sync_type, latest_date, last_sync_time, expected_date, is_fresh))
+        return result
@@ -1,9 +1,16 @@
-from typing import Dict, Type
+import time
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Tuple, Type
+import pandas as pd
 
 from pandas.io.sql import re
 from tushare import stock
 from .sync_type import SyncType
 from .sync_task_repository import SyncTaskRepository
+from .sync_watermark_repository import SyncWatermarkRepository
+from .sync_checkpoint_repository import SyncCheckpointRepository
+from .ingestion_pipeline import IngestionPipeline
 from .stock_fetchers import AShareFetcher
 from .daily_quote_fetcher import DailyQuoteFetcher
 from .dividend_fetcher import DividendFetcher
@@ -15,13 +22,98 @@ from datetime import date, timedelta
 from .daily_quote_repository import DailyQuoteRepository
 from .dividend_repository import DividendRepository
 from .financial_report_repository import FinancialReportRepository
+from .trade_calendar_fetcher import TradeCalendarFetcher
+from .adj_factor_fetcher import AdjFactorFetcher
+from .adj_factor_repository import AdjFactorRepository
+from .parquet_daily_quote_repository import ParquetDailyQuoteRepository
+from .parquet_daily_indicator_repository import ParquetDailyIndicatorRepository
+from .trade_calendar_repository import TradeCalendarRepository
+from .trading_calendar import TradingCalendar
+from .sync_session import SyncSession
+from .sqlite_repository import UpsertResult
+from .sync_metrics import SyncMetrics
+from .tushare_api import TushareAPI
 import logging
 
 class BaseSync:
-    def __init__(self, db_path: str, tushare_token: str):
+    sync_type: SyncType = None
+    
+    def __init__(self, db_path: str, tushare_token: str,
+                 concurrency: int = 1, queue_size: int = 16, batch_size: int = 5000,
+                 metrics: SyncMetrics = None, include_today: bool = False, parquet_dir: str = None):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            tushare_token: Tushare API token
+            concurrency: 逐只股票拉取时的并发拉取线程数，大于1时使用并发拉取/单线程写入流水线
+            queue_size: 流水线中已拉取待写入结果的队列长度上限（背压）
+            batch_size: 逐只股票拉取时每个写入事务累积的最少记录数
+            metrics: 记录数据库写入指标，默认使用与 TushareAPI 共享的指标
+            include_today: 按交易日同步的数据是否截止到今天（收盘后数据入库之后运行时），默认截止到昨天
+            parquet_dir: 设置时日行情和每日指标保存到该目录下的 Parquet 文件，而不是 SQLite
+        """
         self.db_path = db_path
         self.tushare_token = tushare_token
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.include_today = include_today
+        self.parquet_dir = parquet_dir
+        self.metrics = metrics if metrics is not None else TushareAPI.get_metrics()
         self.logger = logging.getLogger(__name__)
+        # 同步运行期间的数据库会话，运行之外为None
+        self.session: SyncSession = None
+        self._repositories = {}
+    
+    def _repository(self, repository_class):
+        """取得数据仓库：同步运行期间绑定到会话的连接，否则每次操作单独连接"""
+        if self.session is not None:
+            return self.session.repository(repository_class)
+        if repository_class not in self._repositories:
+            self._repositories[repository_class] = repository_class(self.db_path)
+        return self._repositories[repository_class]
+    
+    def _data_repository(self, repository_class, parquet_repository_class=None):
+        """
+        取得时间序列数据仓库：设置了 parquet_dir 且有 Parquet 实现时使用 Parquet，否则使用 SQLite
+        
+        Parquet 文件的写入不在会话的事务中，每次写入后即可见。提交前中断时高水位和检查点没有前移，
+        重新同步会再次写入相同的记录，按主键合并后不会重复。
+        """
+        if self.parquet_dir and parquet_repository_class is not None:
+            if parquet_repository_class not in self._repositories:
+                self._repositories[parquet_repository_class] = parquet_repository_class(self.parquet_dir)
+            return self._repositories[parquet_repository_class]
+        return self._repository(repository_class)
+    
+    @property
+    def watermark_repo(self) -> SyncWatermarkRepository:
+        return self._repository(SyncWatermarkRepository)
+    
+    @property
+    def checkpoint_repo(self) -> SyncCheckpointRepository:
+        return self._repository(SyncCheckpointRepository)
+    
+    def _commit(self):
+        """提交会话中累积的写入（数据、高水位和检查点在同一个事务中），提交耗时计入写入指标"""
+        if self.session is not None:
+            start = time.perf_counter()
+            self.session.commit()
+            self.metrics.record_write(self.sync_type.value, time.perf_counter() - start, 0)
+    
+    def _save(self, save: Callable[[list], UpsertResult], rows) -> UpsertResult:
+        """
+        写入一批记录，记录写入耗时、提交的行数和实际写入的行数
+        
+        Args:
+            save: 数据仓库的 save_many 或 save_frame
+            rows: 记录列表或 DataFrame
+        """
+        start = time.perf_counter()
+        result = save(rows)
+        written = result.written if isinstance(result, UpsertResult) else None
+        self.metrics.record_write(self.sync_type.value, time.perf_counter() - start, len(rows), written)
+        return result
         
     def _filter_stocks(self, stock_list: list, ts_codes: list[str] = None) -> list:
         """过滤股票列表
@@ -37,94 +129,562 @@ class BaseSync:
             return stock_list
         return [stock for stock in stock_list if stock.ts_code in ts_codes]
     
+    def _load_watermarks(self) -> Dict[str, date]:
+        """加载各股票的高水位，首次使用时从已保存的数据中初始化"""
+        watermarks = self.watermark_repo.get_watermarks(self.sync_type)
+        if not watermarks:
+            watermarks = self._seed_watermarks()
+            if watermarks:
+                self.watermark_repo.update_watermarks(self.sync_type, watermarks)
+                self._commit()
+        return watermarks
+    
+    def _seed_watermarks(self) -> Dict[str, date]:
+        """从已保存的数据推导高水位，由子类实现"""
+        return {}
+    
+    def _start_date(self, stock, watermarks: Dict[str, date]) -> date:
+        """增量同步的起始日期：高水位的下一天，没有高水位时从上市日期开始"""
+        watermark = watermarks.get(stock.ts_code)
+        return watermark + timedelta(days=1) if watermark else stock.list_date
+    
+    def _record_watermarks(self, committed: List[Tuple[object, list]], date_of: Callable):
+        """根据已写入的记录更新各股票的高水位"""
+        watermarks = {}
+        for stock, rows in committed:
+            dates = [date_of(row) for row in rows if date_of(row)]
+            if dates:
+                watermarks[stock.ts_code] = max(dates)
+        if watermarks:
+            self.watermark_repo.update_watermarks(self.sync_type, watermarks)
+    
+    def _trading_calendar(self) -> TradingCalendar:
+        """获取共享的交易日历，交易日历同步提交后会重新加载"""
+        return TradingCalendar.load(self.db_path)
+    
+    def _end_date(self) -> date:
+        """按交易日同步的截止自然日：昨天，include_today 时为今天"""
+        return date.today() if self.include_today else date.today() - timedelta(days=1)
+    
+    def _last_trading_day(self, calendar: TradingCalendar) -> date:
+        """按交易日同步的截止日期：截止自然日及之前最近的交易日，交易日历未覆盖时为截止自然日"""
+        end_date = self._end_date()
+        if not calendar.covers(end_date) or calendar.is_trading_day(end_date):
+            return end_date
+        return calendar.prev_trading_day(end_date) or end_date
+    
+    def _run_key(self) -> str:
+        """
+        本轮同步的标识，检查点只在同一轮次内有效
+
+        第一次调用时以同步截止日期开始新的轮次并持久化，之后直到 complete 都沿用该轮次，
+        中断后跨过截止日期（如过了午夜）再恢复时不会丢弃已有的检查点。
+        """
+        return self.checkpoint_repo.start_run(self.sync_type, self._end_date().isoformat())
+    
+    def _run_per_stock(self, stock_list: list, fetch: Callable[[object], list],
+                       save: Callable[[list], None],
+                       on_committed: Callable[[List[Tuple[object, list]]], None] = None):
+        """
+        逐只股票拉取并保存数据
+        
+        concurrency 为1时串行执行；大于1时交给 IngestionPipeline 并发拉取、由当前线程批量写入。
+        两种方式都累积到 batch_size 条记录后写入一批，数据、高水位和检查点在同一个事务中提交，
+        中断后重新执行时跳过本轮已提交的股票。
+        
+        Args:
+            stock_list: 股票列表
+            fetch: 拉取单只股票数据的函数
+            save: 批量保存数据的函数
+            on_committed: 数据写入后的回调，参数为 (股票, 记录列表) 列表
+        """
+        save = partial(self._save, save)
+        run_key = self._run_key()
+        done_codes = self.checkpoint_repo.get_done_codes(self.sync_type, run_key)
+        if done_codes:
+            self.logger.info(f"{self.sync_type.value} 从检查点恢复，跳过已完成的 {len(done_codes)} 只股票")
+            stock_list = [stock for stock in stock_list if stock.ts_code not in done_codes]
+
+        def committed_callback(committed: List[Tuple[object, list]]):
+            if on_committed:
+                on_committed(committed)
+            self.checkpoint_repo.mark_done(self.sync_type, [stock.ts_code for stock, _ in committed], run_key)
+            self._commit()
+
+        if self.concurrency <= 1:
+            self._run_serial(stock_list, fetch, save, committed_callback)
+            return
+        pipeline = IngestionPipeline(
+            fetch=fetch,
+            save=save,
+            concurrency=self.concurrency,
+            queue_size=self.queue_size,
+            batch_size=self.batch_size,
+            on_committed=committed_callback
+        )
+        pipeline.run(stock_list)
+    
+    def _run_serial(self, stock_list: list, fetch: Callable[[object], list], save: Callable[[list], None],
+                    committed_callback: Callable[[List[Tuple[object, list]]], None]):
+        """串行拉取，累积到 batch_size 条记录后与高水位、检查点一起写入并提交"""
+        pending: List[Tuple[object, list]] = []
+        pending_rows = 0
+
+        def flush(batch: List[Tuple[object, list]]):
+            # 调用前已从 pending 取出本批，写入失败时不会再次写入，也不会回调
+            rows = [row for _, stock_rows in batch for row in stock_rows]
+            if rows:
+                save(rows)
+            committed_callback(batch)
+
+        for stock in stock_list:
+            try:
+                rows = fetch(stock)
+            except Exception:
+                # 先提交已拉取的股票，重新执行时从检查点继续
+                if pending:
+                    batch, pending = pending, []
+                    flush(batch)
+                raise
+            pending.append((stock, rows))
+            pending_rows += len(rows)
+            if pending_rows >= self.batch_size:
+                batch, pending, pending_rows = pending, [], 0
+                flush(batch)
+        if pending:
+            batch, pending = pending, []
+            flush(batch)
+    
+    def complete(self):
+        """同步任务全部完成，清除检查点"""
+        self.checkpoint_repo.clear(self.sync_type)
+    
     def fetch_and_save(self, ts_codes: list[str] = None):
-        """获取数据并保存"""
+        """
+        获取数据并保存
+        
+        整个运行使用一个 SyncSession：所有数据仓库共用一个连接、只建表一次，
+        正常结束时提交剩余的写入，出错时回滚未提交的写入。
+        
+        Args:
+            ts_codes: 只同步这些股票，为空时同步全部
+        """
+        with SyncSession(self.db_path) as session:
+            self.session = session
+            try:
+                self._fetch_and_save(ts_codes)
+            finally:
+                self.session = None
+    
+    def _fetch_and_save(self, ts_codes: list[str] = None):
+        """获取数据并保存，由子类实现"""
         raise NotImplementedError
 
 class StockListSync(BaseSync):
-    def fetch_and_save(self, ts_codes: list[str] = None):
+    sync_type = SyncType.STOCK_LIST
+    
+    def _fetch_and_save(self, ts_codes: list[str] = None):
         """获取股票列表数据并保存"""
         self.logger.info("获取股票列表数据并保存")
         fetcher = AShareFetcher(self.tushare_token)
         stock_list = fetcher.fetch_stock_list()
         filtered_stock_list = self._filter_stocks(stock_list, ts_codes)
-        repository = StockRepository(self.db_path)
-        repository.save_many(filtered_stock_list)
+        repository = self._repository(StockRepository)
+        self._save(repository.save_many, filtered_stock_list)
 
-class DailyQuoteSync(BaseSync):
+class TradeCalendarSync(BaseSync):
+    sync_type = SyncType.TRADE_CALENDAR
+    
+    # 上交所交易日历的起始日期
+    CALENDAR_START = date(1990, 12, 19)
+    
     def fetch_and_save(self, ts_codes: list[str] = None):
+        """获取交易日历并保存，结束后丢弃共享的交易日历，下次使用时重新加载"""
+        try:
+            super().fetch_and_save(ts_codes)
+        finally:
+            TradingCalendar.invalidate(self.db_path)
+    
+    def _fetch_and_save(self, ts_codes: list[str] = None):
+        """
+        获取交易日历并保存：从已保存日历之后（已保存到今天之后时从今天）到明年年底
+        
+        交易所会提前公布下一年的休市安排，但临时休市会修改已公布的日期，因此今天及之后的日期每次都重新获取。
+        """
+        self.logger.info("获取交易日历并保存")
+        repository = self._repository(TradeCalendarRepository)
+        saved_range = repository.find_date_range()
+        today = date.today()
+        start_date = min(saved_range[1] + timedelta(days=1), today) if saved_range else self.CALENDAR_START
+        end_date = date(today.year + 1, 12, 31)
+        if start_date > end_date:
+            return
+        self._save(repository.save_many,
+                   TradeCalendarFetcher(self.tushare_token).fetch_trade_calendar(start_date, end_date))
+
+class DailyQuoteSync(BaseSync):
+    sync_type = SyncType.DAILY_QUOTE
+    repository_class = DailyQuoteRepository
+    parquet_repository_class = ParquetDailyQuoteRepository
+    
+    def __init__(self, db_path: str, tushare_token: str, by_trade_date: bool = True, **kwargs):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            tushare_token: Tushare API token
+            by_trade_date: 是否按交易日截面同步（每个缺失交易日调用一次接口），
+                          为False时按股票逐只拉取高水位之后的数据
+            **kwargs: 传给 BaseSync 的并发参数
+        """
+        super().__init__(db_path, tushare_token, **kwargs)
+        self.by_trade_date = by_trade_date
+
+    def _seed_watermarks(self) -> Dict[str, date]:
+        return self._data_repository(self.repository_class, self.parquet_repository_class).find_latest_trade_dates()
+
+    def _create_fetcher(self):
+        return DailyQuoteFetcher(self.tushare_token)
+
+    def _fetch_by_stock(self, fetcher, ts_code: str, start_date: date, end_date: date) -> list:
+        """拉取单只股票一段时间的数据"""
+        return fetcher.fetch_daily_quotes(ts_code, start_date, end_date)
+
+    def _fetch_frame_by_trade_date(self, fetcher, trade_date: date) -> pd.DataFrame:
+        """拉取一个交易日的全市场截面"""
+        return fetcher.fetch_daily_quotes_frame_by_trade_date(trade_date)
+
+    def _fetch_and_save(self, ts_codes: list[str] = None):
         """获取每日行情数据并保存"""
-        self.logger.info("获取每日行情数据并保存")
-        stock_repo = StockRepository(self.db_path)
+        self.logger.info(f"获取 {self.sync_type.value} 数据并保存")
+        stock_repo = self._repository(StockRepository)
         stock_list = stock_repo.find_all()
         filtered_stock_list = self._filter_stocks(stock_list, ts_codes)
-        fetcher = DailyQuoteFetcher(self.tushare_token)
-        yesterday = date.today() - timedelta(days=1)
-        for stock in filtered_stock_list:
-            daily_quotes = fetcher.fetch_daily_quotes(stock.ts_code, stock.list_date, yesterday)
-            repository = DailyQuoteRepository(self.db_path)
-            repository.save_many(daily_quotes)
+        fetcher = self._create_fetcher()
+        repository = self._data_repository(self.repository_class, self.parquet_repository_class)
+        watermarks = self._load_watermarks()
+        calendar = self._trading_calendar()
+        # 截止到最近一个交易日，高水位已到该交易日的股票不再发起请求
+        end_date = self._last_trading_day(calendar)
+        if not self.by_trade_date:
+            self._sync_by_stock(fetcher, repository, filtered_stock_list, watermarks, end_date)
+            return
+
+        # 已有数据的股票按交易日截面增量同步，新上市（无任何数据）的股票逐只拉取历史
+        synced_codes = repository.find_ts_codes()
+        new_stocks = [stock for stock in filtered_stock_list if stock.ts_code not in synced_codes]
+        synced_stocks = [stock for stock in filtered_stock_list if stock.ts_code in synced_codes]
+        latest_trade_date = repository.find_latest_trade_date()
+        if synced_stocks and latest_trade_date:
+            # 截面从最落后的股票的高水位开始（之前只同步过部分股票时，其他股票落后于全表最新交易日），
+            # 没有高水位的股票按全表最新交易日计
+            synced_watermarks = {stock.ts_code: watermarks.get(stock.ts_code) or latest_trade_date
+                                 for stock in synced_stocks}
+            trade_dates = self._missing_trade_dates(calendar, min(synced_watermarks.values()), end_date)
+            if len(trade_dates) <= len(synced_stocks):
+                self._sync_by_trade_date(fetcher, repository, synced_stocks, trade_dates, synced_watermarks)
+            else:
+                # 缺口天数多于股票数时，逐只拉取的调用次数更少
+                self._sync_by_stock(fetcher, repository, synced_stocks, synced_watermarks, end_date)
+        self._sync_by_stock(fetcher, repository, new_stocks, watermarks, end_date)
+
+    def _missing_trade_dates(self, calendar: TradingCalendar, latest_trade_date: date, end_date: date) -> list[date]:
+        """
+        计算最新已保存交易日之后到end_date之间的交易日，
+        交易日历未覆盖时退回为跳过周末的所有工作日
+        """
+        current_date = latest_trade_date + timedelta(days=1)
+        if current_date > end_date:
+            return []
+        if calendar.covers(current_date, end_date):
+            return calendar.trading_days(current_date, end_date)
+        trade_dates = []
+        while current_date <= end_date:
+            if current_date.weekday() < 5:
+                trade_dates.append(current_date)
+            current_date += timedelta(days=1)
+        return trade_dates
+
+    def _sync_by_trade_date(self, fetcher, repository, stock_list: list, trade_dates: list[date],
+                            watermarks: Dict[str, date] = None):
+        """
+        按交易日拉取全市场截面，过滤后整批写入（直接写入 DataFrame，不逐行构造对象），
+        每个交易日只写入高水位早于该日的股票
+
+        截面非空时该日所有待同步股票的高水位都推进到该日：停牌的股票不在截面中，
+        否则它的高水位停在停牌前，之后每次同步都要从停牌日重新拉取截面。
+        截面为空（数据尚未发布）时不推进。
+        """
+        watermarks = watermarks or {}
+        for trade_date in trade_dates:
+            wanted_codes = {stock.ts_code for stock in stock_list
+                            if watermarks.get(stock.ts_code) is None or watermarks[stock.ts_code] < trade_date}
+            df = self._fetch_frame_by_trade_date(fetcher, trade_date)
+            if df.empty:
+                continue
+            self._save(repository.save_frame, df[df['ts_code'].isin(wanted_codes)])
+            self.watermark_repo.update_watermarks(self.sync_type, {ts_code: trade_date for ts_code in wanted_codes})
+            self._commit()
+
+    def _sync_by_stock(self, fetcher, repository, stock_list: list, watermarks: Dict[str, date], end_date: date):
+        """逐只股票拉取高水位之后（没有高水位时自上市以来）的数据"""
+        self._run_per_stock(
+            [stock for stock in stock_list if self._start_date(stock, watermarks) <= end_date],
+            fetch=lambda stock: self._fetch_by_stock(
+                fetcher, stock.ts_code, self._start_date(stock, watermarks), end_date),
+            save=repository.save_many,
+            on_committed=lambda committed: self._record_watermarks(committed, lambda row: row.trade_date)
+        )
+
+class AdjFactorSync(DailyQuoteSync):
+    """复权因子同步，与日行情一样按交易日截面增量同步，新股逐只回补"""
+    sync_type = SyncType.ADJ_FACTOR
+    repository_class = AdjFactorRepository
+    parquet_repository_class = None
+
+    def _create_fetcher(self):
+        return AdjFactorFetcher(self.tushare_token)
+
+    def _fetch_by_stock(self, fetcher, ts_code: str, start_date: date, end_date: date) -> list:
+        return fetcher.fetch_adj_factors(ts_code, start_date, end_date)
+
+    def _fetch_frame_by_trade_date(self, fetcher, trade_date: date) -> pd.DataFrame:
+        return fetcher.fetch_adj_factors_frame_by_trade_date(trade_date)
 
 class DailyIndicatorSync(BaseSync):
-    def fetch_and_save(self, ts_codes: list[str] = None):
+    sync_type = SyncType.DAILY_INDICATOR
+    
+    def _seed_watermarks(self) -> Dict[str, date]:
+        return self._data_repository(DailyIndicatorRepository, ParquetDailyIndicatorRepository).find_latest_trade_dates()
+
+    def _fetch_and_save(self, ts_codes: list[str] = None):
         """获取每日指标数据并保存"""
         self.logger.info("获取每日指标数据并保存")
-        stock_repo = StockRepository(self.db_path)
+        stock_repo = self._repository(StockRepository)
         stock_list = stock_repo.find_all()
         filtered_stock_list = self._filter_stocks(stock_list, ts_codes)
         fetcher = DailyIndicatorFetcher(self.tushare_token)
-        yesterday = date.today() - timedelta(days=1)
-        for stock in filtered_stock_list:
-            daily_indicators = fetcher.fetch_daily_indicators(stock.ts_code, stock.list_date, yesterday)
-            repository = DailyIndicatorRepository(self.db_path)
-            repository.save_many(daily_indicators)
+        repository = self._data_repository(DailyIndicatorRepository, ParquetDailyIndicatorRepository)
+        watermarks = self._load_watermarks()
+        end_date = self._last_trading_day(self._trading_calendar())
+        self._run_per_stock(
+            [stock for stock in filtered_stock_list if self._start_date(stock, watermarks) <= end_date],
+            fetch=lambda stock: fetcher.fetch_daily_indicators(
+                stock.ts_code, self._start_date(stock, watermarks), end_date),
+            save=repository.save_many,
+            on_committed=lambda committed: self._record_watermarks(committed, lambda ind: ind.trade_date)
+        )
 
 class DividendSync(BaseSync):
-    def fetch_and_save(self, ts_codes: list[str] = None):
+    sync_type = SyncType.DIVIDEND
+    
+    # 全市场按公告窗口同步的高水位记在这个代码下，表示该日期之前的公告和除权除息都已同步
+    WINDOW_WATERMARK_KEY = '*'
+    
+    def __init__(self, db_path: str, tushare_token: str, by_window: bool = True, **kwargs):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            tushare_token: Tushare API token
+            by_window: 是否按公告日/除权除息日窗口增量同步全市场分红（每天调用两次dividend接口），
+                       为False或尚未完成过全量回补时按股票逐只拉取全部历史
+            **kwargs: 传给 BaseSync 的并发参数
+        """
+        super().__init__(db_path, tushare_token, **kwargs)
+        self.by_window = by_window
+    
+    def _fetch_and_save(self, ts_codes: list[str] = None):
         """获取分红数据并保存"""
         self.logger.info("获取分红数据并保存")
-        stock_repo = StockRepository(self.db_path)
+        stock_repo = self._repository(StockRepository)
         stock_list = stock_repo.find_all()
         filtered_stock_list = self._filter_stocks(stock_list, ts_codes)
         fetcher = DividendFetcher(self.tushare_token)
+        repository = self._repository(DividendRepository)
         yesterday = date.today() - timedelta(days=1)
-        for stock in filtered_stock_list:
-            dividends = fetcher.fetch_dividends(stock.ts_code)
-            repository = DividendRepository(self.db_path)
-            repository.save_many(dividends)
+        window_watermark = self.watermark_repo.get_watermark(self.sync_type, self.WINDOW_WATERMARK_KEY)
+        if self.by_window and window_watermark:
+            window_dates = self._window_dates(window_watermark, yesterday)
+            # 每个窗口日两次调用，缺口天数多到超过逐只拉取的调用次数时改为逐只回补
+            if 2 * len(window_dates) <= len(filtered_stock_list):
+                self._sync_by_window(fetcher, repository, window_dates, ts_codes)
+                return
+        self._sync_by_stock(fetcher, repository, filtered_stock_list)
+        # 只有全市场回补完成后窗口高水位才有意义
+        if not ts_codes and filtered_stock_list:
+            self.watermark_repo.update_watermark(self.sync_type, self.WINDOW_WATERMARK_KEY, yesterday)
+    
+    def _window_dates(self, window_watermark: date, end_date: date) -> list[date]:
+        """窗口高水位之后到end_date之间的每一天（公告可能在周末发布，不跳过）"""
+        return [window_watermark + timedelta(days=offset)
+                for offset in range(1, (end_date - window_watermark).days + 1)]
+    
+    def _sync_by_window(self, fetcher: DividendFetcher, repository: DividendRepository,
+                        window_dates: list[date], ts_codes: list[str] = None):
+        """按天拉取全市场当天公告和当天除权除息的分红，只写入有变化的记录"""
+        wanted_codes = set(ts_codes) if ts_codes else None
+        for window_date in window_dates:
+            dividends = fetcher.fetch_dividends_by_date(ann_date=window_date) + \
+                fetcher.fetch_dividends_by_date(ex_date=window_date)
+            if wanted_codes is not None:
+                dividends = [dividend for dividend in dividends if dividend.ts_code in wanted_codes]
+            result = self._save(repository.save_many, dividends)
+            self.logger.info(f"同步 {window_date} 的分红公告和除权除息，{len(dividends)} 条中新增 {result.inserted} 条，"
+                             f"更新 {result.updated} 条")
+            if wanted_codes is None:
+                self.watermark_repo.update_watermark(self.sync_type, self.WINDOW_WATERMARK_KEY, window_date)
+            self._commit()
+    
+    def _sync_by_stock(self, fetcher: DividendFetcher, repository: DividendRepository, stock_list: list):
+        """逐只股票拉取全部分红历史，用于首次回补"""
+        self._run_per_stock(
+            stock_list,
+            fetch=lambda stock: fetcher.fetch_dividends(stock.ts_code),
+            save=repository.save_many
+        )
 
 class FinancialReportSync(BaseSync):        
-    def fetch_and_save(self, ts_codes: list[str] = None):
+    sync_type = SyncType.FINANCIAL_REPORT
+    
+    # 各报告期（月, 日）的法定披露截止日期：一季报4月底，半年报8月底，三季报10月底，年报次年4月底
+    ANNOUNCEMENT_DEADLINES = {(3, 31): (0, 4, 30), (6, 30): (0, 8, 31), (9, 30): (0, 10, 31), (12, 31): (1, 4, 30)}
+    
+    def __init__(self, db_path: str, tushare_token: str, by_period: bool = False,
+                 history_start: date = date(1990, 1, 1), grace_days: int = 30, **kwargs):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            tushare_token: Tushare API token
+            by_period: 是否按报告期同步（每个报告期每张报表调用一次 *_vip 接口拉取全市场数据），
+                       为False时按股票逐只拉取公告日期高水位之后的数据
+            history_start: 按报告期同步时回补历史的起始日期
+            grace_days: 披露截止日期之后仍视为未结束的天数，用于接收更正和延迟披露
+            **kwargs: 传给 BaseSync 的并发参数
+        """
+        super().__init__(db_path, tushare_token, **kwargs)
+        self.by_period = by_period
+        self.history_start = history_start
+        self.grace_days = grace_days
+    
+    def _seed_watermarks(self) -> Dict[str, date]:
+        # 财报接口的start_date/end_date按公告日期过滤，因此以公告日期作为高水位
+        return self._repository(FinancialReportRepository).find_latest_ann_dates()
+
+    def _fetch_and_save(self, ts_codes: list[str] = None):
         """获取财报数据并保存"""
         self.logger.info("获取财报数据并保存")
-        stock_repo = StockRepository(self.db_path)
+        fetcher = FinancialReportFetcher(self.tushare_token)
+        repository = self._repository(FinancialReportRepository)
+        if self.by_period:
+            self._sync_by_period(fetcher, repository, ts_codes)
+            return
+
+        stock_repo = self._repository(StockRepository)
         stock_list = stock_repo.find_all()
         filtered_stock_list = self._filter_stocks(stock_list, ts_codes)
-        fetcher = FinancialReportFetcher(self.tushare_token)
+        watermarks = self._load_watermarks()
         yesterday = date.today() - timedelta(days=1)
-        for stock in filtered_stock_list:
-            reports = fetcher.fetch_financial_reports(stock.ts_code, stock.list_date, yesterday)
+
+        def fetch(stock) -> list:
+            reports = fetcher.fetch_financial_reports(stock.ts_code, self._start_date(stock, watermarks), yesterday)
             self.logger.info(f"获取财报数据并保存 {stock.ts_code}: reports\n: {repr(reports)}")
-            repository = FinancialReportRepository(self.db_path)
-            repository.save_many(reports)
+            return reports
+
+        self._run_per_stock(
+            [stock for stock in filtered_stock_list if self._start_date(stock, watermarks) <= yesterday],
+            fetch=fetch,
+            save=repository.save_many,
+            on_committed=lambda committed: self._record_watermarks(committed, lambda report: report.ann_date)
+        )
+
+    def _announcement_deadline(self, period: date) -> date:
+        """报告期的披露截止日期"""
+        years, month, day = self.ANNOUNCEMENT_DEADLINES[(period.month, period.day)]
+        return date(period.year + years, month, day)
+
+    def _periods_to_refresh(self, saved_periods: set, today: date) -> list[date]:
+        """
+        需要同步的报告期：披露仍在进行中（报告期已结束且未超过截止日期加宽限期）的报告期，
+        以及已经结束但还没有任何数据的历史报告期
+        """
+        periods = []
+        for year in range(self.history_start.year, today.year + 1):
+            for month, day in self.ANNOUNCEMENT_DEADLINES:
+                period = date(year, month, day)
+                if period < self.history_start or period >= today:
+                    continue
+                still_open = today <= self._announcement_deadline(period) + timedelta(days=self.grace_days)
+                if still_open or period not in saved_periods:
+                    periods.append(period)
+        return periods
+
+    def _sync_by_period(self, fetcher: FinancialReportFetcher, repository: FinancialReportRepository,
+                        ts_codes: list[str] = None):
+        """按报告期拉取全市场财报，只刷新仍在披露中的报告期和缺失的历史报告期"""
+        periods = self._periods_to_refresh(repository.find_report_dates(), date.today())
+        self.logger.info(f"按报告期同步财报，共 {len(periods)} 个报告期: {periods}")
+        wanted_codes = set(ts_codes) if ts_codes else None
+        for period in periods:
+            reports = fetcher.fetch_financial_reports_by_period(period)
+            if wanted_codes is not None:
+                reports = [report for report in reports if report.ts_code in wanted_codes]
+            self._save(repository.save_many, reports)
+            watermarks: Dict[str, date] = {}
+            for report in reports:
+                if report.ann_date and (report.ts_code not in watermarks or report.ann_date > watermarks[report.ts_code]):
+                    watermarks[report.ts_code] = report.ann_date
+            self.watermark_repo.update_watermarks(self.sync_type, watermarks)
+            self._commit()
 
 class SyncService:
-    def __init__(self, db_path: str, tushare_token: str, ts_codes: list[str] = None):
+    def __init__(self, db_path: str, tushare_token: str, ts_codes: list[str] = None,
+                 concurrency: int = 1, queue_size: int = 16, batch_size: int = 5000,
+                 financial_by_period: bool = False, dividend_by_window: bool = True,
+                 include_today: bool = False, parquet_dir: str = None):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            tushare_token: Tushare API token
+            ts_codes: 只同步这些股票，为空时同步全部
+            concurrency: 逐只股票拉取时的并发拉取线程数
+            queue_size: 待写入结果队列长度上限
+            batch_size: 每个写入事务累积的最少记录数
+            financial_by_period: 财报是否按报告期拉取全市场数据（需要 *_vip 接口权限）
+            dividend_by_window: 分红是否在全量回补之后按公告日/除权除息日窗口增量同步全市场数据
+            include_today: 行情、复权因子和每日指标是否同步到今天（收盘后运行时），默认到昨天
+            parquet_dir: 设置时日行情和每日指标保存为该目录下按年分区的 Parquet 文件
+        """
         self.sync_task_repo = SyncTaskRepository(db_path)
         self.ts_codes = ts_codes
+        self.include_today = include_today
+        self.parquet_dir = parquet_dir
+        self.timings: Dict[SyncType, float] = {}
+        # 接口调用指标由进程内所有 TushareAPI 实例共同记录，写入指标由各同步任务记录到同一实例
+        self.metrics = TushareAPI.get_metrics()
+        self.logger = logging.getLogger(__name__)
+        options = dict(concurrency=concurrency, queue_size=queue_size, batch_size=batch_size, metrics=self.metrics,
+                       include_today=include_today, parquet_dir=parquet_dir)
         self._fetcher_map = {
-            SyncType.STOCK_LIST: StockListSync(db_path, tushare_token),
-            SyncType.DAILY_INDICATOR: DailyIndicatorSync(db_path, tushare_token),
-            SyncType.DAILY_QUOTE: DailyQuoteSync(db_path, tushare_token),
-            SyncType.DIVIDEND: DividendSync(db_path, tushare_token),  # 更新这行
-            SyncType.FINANCIAL_REPORT: FinancialReportSync(db_path, tushare_token)  # 更新这行
+            SyncType.STOCK_LIST: StockListSync(db_path, tushare_token, **options),
+            SyncType.TRADE_CALENDAR: TradeCalendarSync(db_path, tushare_token, **options),
+            SyncType.DAILY_INDICATOR: DailyIndicatorSync(db_path, tushare_token, **options),
+            SyncType.DAILY_QUOTE: DailyQuoteSync(db_path, tushare_token, **options),
+            SyncType.ADJ_FACTOR: AdjFactorSync(db_path, tushare_token, **options),
+            SyncType.DIVIDEND: DividendSync(db_path, tushare_token, by_window=dividend_by_window, **options),
+            SyncType.FINANCIAL_REPORT: FinancialReportSync(
+                db_path, tushare_token, by_period=financial_by_period, **options)
         }
     
-    def sync(self, sync_type: SyncType):
-        """执行指定类型的同步任务"""
+    def sync(self, sync_type: SyncType, force: bool = False):
+        """
+        执行指定类型的同步任务
+        
+        Args:
+            sync_type: 同步类型
+            force: 为True时不检查同步间隔直接执行（由调度器按时间表决定是否需要同步）
+        """
         task = self.sync_task_repo.get_task(sync_type)
         
-        if not task or task.need_sync():
+        if force or not task or task.need_sync():
             fetcher = self._fetcher_map.get(sync_type)
             if not fetcher:
                 raise ValueError(f"未找到{sync_type.value}对应的数据获取器")
@@ -132,11 +692,86 @@ class SyncService:
             # 执行数据同步
             fetcher.fetch_and_save(self.ts_codes)
             
+            # 所有股票都已完成，清除检查点
+            fetcher.complete()
+            
             # 更新同步时间
             self.sync_task_repo.update_sync_time(sync_type)
     
-    def sync_all(self):
-        """执行所有同步任务"""
-        for sync_type in SyncType:
-            self.sync(sync_type)
-        # self.sync(SyncType.FINANCIAL_REPORT)
\ No newline at end of file
+    def sync_all(self, sync_types: list[SyncType] = None, max_workers: int = None,
+                 force: bool = False) -> Dict[SyncType, float]:
+        """
+        执行所有同步任务
+        
+        按 SyncType.dependencies 调度：依赖都完成后立即开始，互不依赖的同步类型并发执行，
+        共用进程内共享的接口限流配额。某个类型失败时，依赖它的类型不再执行，其余类型照常完成，
+        最后抛出第一个异常。
+        
+        开始时清空 self.metrics，结束时（包括失败时）将各接口调用和各同步类型写入的汇总表写入日志，
+        之后可用 metrics.format_summary 取得汇总表，用 export_metrics 导出本次运行的明细。
+        
+        Args:
+            sync_types: 要执行的同步类型，默认全部；不在其中的依赖视为已完成
+            max_workers: 同时执行的同步类型数上限，默认不限制
+            force: 为True时不检查各类型的同步间隔
+            
+        Returns:
+            各同步类型的耗时(秒)，同时保存在 self.timings
+        """
+        pending = list(sync_types or SyncType)
+        selected = set(pending)
+        self.timings = {}
+        self.metrics.reset()
+        finished, failed = set(), {}
+        with ThreadPoolExecutor(max_workers=max_workers or len(pending) or 1,
+                                thread_name_prefix='sync') as executor:
+            running = {}
+            while pending or running:
+                for sync_type in list(pending):
+                    dependencies = [dep for dep in sync_type.dependencies if dep in selected]
+                    if any(dep in failed for dep in dependencies):
+                        pending.remove(sync_type)
+                        failed[sync_type] = None
+                        self.logger.warning(f"{sync_type.value} 的依赖同步失败，跳过")
+                    elif all(dep in finished for dep in dependencies):
+                        pending.remove(sync_type)
+                        running[executor.submit(self._timed_sync, sync_type, force)] = sync_type
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sync_type = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        finished.add(sync_type)
+                    else:
+                        failed[sync_type] = error
+                        self.logger.error(f"{sync_type.value} 同步失败: {error}")
+        for sync_type, elapsed in self.timings.items():
+            self.logger.info(f"{sync_type.value} 同步耗时 {elapsed:.2f} 秒")
+        summary = self.metrics.format_summary(TushareAPI.get_rate_limiter())
+        self.logger.info(f"同步指标汇总:\n{summary}")
+        errors = [error for error in failed.values() if error is not None]
+        if errors:
+            raise errors[0]
+        return self.timings
+    
+    def export_metrics(self, path: str = None) -> str:
+        """
+        将本次运行的调用和写入指标导出为 JSON
+        
+        Args:
+            path: 传入时同时写入该文件
+            
+        Returns:
+            JSON 文本
+        """
+        return self.metrics.to_json(path, TushareAPI.get_rate_limiter())
+    
+    def _timed_sync(self, sync_type: SyncType, force: bool = False):
+        """执行同步并记录耗时（包括不需要同步时的检查）"""
+        start = time.perf_counter()
+        try:
+            self.sync(sync_type, force)
+        finally:
+            self.timings[sync_type] = time.perf_counter() - start
@@ -0,0 +1,67 @@
+import sqlite3
+from typing import Dict, Type, TypeVar
+from .sqlite_repository import SqliteRepository
+from .connection_manager import ConnectionManager
+
+R = TypeVar('R', bound=SqliteRepository)
+
+class SyncSession:
+    """
+    一次同步运行的数据库会话
+
+    整个运行期间只持有一个连接，每种数据仓库只创建一次（建表语句只执行一次），
+    所有仓库的写入都在这个连接上进行，由 commit 统一提交。
+    作为上下文管理器使用时，正常退出提交剩余的写入，异常退出回滚未提交的写入，最后关闭连接。
+    """
+
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            timeout: 等待其他连接释放写锁的时间(秒)，并发执行多个同步类型时各自的会话会争用写锁
+        """
+        self.db_path = db_path
+        # 会话持有自己的连接（不与其他仓库共用线程连接），同样使用 WAL 等 PRAGMA
+        self.connection = ConnectionManager(db_path, timeout=timeout).connect()
+        self._repositories: Dict[type, SqliteRepository] = {}
+        self.commits = 0
+
+    def repository(self, repository_class: Type[R]) -> R:
+        """
+        取得绑定到本会话连接的数据仓库，同一类型只创建一次
+
+        Args:
+            repository_class: SqliteRepository 的子类
+
+        Returns:
+            数据仓库实例
+        """
+        repository = self._repositories.get(repository_class)
+        if repository is None:
+            repository = repository_class(self.db_path, connection=self.connection)
+            self._repositories[repository_class] = repository
+        return repository
+
+    def commit(self):
+        """提交当前事务"""
+        self.connection.commit()
+        self.commits += 1
+
+    def rollback(self):
+        """回滚未提交的写入"""
+        self.connection.rollback()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> 'SyncSession':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
@@ -3,30 +3,16 @@ from typing import Optional
 import sqlite3
 from .sync_task import SyncTask
 from .sync_type import SyncType
+from .sqlite_repository import SqliteRepository
 
-class SyncTaskRepository:
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-        self._init_table()
-    
-    def _get_connection(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
-    
+class SyncTaskRepository(SqliteRepository):
     def _execute(self, sql: str, parameters: tuple = None):
-        with self._get_connection() as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             if parameters:
                 return cursor.execute(sql, parameters)
             return cursor.execute(sql)
     
-    def _init_table(self):
-        self._execute("""
-            CREATE TABLE IF NOT EXISTS sync_tasks (
-                sync_type TEXT PRIMARY KEY,
-                last_sync_time TIMESTAMP
-            )
-        """)
-    
     def get_task(self, sync_type: SyncType) -> Optional[SyncTask]:
         result = self._execute(
             "SELECT sync_type, last_sync_time FROM sync_tasks WHERE sync_type = ?",
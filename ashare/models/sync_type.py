@@ -3,11 +3,26 @@ from datetime import timedelta
 
 class SyncType(Enum):
     STOCK_LIST = ("stock_list", timedelta(days=7))         # 股票列表每周更新
+    TRADE_CALENDAR = ("trade_calendar", timedelta(days=7)) # 交易日历每周更新
     DAILY_INDICATOR = ("daily_indicator", timedelta(days=1)) # 每日指标每天更新
     DAILY_QUOTE = ("daily_quote", timedelta(days=1))       # 每日行情每天更新
+    ADJ_FACTOR = ("adj_factor", timedelta(days=1))         # 复权因子每天更新
     DIVIDEND = ("dividend", timedelta(days=1))             # 分红记录每周更新
     FINANCIAL_REPORT = ("financial_report", timedelta(days=7))  # 财报数据每季度更新
     
     def __init__(self, value: str, interval: timedelta):
         self._value_ = value
-        self.interval = interval
\ No newline at end of file
+        self.interval = interval
+    @property
+    def dependencies(self) -> tuple:
+        """必须在本类型之前完成的同步类型"""
+        return SYNC_DEPENDENCIES.get(self, ())
+
+# 逐只股票同步的类型都要先有股票列表，按交易日同步的类型还要先有交易日历，它们之间互不依赖
+SYNC_DEPENDENCIES = {
+    SyncType.DAILY_INDICATOR: (SyncType.STOCK_LIST, SyncType.TRADE_CALENDAR),
+    SyncType.DAILY_QUOTE: (SyncType.STOCK_LIST, SyncType.TRADE_CALENDAR),
+    SyncType.ADJ_FACTOR: (SyncType.STOCK_LIST, SyncType.TRADE_CALENDAR),
+    SyncType.DIVIDEND: (SyncType.STOCK_LIST,),
+    SyncType.FINANCIAL_REPORT: (SyncType.STOCK_LIST,),
+}
@@ -0,0 +1,48 @@
+from datetime import date
+from typing import Dict, Optional
+import sqlite3
+from .sync_type import SyncType
+from .sqlite_repository import SqliteRepository
+
+class SyncWatermarkRepository(SqliteRepository):
+    """按(同步类型, 股票代码)记录已保存数据的最新日期（高水位）"""
+
+    def get_watermark(self, sync_type: SyncType, ts_code: str) -> Optional[date]:
+        """查询指定股票的高水位，没有记录时返回None"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT watermark FROM sync_watermarks WHERE sync_type = ? AND ts_code = ?",
+                (sync_type.value, ts_code)
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def get_watermarks(self, sync_type: SyncType) -> Dict[str, date]:
+        """查询指定同步类型下所有股票的高水位"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT ts_code, watermark FROM sync_watermarks WHERE sync_type = ?",
+                (sync_type.value,)
+            ).fetchall()
+        return {ts_code: date.fromisoformat(watermark) for ts_code, watermark in rows}
+
+    def update_watermark(self, sync_type: SyncType, ts_code: str, watermark: date):
+        """更新单只股票的高水位"""
+        self.update_watermarks(sync_type, {ts_code: watermark})
+
+    def update_watermarks(self, sync_type: SyncType, watermarks: Dict[str, date]):
+        """
+        批量更新高水位，高水位只会前移不会回退
+
+        Args:
+            sync_type: 同步类型
+            watermarks: 股票代码 -> 已保存数据的最新日期
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO sync_watermarks (sync_type, ts_code, watermark)
+                VALUES (?, ?, ?)
+                ON CONFLICT(sync_type, ts_code) DO UPDATE SET watermark = MAX(watermark, excluded.watermark)
+                """,
+                [(sync_type.value, ts_code, watermark.isoformat()) for ts_code, watermark in watermarks.items()]
+            )
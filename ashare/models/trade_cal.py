@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass
+class TradeCal:
+    """交易所交易日历中的一天"""
+    exchange: str              # 交易所 SSE上交所 SZSE深交所
+    cal_date: date             # 日历日期
+    is_open: bool              # 是否交易日
+    pretrade_date: date        # 上一个交易日
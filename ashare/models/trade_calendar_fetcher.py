@@ -0,0 +1,49 @@
+from typing import List
+from datetime import date
+import pandas as pd
+
+from ashare.models.tushare_api import TushareAPI
+from ashare.models.frame_converter import frame_to_models
+from .trade_cal import TradeCal
+from ashare.logger.setup_logger import get_logger
+
+TRADE_CAL_FIELDS = 'exchange,cal_date,is_open,pretrade_date'
+
+def _to_bools(series: pd.Series) -> list:
+    """将 tushare 返回的 0/1 转换为 bool 列表"""
+    return [bool(int(value)) for value in series.tolist()]
+
+class TradeCalendarFetcher:
+    def __init__(self, api_token: str):
+        """
+        Args:
+            api_token: Tushare API token
+        """
+        self.api = TushareAPI(api_token)
+        self.logger = get_logger()
+        self.logger.info("初始化 TradeCalendarFetcher")
+
+    def fetch_trade_calendar(self, start_date: date, end_date: date, exchange: str = 'SSE') -> List[TradeCal]:
+        """
+        获取交易所在给定日期范围内的交易日历（包括非交易日）
+        
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+            exchange: 交易所，SSE上交所 SZSE深交所，A股两个交易所的交易日一致
+            
+        Returns:
+            List[TradeCal]: 交易日历列表
+        """
+        df = self.api.trade_cal(
+            exchange=exchange,
+            start_date=start_date.strftime('%Y%m%d'),
+            end_date=end_date.strftime('%Y%m%d'),
+            fields=TRADE_CAL_FIELDS
+        )
+        self.logger.info(f"获取 {exchange} 从 {start_date} 到 {end_date} 的交易日历, 共 {len(df)} 天")
+        return self._to_trade_cals(df)
+
+    def _to_trade_cals(self, df: pd.DataFrame) -> List[TradeCal]:
+        """将tushare返回的DataFrame转换为TradeCal对象列表"""
+        return frame_to_models(df, TradeCal, converters={'is_open': _to_bools})
@@ -0,0 +1,66 @@
+import sqlite3
+from datetime import date
+from typing import List, Optional, Tuple
+from .trade_cal import TradeCal
+from .sqlite_repository import SqliteRepository, UpsertResult
+
+class TradeCalendarRepository(SqliteRepository):
+    """交易日历数据仓库"""
+    
+    def save_many(self, days: List[TradeCal]) -> UpsertResult:
+        """
+        批量保存交易日历，内容未变化的记录不重写
+        
+        Returns:
+            UpsertResult: 新增、更新和未变化的记录数
+        """
+        with self._connect() as conn:
+            return self._upsert(conn, 'trade_calendar', ('exchange', 'cal_date', 'is_open', 'pretrade_date'),
+                                ('exchange', 'cal_date'), [
+                (
+                    day.exchange,
+                    day.cal_date.isoformat(),
+                    1 if day.is_open else 0,
+                    day.pretrade_date.isoformat() if day.pretrade_date else None
+                )
+                for day in days
+            ])
+    
+    def find_open_days(self, exchange: str = 'SSE') -> List[date]:
+        """
+        查询所有交易日
+        
+        Args:
+            exchange: 交易所
+            
+        Returns:
+            按日期升序排列的交易日列表
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT cal_date FROM trade_calendar WHERE exchange = ? AND is_open = 1 ORDER BY cal_date',
+                (exchange,)
+            )
+            return [date.fromisoformat(row[0]) for row in cursor.fetchall()]
+    
+    def find_date_range(self, exchange: str = 'SSE') -> Optional[Tuple[date, date]]:
+        """
+        查询已保存日历覆盖的日期范围
+        
+        Args:
+            exchange: 交易所
+            
+        Returns:
+            (最早日期, 最晚日期)，没有任何数据时返回None
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT MIN(cal_date), MAX(cal_date) FROM trade_calendar WHERE exchange = ?',
+                (exchange,)
+            )
+            row = cursor.fetchone()
+            if not row or not row[0]:
+                return None
+            return date.fromisoformat(row[0]), date.fromisoformat(row[1])
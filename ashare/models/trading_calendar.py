@@ -0,0 +1,102 @@
+import os
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from .trade_calendar_repository import TradeCalendarRepository
+
+class TradingCalendar:
+    """
+    交易日历查询
+
+    从本地数据库加载同步好的 Tushare trade_cal 数据，交易日按升序缓存在内存中，
+    查询用二分查找完成。只能回答已同步范围内的日期，范围之外的查询抛出 ValueError，
+    调用方可以先用 covers 判断，未覆盖时自行退回按自然日处理。
+    用 load 获取每个数据库共享的已加载实例，同步交易日历后由 invalidate 丢弃。
+    """
+
+    # (数据库文件绝对路径, 交易所) -> 已加载的日历，进程内共享
+    _cache: Dict[Tuple[str, str], 'TradingCalendar'] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, db_path: str, exchange: str = 'SSE', connection: Optional[sqlite3.Connection] = None):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            exchange: 交易所，A股两个交易所的交易日一致
+            connection: 共享的数据库连接，为None时单独打开连接
+        """
+        self.repository = TradeCalendarRepository(db_path, connection=connection)
+        self.exchange = exchange
+        self.reload()
+
+    @classmethod
+    def load(cls, db_path: str, exchange: str = 'SSE') -> 'TradingCalendar':
+        """
+        获取指定数据库的共享日历，首次使用时从数据库加载，之后直接复用
+
+        Args:
+            db_path: SQLite数据库文件路径
+            exchange: 交易所
+
+        Returns:
+            已加载的交易日历，调用方不应修改
+        """
+        key = (os.path.abspath(db_path), exchange)
+        with cls._cache_lock:
+            calendar = cls._cache.get(key)
+            if calendar is None:
+                calendar = cls._cache[key] = cls(db_path, exchange)
+            return calendar
+
+    @classmethod
+    def invalidate(cls, db_path: str):
+        """丢弃指定数据库的共享日历（交易日历同步提交之后调用），下次 load 时重新加载"""
+        path = os.path.abspath(db_path)
+        with cls._cache_lock:
+            for key in [key for key in cls._cache if key[0] == path]:
+                del cls._cache[key]
+
+    def reload(self):
+        """从数据库重新加载日历（同步之后调用）"""
+        self.first_date, self.last_date = self.repository.find_date_range(self.exchange) or (None, None)
+        self._open_days = self.repository.find_open_days(self.exchange)
+
+    def covers(self, start: date, end: Optional[date] = None) -> bool:
+        """日历是否覆盖 start 到 end（默认等于 start）之间的所有日期"""
+        end = end or start
+        return self.first_date is not None and self.first_date <= start and end <= self.last_date
+
+    def _check(self, day: date):
+        if not self.covers(day):
+            raise ValueError(f"交易日历未覆盖 {day}，已同步范围: {self.first_date} 至 {self.last_date}")
+
+    def is_trading_day(self, day: date) -> bool:
+        """指定日期是否为交易日"""
+        self._check(day)
+        pos = bisect_left(self._open_days, day)
+        return pos < len(self._open_days) and self._open_days[pos] == day
+
+    def next_trading_day(self, day: date) -> Optional[date]:
+        """指定日期之后（不含当天）的第一个交易日，超出已同步范围时返回None"""
+        self._check(day)
+        pos = bisect_right(self._open_days, day)
+        return self._open_days[pos] if pos < len(self._open_days) else None
+
+    def prev_trading_day(self, day: date) -> Optional[date]:
+        """指定日期之前（不含当天）的最后一个交易日，超出已同步范围时返回None"""
+        self._check(day)
+        pos = bisect_left(self._open_days, day)
+        return self._open_days[pos - 1] if pos > 0 else None
+
+    def trading_days(self, start: date, end: date) -> List[date]:
+        """
+        start 到 end 之间（包含两端）的所有交易日
+
+        Returns:
+            按日期升序排列的交易日列表
+        """
+        self._check(start)
+        self._check(end)
+        return self._open_days[bisect_left(self._open_days, start):bisect_right(self._open_days, end)]
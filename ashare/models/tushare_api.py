@@ -1,39 +1,158 @@
-from functools import wraps
 import time
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional
+import pandas as pd
 import tushare as ts
 from ashare.logger.setup_logger import get_logger
+from ashare.models.rate_limiter import RateLimiter, DEFAULT_CALLS_PER_MINUTE
+from ashare.models.response_cache import ResponseCache
+from ashare.models.retry_policy import RetryPolicy, ErrorKind, classify_error, retry_after_of
+from ashare.models.sync_metrics import SyncMetrics
+
+# 记录为调用主要参数的参数名，按顺序取第一个非空的
+METRIC_KEY_PARAMS = ('ts_code', 'trade_date', 'period', 'ann_date', 'ex_date')
 
 class TushareAPI:
-    def __init__(self, api_token: str, max_retries: int = 3, retry_delay: float = 60.0):
+    # 进程内共享的限流器，所有 fetcher 创建的 TushareAPI 实例共用同一份配额
+    _rate_limiter = RateLimiter()
+    # 进程内共享的调用指标
+    _metrics = SyncMetrics()
+    # 进程内替代 pro_api 的后端（如测试用的离线 FakeProApi），为 None 时按 token 创建真实客户端
+    _backend = None
+
+    def __init__(self, api_token: str, max_retries: int = 3, retry_delay: float = 1.0,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 max_retry_delay: float = 60.0,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[SyncMetrics] = None):
         """
         初始化 TushareAPI 包装类
-        
+
         Args:
             api_token: Tushare API token
             max_retries: 最大重试次数
-            retry_delay: 重试间隔时间(秒)
+            retry_delay: 临时错误首次重试的等待时间(秒)，之后指数退避
+            rate_limiter: 限流器，默认使用进程内共享的限流器
+            cache: 响应缓存，默认按 TUSHARE_CACHE_DIR/TUSHARE_CACHE_MODE 环境变量创建，未设置时不缓存
+            max_retry_delay: 重试等待时间上限(秒)
+            retry_policy: 重试策略，默认按 max_retries/retry_delay/max_retry_delay 创建
+            metrics: 调用指标，默认使用进程内共享的指标
         """
-        self.api = ts.pro_api(api_token)
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
+        self.cache = cache if cache is not None else ResponseCache.from_env()
+        # 回放模式永不访问网络，不需要创建 pro_api 客户端（也不需要有效的 token）
+        if self.cache and self.cache.replay_only:
+            self.api = None
+        elif TushareAPI._backend is not None:
+            self.api = TushareAPI._backend
+        else:
+            self.api = ts.pro_api(api_token)
+        # 限流错误需要等到配额恢复，退避起点取临时错误的10倍
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            base_delay=retry_delay,
+            max_delay=max_retry_delay,
+            rate_limit_delay=min(10 * retry_delay, max_retry_delay)
+        )
+        self.rate_limiter = rate_limiter or TushareAPI._rate_limiter
+        self.metrics = metrics if metrics is not None else TushareAPI._metrics
         self.logger = get_logger()
 
+    @classmethod
+    def configure_rate_limits(cls, quotas: Dict[str, float],
+                              default_calls_per_minute: float = DEFAULT_CALLS_PER_MINUTE,
+                              safety_factor: float = 0.9):
+        """
+        配置进程内共享限流器的各接口每分钟调用上限，对已创建的实例同样生效
+
+        Args:
+            quotas: 接口名 -> 每分钟调用上限，如 {'daily': 500, 'income': 200}
+            default_calls_per_minute: 未配置接口的每分钟调用上限
+            safety_factor: 实际使用的配额比例
+        """
+        cls._rate_limiter.configure(quotas, default_calls_per_minute, safety_factor)
+
+    @classmethod
+    def use_backend(cls, backend):
+        """
+        让之后创建的 TushareAPI 和 AsyncTushareAPI 实例使用指定的后端代替 pro_api，用于离线测试和基准测试
+
+        Args:
+            backend: 与 pro_api 接口一致的对象，如 FakeProApi；传 None 恢复使用真实的 pro_api
+        """
+        cls._backend = backend
+
+    @classmethod
+    def get_rate_limiter(cls) -> RateLimiter:
+        """返回进程内共享的限流器"""
+        return cls._rate_limiter
+
+    @classmethod
+    def get_metrics(cls) -> SyncMetrics:
+        """返回进程内共享的调用指标"""
+        return cls._metrics
+
     def __getattr__(self, name: str) -> Callable:
         """拦截所有对原始 pro_api 对象的方法调用"""
-        original_method = getattr(self.api, name)
-        
-        @wraps(original_method)
+        if name.startswith('_'):
+            raise AttributeError(name)
+
         def wrapper(*args, **kwargs) -> Any:
-            for attempt in range(self.max_retries):
-                try:
-                    return original_method(*args, **kwargs)
-                except Exception as e:
-                    if attempt == self.max_retries - 1:
-                        self.logger.error(f"调用 {name} 方法失败，已达到最大重试次数: {str(e)}")
-                        raise
-                    self.logger.warning(f"调用 {name} 方法失败，正在进行第 {attempt + 1} 次重试: {str(e)}")
-                    time.sleep(self.retry_delay)
-            
-        return wrapper
\ No newline at end of file
+            if self.cache is None:
+                return self._call(name, *args, **kwargs)
+            params = dict(kwargs, _args=list(args)) if args else kwargs
+            started_at, start = time.time(), time.perf_counter()
+            df = self.cache.get(name, params)
+            if df is not None:
+                self.logger.info(f"调用 {name} 方法命中缓存")
+                self.metrics.record_call(name, time.perf_counter() - start, len(df), key=self._metric_key(kwargs),
+                                         cached=True, started_at=started_at)
+                return df
+            df = self._call(name, *args, **kwargs)
+            self.cache.put(name, params, df)
+            return df
+
+        return wrapper
+
+    def _metric_key(self, kwargs: dict) -> Optional[str]:
+        """调用的主要参数，用于在指标中区分同一接口的不同调用"""
+        return next((str(kwargs[name]) for name in METRIC_KEY_PARAMS if kwargs.get(name)), None)
+
+    def _call(self, name: str, *args, **kwargs) -> Any:
+        """经过限流和重试调用 pro_api 的方法，按错误类型决定是否重试，并记录调用指标"""
+        original_method = getattr(self.api, name)
+        started_at = time.time()
+        latency, total_wait = 0.0, 0.0
+
+        def record(rows: int, attempt: int, error: Optional[str] = None):
+            self.metrics.record_call(name, latency, rows, key=self._metric_key(kwargs), retries=attempt,
+                                     rate_limit_wait=total_wait, error=error, started_at=started_at)
+
+        for attempt in range(self.retry_policy.attempts):
+            waited = self.rate_limiter.acquire(name)
+            if waited > 0:
+                total_wait += waited
+                self.logger.info(f"调用 {name} 方法前限流等待 {waited:.2f} 秒")
+            start = time.perf_counter()
+            try:
+                result = original_method(*args, **kwargs)
+            except Exception as e:
+                latency += time.perf_counter() - start
+                kind = classify_error(e)
+                if kind == ErrorKind.EMPTY:
+                    self.logger.info(f"调用 {name} 方法没有返回数据: {str(e)}")
+                    record(0, attempt)
+                    return pd.DataFrame()
+                if not self.retry_policy.should_retry(kind, attempt):
+                    self.logger.error(f"调用 {name} 方法失败({kind.value})，不再重试: {str(e)}")
+                    record(0, attempt, error=str(e))
+                    raise
+                delay = self.retry_policy.delay(kind, attempt, retry_after_of(e))
+                self.logger.warning(
+                    f"调用 {name} 方法失败({kind.value})，{delay:.2f} 秒后进行第 {attempt + 1} 次重试: {str(e)}")
+                time.sleep(delay)
+            else:
+                latency += time.perf_counter() - start
+                df = pd.DataFrame() if result is None else result
+                record(len(df), attempt)
+                return df
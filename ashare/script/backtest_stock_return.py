@@ -12,6 +12,7 @@ from ashare.models.daily_indicator_repository import DailyIndicatorRepository
 from ashare.models.dividend_repository import DividendRepository
 from ashare.models.financial_report_repository import FinancialReportRepository
 from ashare.models.return_calculator import ReturnCalculator
+from ashare.models.trading_calendar import TradingCalendar
 import os
 import logging
 from ashare.logger.setup_logger import get_logger
@@ -40,6 +41,7 @@ class StockBacktester:
         
         # 同步数据
         self._sync_data()
+        self.calendar = TradingCalendar(db_path=self.db_path)
 
     def _sync_data(self):
         """同步股票数据"""
@@ -59,6 +61,7 @@ class StockBacktester:
         self.stock_code = stock_code
         
         self.daily_quotes = self.quote_repo.find_by_code(stock_code)
+        self.quotes_by_date = {quote.trade_date: quote for quote in self.daily_quotes}
         self.daily_indicators = self.indicator_repo.find_by_code(stock_code)
         self.dividends = self.dividend_repo.find_by_code(stock_code)
         self.financial_reports = self.financial_repo.get_all(stock_code)
@@ -66,29 +69,35 @@ class StockBacktester:
         
     def _get_price(self, current_date: date) -> float:
         """获取指定日期的收盘价"""
-        quote = next((q for q in self.daily_quotes if q.trade_date == current_date), None)
+        quote = self.quotes_by_date.get(current_date)
         if quote:
             self.logger.info(f"获取 {self.stock_code} 在 {current_date} 的收盘价: {quote.close}")
             return (float(quote.open) + float(quote.close)) / 2.0
         else:
             return -1.0
         
+    def _trading_days(self, start_date: date, end_date: date) -> List[date]:
+        """回测区间内的交易日，交易日历未覆盖回测区间时退回为每个自然日"""
+        if start_date > end_date:
+            return []
+        if self.calendar.covers(start_date, end_date):
+            return self.calendar.trading_days(start_date, end_date)
+        return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        
     def backtest_stock(self, stock_code: str) -> pd.DataFrame:
         """对单只股票进行回测"""
         # 加载股票数据
         self._load_data(stock_code)
         
         results = []
-        current_date = self.start_date
-        if current_date < self.list_date:
-            current_date = self.list_date
+        start_date = max(self.start_date, self.list_date)
         
-        while current_date <= self.end_date:
+        for current_date in self._trading_days(start_date, self.end_date):
             self.logger.info(f"正在回测 {stock_code} 的 {current_date} 日数据")
             price = self._get_price(current_date)
             
+            # 停牌日没有行情
             if price < 0:
-                current_date += timedelta(days=1)
                 continue
             
             # 创建交易决策器
@@ -163,8 +172,6 @@ class StockBacktester:
                 'roe_debug_info': action_result.roe_debug_info,
                 'dcf_ratio_debug_info': action_result.dcf_ratio_debug_info,
             })
-            
-            current_date += timedelta(days=1)
         
         return_calculator = ReturnCalculator(self.trades, self.daily_quotes, self.dividends)
         cash_flows = return_calculator.get_cash_flows(self.end_date)
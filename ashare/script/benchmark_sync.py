@@ -0,0 +1,72 @@
+# 使用离线的 FakeProApi 端到端运行同步任务，测量各同步类型的耗时
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from ashare.models.fake_tushare import FakeProApi
+from ashare.models.response_cache import ResponseCache, CacheMode
+from ashare.models.rate_limiter import DEFAULT_QUOTAS
+from ashare.models.sync_service import SyncService
+from ashare.models.sync_type import SyncType
+from ashare.models.tushare_api import TushareAPI
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='离线同步基准测试')
+    parser.add_argument('--stocks', type=int, default=100, help='合成的股票数量')
+    parser.add_argument('--days', type=int, default=365, help='合成数据覆盖的天数')
+    parser.add_argument('--latency', type=float, default=0.0, help='每次接口调用的模拟延迟(秒)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='每次接口调用失败的概率')
+    parser.add_argument('--concurrency', type=int, default=1, help='逐只股票拉取时的并发线程数')
+    parser.add_argument('--batch-size', type=int, default=5000, help='每个写入事务累积的最少记录数')
+    parser.add_argument('--recordings', help='录制的响应目录（ResponseCache），命中时优先使用')
+    parser.add_argument('--rate-limit', action='store_true', help='保留 Tushare 的接口限流配额')
+    parser.add_argument('--db', help='数据库文件路径，默认使用临时文件')
+    parser.add_argument('--parquet-dir', help='日行情和每日指标保存为该目录下的 Parquet 文件')
+    parser.add_argument('--parallel', action='store_true', help='按依赖关系并发执行各同步类型（sync_all）')
+    parser.add_argument('--types', nargs='*', default=[sync_type.value for sync_type in SyncType],
+                        help='要执行的同步类型')
+    parser.add_argument('--metrics-json', help='将接口调用和写入指标导出为 JSON 文件')
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+    backend = FakeProApi(
+        num_stocks=args.stocks,
+        start_date=date.today() - timedelta(days=args.days),
+        latency=args.latency,
+        error_rate=args.error_rate,
+        recordings=ResponseCache(args.recordings, mode=CacheMode.REPLAY) if args.recordings else None
+    )
+    TushareAPI.use_backend(backend)
+    if args.rate_limit:
+        TushareAPI.configure_rate_limits(DEFAULT_QUOTAS)
+    else:
+        TushareAPI.configure_rate_limits({}, default_calls_per_minute=1e9, safety_factor=1.0)
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+    sync_svc = SyncService(db_path, 'fake-token', concurrency=args.concurrency, batch_size=args.batch_size,
+                           parquet_dir=args.parquet_dir)
+    print(f"股票数: {args.stocks}, 天数: {args.days}, 延迟: {args.latency}s, 并发: {args.concurrency}, 数据库: {db_path}")
+    total_start = time.perf_counter()
+    if args.parallel:
+        selected = [sync_type for sync_type in SyncType if sync_type.value in args.types]
+        for sync_type, elapsed in sync_svc.sync_all(selected).items():
+            print(f"{sync_type.value:<20} 耗时 {elapsed:8.2f}s")
+        print(f"{'total':<20} 耗时 {time.perf_counter() - total_start:8.2f}s  接口调用 {sum(backend.calls.values()):6d} 次")
+        print(sync_svc.metrics.format_summary(TushareAPI.get_rate_limiter()))
+    else:
+        sync_svc.metrics.reset()
+        for sync_type in SyncType:
+            if sync_type.value not in args.types:
+                continue
+            calls_before = sum(backend.calls.values())
+            start = time.perf_counter()
+            sync_svc.sync(sync_type)
+            elapsed = time.perf_counter() - start
+            calls = sum(backend.calls.values()) - calls_before
+            print(f"{sync_type.value:<20} 耗时 {elapsed:8.2f}s  接口调用 {calls:6d} 次")
+        print(f"{'total':<20} 耗时 {time.perf_counter() - total_start:8.2f}s")
+        print(sync_svc.metrics.format_summary(TushareAPI.get_rate_limiter()))
+    if args.metrics_json:
+        sync_svc.export_metrics(args.metrics_json)
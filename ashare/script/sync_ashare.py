@@ -1,10 +1,19 @@
 # 导入同步服务
 import os
 from ashare.models.sync_service import SyncService
+from ashare.models.sync_lock import SyncLock
+from ashare.models.tushare_api import TushareAPI
 
 if __name__ == '__main__':    
     # 创建同步服务实例
     sync_svc = SyncService('./ashare_stock.db', os.getenv('TUSHARE_TOKEN'))
     
-    # 调用同步步骤函数
-    sync_svc.sync_all()
+    # 调用同步步骤函数，与调度器共用同步锁，避免同时同步同一个数据库
+    try:
+        with SyncLock.for_database('./ashare_stock.db'):
+            sync_svc.sync_all()
+    finally:
+        print(sync_svc.metrics.format_summary(TushareAPI.get_rate_limiter()))
+        # 设置 SYNC_METRICS_PATH 时导出本次同步的调用和写入指标
+        if os.getenv('SYNC_METRICS_PATH'):
+            sync_svc.export_metrics(os.getenv('SYNC_METRICS_PATH'))
@@ -0,0 +1,40 @@
+# 常驻运行的同步调度器：交易日收盘后按时间表触发各类型的同步
+import argparse
+import os
+import signal
+from ashare.models.sync_service import SyncService
+from ashare.models.sync_scheduler import SyncScheduler
+from ashare.models.tushare_api import TushareAPI
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='A股数据同步调度器')
+    parser.add_argument('--db', default='./ashare_stock.db', help='数据库文件路径')
+    parser.add_argument('--parquet-dir', help='日行情和每日指标保存为该目录下的 Parquet 文件')
+    parser.add_argument('--poll', type=float, default=60.0, help='检查是否有到期任务的间隔(秒)')
+    parser.add_argument('--once', action='store_true', help='只执行一轮到期的同步后退出')
+    parser.add_argument('--status', action='store_true', help='打印各数据集的新鲜度后退出')
+    return parser.parse_args()
+
+def print_status(scheduler: SyncScheduler):
+    print(f"{'数据集':<20}{'最新日期':>12}{'应有日期':>12}{'最后同步':>22}  状态")
+    for item in scheduler.freshness():
+        last_sync = item.last_sync_time.strftime('%Y-%m-%d %H:%M:%S') if item.last_sync_time else '-'
+        print(f"{item.sync_type.value:<20}{str(item.latest_date or '-'):>12}{str(item.expected_date or '-'):>12}"
+              f"{last_sync:>22}  {'正常' if item.is_fresh else '过期'}")
+
+if __name__ == '__main__':
+    args = parse_args()
+    # 收盘后运行，行情等按交易日组织的数据同步到当天
+    sync_svc = SyncService(args.db, os.getenv('TUSHARE_TOKEN'), include_today=True, parquet_dir=args.parquet_dir)
+    scheduler = SyncScheduler(sync_svc, args.db, poll_interval=args.poll, parquet_dir=args.parquet_dir)
+    if args.status:
+        print_status(scheduler)
+    elif args.once:
+        if scheduler.run_pending():
+            print(sync_svc.metrics.format_summary(TushareAPI.get_rate_limiter()))
+    else:
+        signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            scheduler.stop()
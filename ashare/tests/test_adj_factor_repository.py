@@ -0,0 +1,96 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from ashare.models.adj_factor import AdjFactor
+from ashare.models.adj_factor_repository import AdjFactorRepository
+from ashare.models.daily_quote_repository import DailyQuoteRepository
+from ashare.models.sqlite_repository import UpsertResult
+
+@pytest.fixture
+def db_path(tmp_path):
+    """创建临时数据库文件路径"""
+    return str(tmp_path / "test_adj_factors.db")
+
+@pytest.fixture
+def repo(db_path):
+    """创建 AdjFactorRepository 实例"""
+    return AdjFactorRepository(db_path)
+
+@pytest.fixture
+def quotes(db_path):
+    """保存4个交易日的行情，收盘价在第3天除权后减半"""
+    df = pd.DataFrame({
+        'ts_code': ['000001.SZ'] * 4,
+        'trade_date': ['20230103', '20230104', '20230105', '20230106'],
+        **{name: [10.0, 12.0, 6.0, 7.0] for name in DailyQuoteRepository.VALUE_COLUMNS}
+    })
+    DailyQuoteRepository(db_path).save_frame(df)
+
+def test_save_many_and_find_by_code(repo):
+    """测试批量保存和按代码查询"""
+    factors = [
+        AdjFactor('000001.SZ', date(2023, 1, 4), Decimal('1.5')),
+        AdjFactor('000001.SZ', date(2023, 1, 3), Decimal('1.5')),
+    ]
+    assert repo.save_many(factors) == UpsertResult(inserted=2)
+    found = repo.find_by_code('000001.SZ')
+    assert [factor.trade_date for factor in found] == [date(2023, 1, 3), date(2023, 1, 4)]
+    assert found[0].adj_factor == Decimal('1.5')
+    assert repo.find_latest_trade_date() == date(2023, 1, 4)
+    assert repo.find_latest_trade_dates() == {'000001.SZ': date(2023, 1, 4)}
+    assert repo.find_ts_codes() == {'000001.SZ'}
+
+def test_save_frame(repo):
+    """测试直接保存 DataFrame"""
+    df = pd.DataFrame({'ts_code': ['000001.SZ', '000002.SZ'],
+                       'trade_date': ['20230103', '20230103'],
+                       'adj_factor': [1.0, 2.5]})
+    assert repo.save_frame(df) == UpsertResult(inserted=2)
+    assert repo.save_frame(df) == UpsertResult(unchanged=2)
+    assert repo.find_by_code('000002.SZ')[0].adj_factor == Decimal('2.5')
+
+@pytest.mark.usefixtures('quotes')
+def test_find_adjusted(repo):
+    """测试前复权和后复权价格，缺失的因子沿用之前的因子"""
+    repo.save_frame(pd.DataFrame({
+        'ts_code': ['000001.SZ'] * 3,
+        'trade_date': ['20230103', '20230105', '20230106'],
+        'adj_factor': [1.0, 2.0, 2.0],
+    }))
+    hfq = repo.find_adjusted('000001.SZ', date(2023, 1, 1), date(2023, 1, 31), mode='hfq')
+    assert len(hfq) == 4
+    assert list(hfq.trade_dates) == list(np.array(['2023-01-03', '2023-01-04', '2023-01-05', '2023-01-06'],
+                                                   dtype='datetime64[D]'))
+    np.testing.assert_allclose(hfq.adj_factor, [1.0, 1.0, 2.0, 2.0])
+    np.testing.assert_allclose(hfq.close, [10.0, 12.0, 12.0, 14.0])
+
+    qfq = repo.find_adjusted('000001.SZ', date(2023, 1, 1), date(2023, 1, 31))
+    assert qfq.mode == 'qfq'
+    np.testing.assert_allclose(qfq.close, [5.0, 6.0, 6.0, 7.0])
+    np.testing.assert_allclose(qfq.open, qfq.close)
+
+    # 前复权以区间末尾的因子为基准
+    partial = repo.find_adjusted('000001.SZ', date(2023, 1, 3), date(2023, 1, 4))
+    np.testing.assert_allclose(partial.close, [10.0, 12.0])
+
+@pytest.mark.usefixtures('quotes')
+def test_find_adjusted_without_factors(repo):
+    """测试没有复权因子时价格为 NaN，区间内没有行情时返回空向量"""
+    adjusted = repo.find_adjusted('000001.SZ', date(2023, 1, 1), date(2023, 1, 31), mode='hfq')
+    assert np.isnan(adjusted.close).all()
+    assert len(repo.find_adjusted('000002.SZ', date(2023, 1, 1), date(2023, 1, 31))) == 0
+
+def test_find_adjusted_invalid_mode(repo):
+    """测试不支持的复权方式"""
+    with pytest.raises(ValueError):
+        repo.find_adjusted('000001.SZ', date(2023, 1, 1), date(2023, 1, 31), mode='none')
+
+def test_find_by_code_arrays(repo):
+    """测试按列读取复权因子"""
+    repo.save_many([AdjFactor('000001.SZ', date(2023, 1, 4), Decimal('1.5')),
+                    AdjFactor('000001.SZ', date(2023, 1, 3), Decimal('1.25'))])
+    arrays = repo.find_by_code_arrays('000001.SZ')
+    assert arrays['trade_date'].tolist() == [20230103, 20230104]
+    np.testing.assert_array_equal(arrays['adj_factor'], [1.25, 1.5])
@@ -0,0 +1,153 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from ..models.async_tushare_api import AsyncTushareAPI
+from ..models.rate_limiter import RateLimiter
+from ..models.response_cache import ResponseCache
+from ..models.retry_policy import ErrorKind, TushareError
+from ..models.sync_metrics import SyncMetrics
+from ..models.daily_quote_fetcher import DailyQuoteFetcher
+
+DAILY_FIELDS = ['ts_code', 'trade_date', 'open', 'high', 'low', 'close',
+                'pre_close', 'change', 'pct_chg', 'vol', 'amount']
+
+class FakeTushareServer:
+    """模拟 Tushare HTTP 协议的本地服务"""
+
+    def __init__(self, failures: int = 0, error_msg: str = None, delay: float = 0.0, headers: dict = None):
+        self.failures = failures
+        self.error_msg = error_msg
+        self.delay = delay
+        self.headers = headers
+        self.requests = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests.append((request.match_info['api_name'], payload))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                return web.Response(status=500)
+            if self.error_msg:
+                return web.json_response({'code': 40203, 'msg': self.error_msg, 'data': None}, headers=self.headers)
+            params = payload['params']
+            items = [[params.get('ts_code', '000001.SZ'), '20230103',
+                      10.0, 11.0, 9.5, 10.5, 10.0, 0.5, 5.0, 1000.0, 10500.0]]
+            return web.json_response({'code': 0, 'msg': '', 'data': {'fields': DAILY_FIELDS, 'items': items}})
+        finally:
+            self.in_flight -= 1
+
+def run_with_server(fake: FakeTushareServer, scenario, **api_kwargs):
+    """启动本地服务并在事件循环中执行 scenario(api)"""
+    async def main():
+        app = web.Application()
+        app.router.add_post('/dataapi/{api_name}', fake.handle)
+        server = TestServer(app)
+        await server.start_server()
+        limiter = RateLimiter({}, default_calls_per_minute=600000, safety_factor=1.0)
+        api = AsyncTushareAPI('fake-token', http_url=str(server.make_url('/dataapi')),
+                              retry_delay=0.01, rate_limiter=limiter, **api_kwargs)
+        try:
+            return await scenario(api)
+        finally:
+            await api.close()
+            await server.close()
+    return asyncio.run(main())
+
+def test_attribute_style_call():
+    """测试按属性调用接口并按协议发送请求"""
+    fake = FakeTushareServer()
+    df = run_with_server(fake, lambda api: api.daily(ts_code='000002.SZ', trade_date='20230103'))
+    assert list(df.columns) == DAILY_FIELDS
+    assert df.iloc[0]['ts_code'] == '000002.SZ'
+    api_name, payload = fake.requests[0]
+    assert api_name == 'daily'
+    assert payload['api_name'] == 'daily'
+    assert payload['token'] == 'fake-token'
+    assert payload['params'] == {'ts_code': '000002.SZ', 'trade_date': '20230103'}
+
+def test_retry_after_transient_failure():
+    """测试服务端临时错误后重试成功"""
+    fake = FakeTushareServer(failures=2)
+    df = run_with_server(fake, lambda api: api.daily(ts_code='000001.SZ'))
+    assert len(df) == 1
+    assert len(fake.requests) == 3
+
+def test_error_after_max_retries():
+    """测试接口返回错误码时重试后抛出异常"""
+    fake = FakeTushareServer(error_msg='服务器内部错误')
+    with pytest.raises(Exception, match='服务器内部错误'):
+        run_with_server(fake, lambda api: api.daily(ts_code='000001.SZ'), max_retries=2)
+    assert len(fake.requests) == 2
+
+def test_retry_after_http_date():
+    """测试 HTTP 日期格式的 Retry-After 按已过去的时间立即重试，无法解析时按退避等待"""
+    fake = FakeTushareServer(error_msg='服务器内部错误', headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    with pytest.raises(TushareError) as excinfo:
+        run_with_server(fake, lambda api: api.daily(ts_code='000001.SZ'), max_retries=2)
+    assert excinfo.value.retry_after == 0.0
+    fake = FakeTushareServer(error_msg='服务器内部错误', headers={'Retry-After': 'soon'})
+    with pytest.raises(TushareError) as excinfo:
+        run_with_server(fake, lambda api: api.daily(ts_code='000001.SZ'), max_retries=2)
+    assert excinfo.value.retry_after is None
+    assert len(fake.requests) == 2
+
+def test_cache_hit_records_metrics(tmp_path):
+    """测试命中响应缓存时不发请求，并记录为缓存命中的调用"""
+    fake = FakeTushareServer()
+    metrics = SyncMetrics()
+
+    async def scenario(api):
+        await api.daily(ts_code='000001.SZ')
+        return await api.daily(ts_code='000001.SZ')
+
+    df = run_with_server(fake, scenario, cache=ResponseCache(str(tmp_path / 'cache')), metrics=metrics)
+    assert len(df) == 1
+    assert len(fake.requests) == 1
+    assert [call.cached for call in metrics.calls] == [False, True]
+    assert metrics.calls[1].key == '000001.SZ'
+
+def test_permanent_error_fails_fast():
+    """测试参数错误等永久错误不重试"""
+    fake = FakeTushareServer(error_msg='参数错误')
+    with pytest.raises(TushareError, match='参数错误'):
+        run_with_server(fake, lambda api: api.daily(ts_code='000001.SZ'), max_retries=3)
+    assert len(fake.requests) == 1
+
+def test_semaphore_limits_in_flight_requests():
+    """测试同时在途请求数不超过 max_concurrency"""
+    fake = FakeTushareServer(delay=0.02)
+
+    async def scenario(api):
+        return await asyncio.gather(*(api.daily(ts_code=f'{i:06d}.SZ') for i in range(12)))
+
+    results = run_with_server(fake, scenario, max_concurrency=3)
+    assert len(results) == 12
+    assert 1 < fake.peak_in_flight <= 3
+
+def test_backoff_delay_is_capped():
+    """测试指数退避等待时间有上限"""
+    api = AsyncTushareAPI('fake-token', retry_delay=1.0, max_retry_delay=5.0)
+    assert [api.retry_policy.backoff(ErrorKind.TRANSIENT, i) for i in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+def test_fetcher_async_variant():
+    """测试 fetcher 的异步方法"""
+    fake = FakeTushareServer()
+
+    async def scenario(api):
+        fetcher = DailyQuoteFetcher('fake-token', async_api=api)
+        return await fetcher.fetch_daily_quotes_async('000001.SZ', date(2023, 1, 3), date(2023, 1, 6))
+
+    quotes = run_with_server(fake, scenario)
+    assert len(quotes) == 1
+    assert quotes[0].trade_date == date(2023, 1, 3)
+    assert quotes[0].close == Decimal('10.5')
+    assert fake.requests[0][1]['params'] == {'ts_code': '000001.SZ', 'start_date': '20230103', 'end_date': '20230106'}
@@ -0,0 +1,51 @@
+import os
+import threading
+import pytest
+from datetime import date
+from ..models.connection_manager import ConnectionManager
+from ..models.stock import Stock
+from ..models.stock_repository import StockRepository
+from ..models.sync_session import SyncSession
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'connections.db')
+
+def test_shared_per_database(db_path, tmp_path):
+    """测试同一数据库文件共用一个实例，所有仓库共用当前线程的连接"""
+    manager = ConnectionManager.for_database(db_path)
+    assert ConnectionManager.for_database(os.path.join(str(tmp_path), '.', 'connections.db')) is manager
+    assert ConnectionManager.for_database(str(tmp_path / 'other.db')) is not manager
+    assert StockRepository(db_path).connection_manager is manager
+    assert manager.connection() is manager.connection()
+
+def test_thread_local_connections(db_path):
+    """测试每个线程使用自己的连接"""
+    manager = ConnectionManager.for_database(db_path)
+    connections = []
+    thread = threading.Thread(target=lambda: connections.append(manager.connection()))
+    thread.start()
+    thread.join()
+    assert connections[0] is not manager.connection()
+
+def test_pragmas(db_path):
+    """测试连接建立时设置 WAL 和其他 PRAGMA"""
+    conn = ConnectionManager.for_database(db_path).connection()
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1
+    assert conn.execute('PRAGMA temp_store').fetchone()[0] == 2
+    assert conn.execute('PRAGMA cache_size').fetchone()[0] == -65536
+    with SyncSession(db_path) as session:
+        assert session.connection.execute('PRAGMA synchronous').fetchone()[0] == 1
+
+def test_reconnects_after_file_replaced(db_path):
+    """测试数据库文件被删除重建后重新连接，不会读到旧文件的数据"""
+    repository = StockRepository(db_path)
+    repository.save_many([Stock('000001.SZ', '000001', '平安银行', '深圳', '银行', None, None, None, '主板',
+                                'SZSE', 'CNY', 'L', date(1991, 4, 3), None, 'N', None, None)])
+    old = ConnectionManager.for_database(db_path).connection()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    assert StockRepository(db_path).find_all() == []
+    assert ConnectionManager.for_database(db_path).connection() is not old
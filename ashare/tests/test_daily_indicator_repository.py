@@ -1,6 +1,8 @@
 import pytest
 from datetime import date
 from decimal import Decimal
+import numpy as np
+import pandas as pd
 from ashare.models.daily_indicator import DailyIndicator
 from ashare.models.daily_indicator_repository import DailyIndicatorRepository
 
@@ -157,4 +159,29 @@ def test_find_by_code_not_found(repo):
 def test_find_by_date_not_found(repo):
     """测试查询不存在的日期"""
     found = repo.find_by_date(date(2099, 1, 1))
-    assert len(found) == 0
\ No newline at end of file
+    assert len(found) == 0
+
+def test_save_frame(repo):
+    """测试直接保存 DataFrame，空值保存为 NULL"""
+    df = pd.DataFrame({
+        'ts_code': ['000001.SZ'],
+        'trade_date': ['20230103'],
+        **{name: [1.5] for name in DailyIndicatorRepository.VALUE_COLUMNS}
+    })
+    df['pe'] = [None]
+    repo.save_frame(df)
+    saved = repo.find_by_code_and_date('000001.SZ', date(2023, 1, 3))
+    assert saved.close == Decimal('1.5')
+    assert saved.pe is None
+
+def test_find_by_code_arrays(repo, sample_indicators):
+    """测试按列读取为 NumPy 数组，空值为 NaN"""
+    repo.save_many(sample_indicators)
+    df = pd.DataFrame({'ts_code': ['000001.SZ'], 'trade_date': ['20230103'],
+                       **{name: [1.0] for name in DailyIndicatorRepository.VALUE_COLUMNS}})
+    repo.save_frame(df.assign(pe=[None]))
+    arrays = repo.find_by_code_arrays("000001.SZ", columns=['pe', 'total_mv'])
+    assert arrays['trade_date'].tolist() == [20230101, 20230102, 20230103]
+    assert arrays['pe'][:2].tolist() == [15.5, 15.8]
+    assert np.isnan(arrays['pe'][2])
+    assert arrays['total_mv'].dtype == np.float64
@@ -1,8 +1,11 @@
 import pytest
 from datetime import date
 from decimal import Decimal
+import numpy as np
+import pandas as pd
 from ashare.models.daily_quote import DailyQuote
 from ashare.models.daily_quote_repository import DailyQuoteRepository
+from ashare.models.sqlite_repository import UpsertResult
 
 @pytest.fixture
 def db_path(tmp_path):
@@ -139,4 +142,75 @@ def test_find_by_code_not_found(repo):
 def test_find_by_date_not_found(repo):
     """测试查询不存在的日期"""
     found = repo.find_by_date(date(2099, 1, 1))
-    assert len(found) == 0
\ No newline at end of file
+    assert len(found) == 0
+
+def test_find_latest_trade_date(repo, sample_quotes):
+    """测试查询最新交易日期"""
+    assert repo.find_latest_trade_date() is None
+    repo.save_many(sample_quotes)
+    assert repo.find_latest_trade_date() == date(2023, 1, 2)
+
+def test_find_ts_codes(repo, sample_quotes):
+    """测试查询已有行情的股票代码"""
+    assert repo.find_ts_codes() == set()
+    repo.save_many(sample_quotes)
+    assert repo.find_ts_codes() == {"000001.SZ"}
+
+def test_save_frame(repo):
+    """测试直接保存 DataFrame"""
+    df = pd.DataFrame({
+        'ts_code': ['000001.SZ', '000002.SZ'],
+        'trade_date': ['20230103', '20230103'],
+        **{name: [10.5, 20.0] for name in DailyQuoteRepository.VALUE_COLUMNS}
+    })
+    repo.save_frame(df)
+    saved = repo.find_by_code_and_date('000001.SZ', date(2023, 1, 3))
+    assert saved.close == Decimal('10.5')
+    assert saved.trade_date == date(2023, 1, 3)
+    assert len(repo.find_by_date(date(2023, 1, 3))) == 2
+    repo.save_frame(df.iloc[0:0])
+
+def test_save_frame_skips_unchanged_rows(repo):
+    """测试重复保存时只写入有变化的记录"""
+    df = pd.DataFrame({
+        'ts_code': ['000001.SZ', '000002.SZ'],
+        'trade_date': ['20230103', '20230103'],
+        **{name: [10.5, 20.0] for name in DailyQuoteRepository.VALUE_COLUMNS}
+    })
+    assert repo.save_frame(df) == UpsertResult(inserted=2)
+    assert repo.save_frame(df) == UpsertResult(unchanged=2)
+    df.loc[1, 'close'] = 21.0
+    assert repo.save_frame(df) == UpsertResult(updated=1, unchanged=1)
+    assert repo.find_by_code_and_date('000002.SZ', date(2023, 1, 3)).close == Decimal('21.0')
+    assert repo.save_frame(df.iloc[0:0]) == UpsertResult()
+
+def test_find_by_code_arrays(repo, sample_quotes):
+    """测试按列读取为 NumPy 数组：整数日期、float64 数值，支持日期区间和列选择"""
+    repo.save_many(list(reversed(sample_quotes)))
+    arrays = repo.find_by_code_arrays("000001.SZ")
+    assert list(arrays) == ['trade_date'] + list(DailyQuoteRepository.VALUE_COLUMNS)
+    assert arrays['trade_date'].dtype == np.int32
+    assert arrays['trade_date'].tolist() == [20230101, 20230102]
+    assert arrays['close'].dtype == np.float64
+    assert arrays['close'].tolist() == [10.85, 11.20]
+    
+    arrays = repo.find_by_code_arrays("000001.SZ", start=date(2023, 1, 2), columns=['close', 'vol'])
+    assert list(arrays) == ['trade_date', 'close', 'vol']
+    assert arrays['vol'].tolist() == [987654.0]
+    assert len(repo.find_by_code_arrays("000001.SZ", end=date(2022, 12, 31))['close']) == 0
+    with pytest.raises(ValueError):
+        repo.find_by_code_arrays("000001.SZ", columns=['pe'])
+
+def test_load_panel(repo, sample_quotes):
+    """测试读取 交易日 × 股票 面板，缺失的股票和日期为 NaN"""
+    other = DailyQuote(**{**sample_quotes[0].__dict__, 'ts_code': "000002.SZ", 'close': Decimal("5.5")})
+    repo.save_many(sample_quotes + [other])
+    panel = repo.load_panel('close')
+    assert panel.trade_dates.tolist() == [20230101, 20230102]
+    assert panel.ts_codes.tolist() == ["000001.SZ", "000002.SZ"]
+    np.testing.assert_array_equal(panel.values, [[10.85, 5.5], [11.20, np.nan]])
+    
+    panel = repo.load_panel('close', ts_codes=["000002.SZ", "000003.SZ"], start=date(2023, 1, 1), end=date(2023, 1, 1))
+    np.testing.assert_array_equal(panel.values, [[5.5, np.nan]])
+    with pytest.raises(ValueError):
+        repo.load_panel('pe')
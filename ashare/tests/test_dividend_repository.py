@@ -1,8 +1,10 @@
 import pytest
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
 from ashare.models.dividend import Dividend
 from ashare.models.dividend_repository import DividendRepository
+from ashare.models.sqlite_repository import UpsertResult
 
 @pytest.fixture
 def db_path(tmp_path):
@@ -151,4 +153,14 @@ def test_find_by_code_not_found(repo):
 def test_find_by_ex_date_not_found(repo):
     """测试查询不存在的除权除息日"""
     found = repo.find_by_ex_date(date(2099, 1, 1))
-    assert len(found) == 0
\ No newline at end of file
+    assert len(found) == 0
+
+def test_save_many_only_writes_changed_rows(repo, sample_dividends):
+    """测试只写入新增或有变化的记录"""
+    assert repo.save_many(sample_dividends) == UpsertResult(inserted=2)
+    assert repo.save_many(sample_dividends) == UpsertResult(unchanged=2)
+    updated = replace(sample_dividends[0], div_proc="股东大会通过", pay_date=None)
+    assert repo.save_many([updated, sample_dividends[1]]) == UpsertResult(updated=1, unchanged=1)
+    saved = repo.find_by_code_and_end_date("000001.SZ", date(2022, 12, 31))
+    assert saved.div_proc == "股东大会通过"
+    assert saved.pay_date is None
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import pytest
+from datetime import date
+import numpy as np
+import pandas as pd
+from aiohttp.test_utils import TestServer
+from ..models.fake_tushare import FakeProApi, create_fake_server_app, DAILY_FIELDS
+from ..models.response_cache import ResponseCache
+from ..models.tushare_api import TushareAPI
+from ..models.async_tushare_api import AsyncTushareAPI
+from ..models.rate_limiter import RateLimiter, DEFAULT_QUOTAS
+from ..models.daily_quote_fetcher import DailyQuoteFetcher
+from ..models.financial_report_fetcher import FinancialReportFetcher, INCOME_FIELDS
+from ..models.sync_service import SyncService
+from ..models.sync_type import SyncType
+from ..models.daily_quote_repository import DailyQuoteRepository
+from ..models.stock_repository import StockRepository
+from ..models.adj_factor_repository import AdjFactorRepository
+from ..models.parquet_daily_quote_repository import ParquetDailyQuoteRepository
+
+@pytest.fixture
+def backend():
+    return FakeProApi(num_stocks=4, start_date=date(2023, 1, 2), end_date=date(2023, 3, 31))
+
+@pytest.fixture
+def fake_backend(backend):
+    """让 TushareAPI 使用离线后端并取消限流，测试结束后恢复"""
+    TushareAPI.use_backend(backend)
+    TushareAPI.configure_rate_limits({}, default_calls_per_minute=600000, safety_factor=1.0)
+    yield backend
+    TushareAPI.use_backend(None)
+    TushareAPI.configure_rate_limits(DEFAULT_QUOTAS)
+
+def test_deterministic_and_fields(backend):
+    """测试相同参数返回相同数据，返回列与 fields 一致"""
+    other = FakeProApi(num_stocks=4, start_date=date(2023, 1, 2), end_date=date(2023, 3, 31))
+    df = backend.daily(ts_code='000001.SZ', start_date='20230201', end_date='20230228')
+    pd.testing.assert_frame_equal(df, other.daily(ts_code='000001.SZ', start_date='20230201', end_date='20230228'))
+    assert list(df.columns) == DAILY_FIELDS.split(',')
+    assert df['trade_date'].iloc[0] == '20230228'
+    assert df['trade_date'].iloc[-1] == '20230201'
+    assert list(backend.income(ts_code='000001.SZ', fields='ts_code,end_date,revenue').columns) == \
+        ['ts_code', 'end_date', 'revenue']
+
+def test_trade_date_cross_section(backend):
+    """测试按交易日返回全市场截面，与按股票查询的数据一致"""
+    df = backend.daily(trade_date='20230105')
+    assert sorted(df['ts_code']) == sorted(backend.ts_codes)
+    by_stock = backend.daily(ts_code='000001.SZ', start_date='20230105', end_date='20230105')
+    assert df[df['ts_code'] == '000001.SZ']['close'].iloc[0] == by_stock['close'].iloc[0]
+    assert backend.daily(trade_date='20230107').empty
+
+def test_statement_filters(backend):
+    """测试财报按公告日期和报告期过滤"""
+    df = backend.income(ts_code='000001.SZ', start_date='20221001', end_date='20221231')
+    assert list(df['end_date']) == ['20220930']
+    assert list(df['ann_date']) == ['20221030']
+    assert list(backend.income(ts_code='000001.SZ', period='20220930')['end_date']) == ['20220930']
+    full = backend.income(ts_code='000001.SZ')
+    single = backend.income(ts_code='000001.SZ', period='20220930')
+    assert full[full['end_date'] == '20220930']['revenue'].iloc[0] == single['revenue'].iloc[0]
+
+def test_latency_and_error_injection():
+    """测试注入延迟和错误"""
+    sleeps = []
+    backend = FakeProApi(num_stocks=1, latencies={'daily': 0.5}, error_rates={'income': 1.0},
+                         sleep=sleeps.append)
+    backend.daily(ts_code='000001.SZ')
+    backend.dividend(ts_code='000001.SZ')
+    assert sleeps == [0.5]
+    with pytest.raises(Exception, match='每分钟最多访问'):
+        backend.income(ts_code='000001.SZ')
+    assert backend.calls == {'daily': 1, 'dividend': 1, 'income': 1}
+
+def test_recordings_take_precedence(tmp_path, backend):
+    """测试录制的响应优先于合成数据"""
+    recorded = pd.DataFrame({'ts_code': ['000001.SZ'], 'trade_date': ['20230103'], 'close': [1.0]})
+    recordings = ResponseCache(str(tmp_path))
+    recordings.put('daily', {'ts_code': '000001.SZ', 'trade_date': '20230103'}, recorded)
+    backend.recordings = recordings
+    pd.testing.assert_frame_equal(backend.daily(ts_code='000001.SZ', trade_date='20230103'), recorded)
+    assert len(backend.daily(ts_code='000001.SZ', trade_date='20230104')) == 1
+
+def test_fetchers_use_backend(fake_backend):
+    """测试 fetcher 通过 TushareAPI 使用离线后端"""
+    quotes = DailyQuoteFetcher('fake-token').fetch_daily_quotes('000001.SZ', date(2023, 1, 2), date(2023, 1, 6))
+    assert [quote.trade_date for quote in quotes][-1] == date(2023, 1, 2)
+    assert len(quotes) == 5
+    reports = FinancialReportFetcher('fake-token').fetch_financial_reports('000001.SZ', date(2022, 1, 1), date(2023, 3, 31))
+    assert reports and all(report.balance_sheet is not None for report in reports)
+    assert fake_backend.calls['daily'] == 1
+
+def test_end_to_end_sync(tmp_path, fake_backend):
+    """测试离线端到端同步"""
+    db_path = str(tmp_path / 'sync.db')
+    sync_service = SyncService(db_path, 'fake-token', concurrency=2)
+    sync_service.sync(SyncType.STOCK_LIST)
+    sync_service.sync(SyncType.DAILY_QUOTE)
+    assert len(StockRepository(db_path).find_all()) == 4
+    assert len(DailyQuoteRepository(db_path).find_by_code('000001.SZ')) == len(fake_backend.trade_dates)
+
+def test_fake_server_serves_async_client(backend):
+    """测试 HTTP 替身服务器供 AsyncTushareAPI 使用"""
+    async def run():
+        server = TestServer(create_fake_server_app(backend))
+        await server.start_server()
+        try:
+            limiter = RateLimiter({}, default_calls_per_minute=600000, safety_factor=1.0)
+            async with AsyncTushareAPI('fake-token', http_url=str(server.make_url('')),
+                                       rate_limiter=limiter) as api:
+                df = await api.income(ts_code='000001.SZ', fields=INCOME_FIELDS)
+        finally:
+            await server.close()
+        return df
+
+    df = asyncio.run(run())
+    expected = backend.income(ts_code='000001.SZ', fields=INCOME_FIELDS)
+    assert list(df.columns) == list(expected.columns)
+    assert list(df['end_date']) == list(expected['end_date'])
+
+def test_async_client_uses_backend(fake_backend):
+    """测试 AsyncTushareAPI 同样使用 TushareAPI.use_backend 指定的后端，不需要 HTTP 替身服务器"""
+    async def run():
+        async with AsyncTushareAPI('fake-token', http_url='http://127.0.0.1:9') as api:
+            return await api.income(ts_code='000001.SZ', fields=INCOME_FIELDS)
+
+    df = asyncio.run(run())
+    expected = fake_backend.income(ts_code='000001.SZ', fields=INCOME_FIELDS)
+    assert list(df.columns) == list(expected.columns)
+    assert list(df['end_date']) == list(expected['end_date'])
+
+def test_adj_factor_sync_and_adjusted_prices(tmp_path, fake_backend):
+    """测试离线同步复权因子并查询复权价格"""
+    db_path = str(tmp_path / 'sync.db')
+    sync_service = SyncService(db_path, 'fake-token')
+    for sync_type in (SyncType.STOCK_LIST, SyncType.DAILY_QUOTE, SyncType.ADJ_FACTOR):
+        sync_service.sync(sync_type)
+    repository = AdjFactorRepository(db_path)
+    assert len(repository.find_by_code('000001.SZ')) == len(fake_backend.trade_dates)
+    adjusted = repository.find_adjusted('000001.SZ', date(2023, 1, 2), date(2023, 3, 31), mode='hfq')
+    raw = fake_backend.daily(ts_code='000001.SZ').iloc[::-1]
+    factors = fake_backend.adj_factor(ts_code='000001.SZ').iloc[::-1]
+    np.testing.assert_allclose(adjusted.close, raw['close'].to_numpy() * factors['adj_factor'].to_numpy())
+
+def test_sync_all_records_metrics(tmp_path, fake_backend, capsys):
+    """测试 sync_all 记录接口调用和写入指标，汇总表只写入日志不打印，并可导出 JSON"""
+    db_path = str(tmp_path / 'sync.db')
+    sync_service = SyncService(db_path, 'fake-token')
+    sync_service.sync_all([SyncType.STOCK_LIST, SyncType.TRADE_CALENDAR, SyncType.DAILY_QUOTE])
+    assert capsys.readouterr().out == ''
+    assert 'daily_quote' in sync_service.metrics.format_summary(TushareAPI.get_rate_limiter())
+    metrics = json.loads(sync_service.export_metrics(str(tmp_path / 'metrics.json')))
+    endpoints = {row['endpoint']: row for row in metrics['endpoints']}
+    assert endpoints['daily']['calls'] == fake_backend.calls['daily'] == 4
+    assert endpoints['daily']['rows'] == 4 * len(fake_backend.trade_dates)
+    writes = {row['sync_type']: row for row in metrics['writes']}
+    assert writes['daily_quote']['rows'] == writes['daily_quote']['written'] == 4 * len(fake_backend.trade_dates)
+    assert writes['stock_list']['rows'] == 4
+
+def test_sync_to_parquet(tmp_path, fake_backend):
+    """测试设置 parquet_dir 时日行情写入 Parquet，与写入 SQLite 的结果一致"""
+    db_path = str(tmp_path / 'sync.db')
+    parquet_dir = str(tmp_path / 'parquet')
+    sync_service = SyncService(db_path, 'fake-token', parquet_dir=parquet_dir)
+    sync_service.sync(SyncType.STOCK_LIST)
+    sync_service.sync(SyncType.DAILY_QUOTE)
+    assert DailyQuoteRepository(db_path).find_by_code('000001.SZ') == []
+    sqlite_path = str(tmp_path / 'sqlite.db')
+    sqlite_service = SyncService(sqlite_path, 'fake-token')
+    sqlite_service.sync(SyncType.STOCK_LIST)
+    sqlite_service.sync(SyncType.DAILY_QUOTE)
+    assert ParquetDailyQuoteRepository(parquet_dir).find_by_code('000001.SZ') == \
+        DailyQuoteRepository(sqlite_path).find_by_code('000001.SZ')
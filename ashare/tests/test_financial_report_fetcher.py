@@ -1,7 +1,13 @@
+import logging
 import pytest
+import pandas as pd
 from datetime import datetime, date
 from decimal import Decimal
 from ashare.models.financial_report_fetcher import FinancialReportFetcher
+from ashare.models.fake_tushare import FakeProApi
+from ashare.models.frame_converter import frame_to_models
+from ashare.models.rate_limiter import DEFAULT_QUOTAS
+from ashare.models.tushare_api import TushareAPI
 import os
 from datetime import date
 from ashare.models.financial_report import (
@@ -137,4 +143,88 @@ def test_decimal_conversion(fetcher):
     assert fetcher._convert_decimal(100) == Decimal('100')
     assert fetcher._convert_decimal(3.14) == Decimal('3.14')
     assert fetcher._convert_decimal(None) is None
-    assert fetcher._convert_decimal(float('nan')) is None  # 使用 float('nan') 代替字符串 "NaN"
\ No newline at end of file
+    assert fetcher._convert_decimal(float('nan')) is None  # 使用 float('nan') 代替字符串 "NaN"
+
+@pytest.fixture
+def offline_fetcher():
+    """使用离线 FakeProApi 后端的 FinancialReportFetcher"""
+    backend = FakeProApi(num_stocks=2, start_date=date(2022, 1, 3), end_date=date(2023, 12, 31))
+    TushareAPI.use_backend(backend)
+    TushareAPI.configure_rate_limits({}, default_calls_per_minute=600000, safety_factor=1.0)
+    yield FinancialReportFetcher('fake-token')
+    TushareAPI.use_backend(None)
+    TushareAPI.configure_rate_limits(DEFAULT_QUOTAS)
+
+def test_fetch_financial_reports_offline(offline_fetcher):
+    """测试并发拉取四张报表并按报告期合并"""
+    reports = offline_fetcher.fetch_financial_reports('000001.SZ', date(2022, 1, 1), date(2023, 12, 31))
+    assert len(reports) > 0
+    for report in reports:
+        assert report.balance_sheet.end_date == report.report_date
+        assert report.cash_flow_statement.end_date == report.report_date
+        assert report.financial_indicators.end_date == report.report_date
+    assert offline_fetcher.pro.api.calls == {'income': 1, 'balancesheet': 1, 'cashflow': 1, 'fina_indicator': 1}
+
+def _statements(model, rows):
+    return frame_to_models(pd.DataFrame(rows), model)
+
+def test_merge_reports_indexes_and_reports_unmatched(offline_fetcher, caplog):
+    """测试按 (报告期, 报告类型) 合并，同一键取第一条，无法生成报告的报表记录日志"""
+    income = _statements(IncomeStatement, {
+        'ts_code': ['000001.SZ'] * 2, 'end_date': ['20221231', '20220930'],
+        'ann_date': ['20230301', '20221020'], 'report_type': ['1', '1'], 'end_type': ['4', '3'],
+    })
+    balance = _statements(BalanceSheet, {
+        'end_date': ['20221231', '20221231', '20211231'], 'report_type': ['1', '1', '1'],
+        'total_share': [1.0, 2.0, 3.0],
+    })
+    cash_flows = _statements(CashFlowStatement, {'end_date': ['20221231'], 'report_type': ['2']})
+    indicators = _statements(FinancialIndicators, {'end_date': ['20220930']})
+    caplog.set_level(logging.WARNING, logger='ashare')
+
+    reports = offline_fetcher._merge_reports('000001.SZ', income, balance, cash_flows, indicators)
+
+    assert [report.report_date for report in reports] == [date(2022, 12, 31), date(2022, 9, 30)]
+    assert reports[0].balance_sheet.total_share == Decimal('1.0')
+    assert reports[0].cash_flow_statement is None
+    assert reports[0].financial_indicators is None
+    assert reports[1].financial_indicators is indicators[0]
+    assert '缺少 cash_flow_statement' in caplog.text
+    # 没有公告日期和报告期类型的资产负债表、现金流量表无法单独生成报告
+    assert '有 2 期报表缺少报告期、报告类型、公告日期或报告期类型，已跳过' in caplog.text
+
+def test_merge_reports_keeps_periods_without_income(offline_fetcher, caplog):
+    """测试只有资产负债表或现金流量表的报告期也生成报告，没有对应报表的财务指标记录日志"""
+    income = _statements(IncomeStatement, {
+        'ts_code': ['000001.SZ'], 'end_date': ['20221231'], 'ann_date': ['20230301'],
+        'report_type': ['1'], 'end_type': ['4'],
+    })
+    balance = _statements(BalanceSheet, {
+        'end_date': ['20221231', '20220930'], 'ann_date': ['20230301', '20221020'],
+        'report_type': ['1', '1'], 'end_type': ['4', '3'],
+    })
+    cash_flows = _statements(CashFlowStatement, {
+        'end_date': ['20220630'], 'ann_date': ['20220820'], 'report_type': ['1'], 'end_type': ['2'],
+    })
+    indicators = _statements(FinancialIndicators, {'end_date': ['20220930', '20220331']})
+    caplog.set_level(logging.WARNING, logger='ashare')
+
+    reports = offline_fetcher._merge_reports('000001.SZ', income, balance, cash_flows, indicators)
+
+    assert [report.report_date for report in reports] == [date(2022, 12, 31), date(2022, 9, 30), date(2022, 6, 30)]
+    assert reports[1].income_statement is None
+    assert reports[1].balance_sheet is balance[1]
+    assert (reports[1].ann_date, reports[1].end_type) == (date(2022, 10, 20), '3')
+    assert reports[1].financial_indicators is indicators[0]
+    assert reports[2].cash_flow_statement is cash_flows[0]
+    assert reports[2].balance_sheet is None
+    assert '有 2 期财务报告缺少 income_statement' in caplog.text
+    assert '有 1 条 financial_indicators 没有对应的报表' in caplog.text
+
+def test_fetch_financial_reports_by_period(offline_fetcher):
+    """测试按报告期一次拉取全市场财报"""
+    reports = offline_fetcher.fetch_financial_reports_by_period(date(2022, 12, 31))
+    assert sorted(report.ts_code for report in reports) == ['000001.SZ', '600001.SH']
+    assert all(report.report_date == date(2022, 12, 31) and report.balance_sheet for report in reports)
+    assert offline_fetcher.pro.api.calls == {
+        'income_vip': 1, 'balancesheet_vip': 1, 'cashflow_vip': 1, 'fina_indicator_vip': 1}
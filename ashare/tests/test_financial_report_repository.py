@@ -1,7 +1,10 @@
 import os
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
+import pandas as pd
 import pytest
+from ashare.models.frame_converter import frame_to_models
 from ashare.models.financial_report import (
     FinancialReport,
     IncomeStatement,
@@ -630,4 +633,40 @@ def test_get_nonexistent(repository):
         date(2023, 12, 31),
         "1"
     )
-    assert report is None
\ No newline at end of file
+    assert report is None
+
+def _statement(model, **values):
+    return frame_to_models(pd.DataFrame({name: [value] for name, value in values.items()}), model)[0]
+
+def test_save_many_keeps_statements_missing_from_update(tmp_path):
+    """测试只带一张更正报表的报告合并到已保存的报告，其余报表不被覆盖为空"""
+    repository = FinancialReportRepository(str(tmp_path / 'financial_reports.db'))
+    period = dict(ts_code='000001.SZ', end_date='20230331', report_type='1', end_type='1')
+    report = FinancialReport(
+        ts_code='000001.SZ', report_date=date(2023, 3, 31), ann_date=date(2023, 4, 25),
+        report_type='1', end_type='1',
+        income_statement=_statement(IncomeStatement, ann_date='20230425', total_revenue=1000000.0, **period),
+        balance_sheet=_statement(BalanceSheet, ann_date='20230425', total_assets=2000000.0, **period),
+        cash_flow_statement=_statement(CashFlowStatement, ann_date='20230425', net_profit=100000.0, **period),
+        financial_indicators=_statement(FinancialIndicators, ts_code='000001.SZ', ann_date='20230425',
+                                        end_date='20230331', eps=0.5)
+    )
+    repository.save_many([report])
+    restated = replace(
+        report,
+        ann_date=date(2023, 8, 25),
+        income_statement=None,
+        balance_sheet=_statement(BalanceSheet, ann_date='20230825', total_assets=2100000.0, **period),
+        cash_flow_statement=None,
+        financial_indicators=None
+    )
+    assert repository.save_many([restated]).updated == 1
+
+    saved = repository.get('000001.SZ', date(2023, 3, 31), '1')
+    assert saved.ann_date == date(2023, 8, 25)
+    assert saved.balance_sheet.total_assets == Decimal("2100000")
+    assert saved.income_statement.total_revenue == Decimal("1000000")
+    assert saved.cash_flow_statement.net_profit == Decimal("100000")
+    assert saved.financial_indicators.eps == Decimal("0.5")
+    # 再次保存同样只带部分报表的报告时没有变化
+    assert repository.save_many([restated]).unchanged == 1
@@ -0,0 +1,55 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from ..models.frame_converter import (
+    frame_to_models, to_dates, to_decimals, to_strs, to_date_strs, to_floats
+)
+from ..models.daily_quote import DailyQuote
+from ..models.stock import Stock
+from ..models.financial_report import CashFlowStatement
+
+def test_to_dates():
+    """测试日期列整列解析，空值和非法值为 None"""
+    series = pd.Series(['20230103', None, '20230103', np.nan, '', 'bad', 20230104], dtype=object)
+    assert to_dates(series) == [date(2023, 1, 3), None, date(2023, 1, 3), None, None, None, date(2023, 1, 4)]
+    assert to_date_strs(pd.Series(['20230103', None])) == ['2023-01-03', None]
+
+def test_to_decimals_and_floats():
+    """测试数值列转换，与逐个 Decimal(str(x)) 的结果一致"""
+    series = pd.Series([10.5, np.nan, 0.1, None], dtype=object)
+    assert to_decimals(series) == [Decimal('10.5'), None, Decimal('0.1'), None]
+    assert to_floats(pd.Series([1.5, np.nan, None])) == [1.5, None, None]
+
+def test_to_strs():
+    """测试文本列空值转换为 None"""
+    assert to_strs(pd.Series(['a', None, np.nan])) == ['a', None, None]
+
+def test_frame_to_models():
+    """测试按字段类型注解整列转换为对象"""
+    df = pd.DataFrame({
+        'ts_code': ['000001.SZ', '000002.SZ'],
+        'trade_date': ['20230103', '20230104'],
+        'open': [10.0, 20.5], 'high': [11.0, 21.0], 'low': [9.5, 20.0], 'close': [10.5, 20.8],
+        'pre_close': [10.0, 20.5], 'change': [0.5, 0.3], 'pct_chg': [5.0, 1.46],
+        'vol': [1000.0, np.nan], 'amount': [10500.0, 20800.0],
+    })
+    quotes = frame_to_models(df, DailyQuote)
+    assert quotes[0] == DailyQuote(
+        ts_code='000001.SZ', trade_date=date(2023, 1, 3), open=Decimal('10.0'), high=Decimal('11.0'),
+        low=Decimal('9.5'), close=Decimal('10.5'), pre_close=Decimal('10.0'), change=Decimal('0.5'),
+        pct_chg=Decimal('5.0'), vol=Decimal('1000.0'), amount=Decimal('10500.0'))
+    assert quotes[1].vol is None
+    assert frame_to_models(df.iloc[0:0], DailyQuote) == []
+
+def test_frame_to_models_missing_columns_and_overrides():
+    """测试缺少的列为 None，并可按字段覆盖转换函数"""
+    stocks = frame_to_models(pd.DataFrame({'ts_code': ['000001.SZ'], 'list_date': ['19910403']}), Stock)
+    assert stocks[0].ts_code == '000001.SZ'
+    assert stocks[0].list_date == date(1991, 4, 3)
+    assert stocks[0].delist_date is None
+    assert stocks[0].name is None
+    flows = frame_to_models(pd.DataFrame({'ts_code': ['000001.SZ'], 'update_flag': [1.0]}),
+                            CashFlowStatement, converters={'update_flag': to_decimals})
+    assert flows[0].update_flag == Decimal('1.0')
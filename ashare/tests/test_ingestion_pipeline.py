@@ -0,0 +1,138 @@
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from ..models.ingestion_pipeline import IngestionPipeline
+
+def test_pipeline_writes_all_rows():
+    """测试所有任务的数据都被写入"""
+    saved = []
+    pipeline = IngestionPipeline(
+        fetch=lambda item: [(item, i) for i in range(3)],
+        save=saved.extend,
+        concurrency=4,
+        batch_size=10
+    )
+    written = pipeline.run(range(20))
+    assert written == 60
+    assert sorted(saved) == sorted((item, i) for item in range(20) for i in range(3))
+
+def test_pipeline_batches_writes():
+    """测试按 batch_size 合并写入"""
+    batches = []
+    committed = []
+    pipeline = IngestionPipeline(
+        fetch=lambda item: [item] * 2,
+        save=lambda rows: batches.append(len(rows)),
+        concurrency=2,
+        batch_size=5,
+        on_committed=lambda pending: committed.extend(item for item, _ in pending)
+    )
+    pipeline.run(range(7))
+    # 每批至少5行（最后一批除外），共14行
+    assert sum(batches) == 14
+    assert all(size >= 5 for size in batches[:-1])
+    assert sorted(committed) == list(range(7))
+
+def test_pipeline_writes_from_calling_thread():
+    """测试写入只在调用 run 的线程中执行"""
+    writer_threads = set()
+    pipeline = IngestionPipeline(
+        fetch=lambda item: [item],
+        save=lambda rows: writer_threads.add(threading.get_ident()),
+        concurrency=4,
+        batch_size=1
+    )
+    pipeline.run(range(10))
+    assert writer_threads == {threading.get_ident()}
+
+def test_pipeline_fetches_concurrently():
+    """测试拉取并发执行"""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch(item):
+        with lock:
+            active.append(item)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(item)
+        return [item]
+
+    IngestionPipeline(fetch=fetch, save=lambda rows: None, concurrency=4).run(range(12))
+    assert max(peak) > 1
+
+def test_pipeline_backpressure():
+    """测试写入慢时拉取线程被有界队列阻塞"""
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch(item):
+        with lock:
+            fetched.append(item)
+        return [item]
+
+    def save(rows):
+        # 写入期间已拉取的数量不应超过 已写入 + 队列长度 + 线程数
+        with lock:
+            assert len(fetched) <= len(saved) + len(rows) + 2 + 2
+        saved.extend(rows)
+        time.sleep(0.01)
+
+    saved = []
+    IngestionPipeline(fetch=fetch, save=save, concurrency=2, queue_size=2, batch_size=1).run(range(20))
+    assert sorted(saved) == list(range(20))
+
+def test_pipeline_propagates_fetch_error():
+    """测试拉取失败时抛出异常且已提交的批次保留"""
+    saved = []
+
+    def fetch(item):
+        if item == 5:
+            raise RuntimeError("拉取失败")
+        return [item]
+
+    pipeline = IngestionPipeline(fetch=fetch, save=saved.extend, concurrency=1, batch_size=1)
+    with pytest.raises(RuntimeError, match="拉取失败"):
+        pipeline.run(range(10))
+    # 失败前已提交的批次保留，失败的任务不写入
+    assert saved[:5] == [0, 1, 2, 3, 4]
+    assert 5 not in saved
+
+def test_pipeline_flushes_fetched_results_on_error():
+    """测试拉取中途失败时，已拉取但尚未写入的结果（包括队列中的）先写入再抛出异常"""
+    fetched, saved, committed = set(), [], []
+    lock = threading.Lock()
+
+    def fetch(item):
+        time.sleep(0.01)
+        if item == 7:
+            raise RuntimeError("拉取失败")
+        with lock:
+            fetched.add(item)
+        return [item]
+
+    pipeline = IngestionPipeline(fetch=fetch, save=saved.extend, concurrency=4, queue_size=4, batch_size=100,
+                                 on_committed=lambda batch: committed.extend(item for item, _ in batch))
+    with pytest.raises(RuntimeError, match="拉取失败"):
+        pipeline.run(range(20))
+    assert sorted(saved) == sorted(committed) == sorted(fetched)
+    assert 7 not in saved and len(saved) >= 4
+
+def test_pipeline_save_error_is_not_committed():
+    """测试写入失败时直接抛出异常，该批次不会再次写入，也不会回调 on_committed"""
+    save = Mock(side_effect=RuntimeError("写入失败"))
+    committed = []
+    pipeline = IngestionPipeline(fetch=lambda item: [item], save=save, concurrency=2, batch_size=1,
+                                 on_committed=committed.extend)
+    with pytest.raises(RuntimeError, match="写入失败"):
+        pipeline.run(range(5))
+    assert save.call_count == 1
+    assert committed == []
+
+def test_pipeline_invalid_concurrency():
+    """测试非法并发数"""
+    with pytest.raises(ValueError):
+        IngestionPipeline(fetch=lambda item: [], save=lambda rows: None, concurrency=0)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from ..models.panel import Panel
+
+def test_from_records_chunks():
+    """测试分块记录合并为面板，股票代码在各块中的编号一致，缺失为 NaN"""
+    panel = Panel.from_records(
+        'close',
+        [np.array(['000002.SZ', '000001.SZ']), np.array(['000001.SZ'])],
+        [np.array([20230103, 20230103]), np.array([20230104])],
+        [np.array([20.0, 10.0]), np.array([10.5])]
+    )
+    assert panel.ts_codes.tolist() == ['000001.SZ', '000002.SZ']
+    assert panel.trade_dates.tolist() == [20230103, 20230104]
+    assert panel.shape == (2, 2)
+    np.testing.assert_array_equal(panel.column('000001.SZ'), [10.0, 10.5])
+    np.testing.assert_array_equal(panel.row(20230104), [10.5, np.nan])
+    with pytest.raises(KeyError):
+        panel.column('000003.SZ')
+    with pytest.raises(KeyError):
+        panel.row(20230105)
+
+def test_from_records_with_ts_codes():
+    """测试指定股票代码时按给定顺序排列列，丢弃其他股票的记录"""
+    panel = Panel.from_records('close', [np.array(['000001.SZ', '000002.SZ'])], [np.array([20230103, 20230103])],
+                               [np.array([10.0, 20.0])], ts_codes=['000003.SZ', '000001.SZ'])
+    assert panel.ts_codes.tolist() == ['000003.SZ', '000001.SZ']
+    np.testing.assert_array_equal(panel.values, [[np.nan, 10.0]])
+
+def test_empty():
+    """测试没有记录时为空面板"""
+    panel = Panel.from_records('close', [], [], [])
+    assert panel.shape == (0, 0)
+
+def test_cache_dir_and_load(tmp_path):
+    """测试写入缓存目录后以内存映射方式返回，可用 Panel.load 重新打开"""
+    cache_dir = str(tmp_path / 'close')
+    panel = Panel.from_records('close', [np.array(['000001.SZ'])], [np.array([20230103])], [np.array([10.0])],
+                               cache_dir=cache_dir)
+    assert isinstance(panel.values, np.memmap)
+    loaded = Panel.load(cache_dir)
+    assert loaded.field == 'close'
+    assert loaded.ts_codes.tolist() == ['000001.SZ']
+    np.testing.assert_array_equal(loaded.values, [[10.0]])
+    panel.save(str(tmp_path / 'copy'))
+    assert Panel.load(str(tmp_path / 'copy'), mmap_mode=None).trade_dates.tolist() == [20230103]
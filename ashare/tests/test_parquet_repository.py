@@ -0,0 +1,118 @@
+import os
+import pytest
+from datetime import date
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from ..models.daily_quote import DailyQuote
+from ..models.daily_indicator_repository import DailyIndicatorRepository
+from ..models.daily_quote_repository import DailyQuoteRepository
+from ..models.parquet_daily_quote_repository import ParquetDailyQuoteRepository
+from ..models.parquet_daily_indicator_repository import ParquetDailyIndicatorRepository
+from ..models.sqlite_repository import UpsertResult
+
+@pytest.fixture
+def repo(tmp_path):
+    return ParquetDailyQuoteRepository(str(tmp_path / 'parquet'))
+
+def make_quote(ts_code: str, trade_date: date, price: str) -> DailyQuote:
+    value = Decimal(price)
+    return DailyQuote(ts_code, trade_date, value, value, value, value, value, value, value, value, value)
+
+def partition_files(repo, year: int) -> list:
+    return sorted(os.listdir(os.path.join(repo.path, f"year={year}")))
+
+def test_save_and_find(repo):
+    """测试保存后按股票、日期查询，结果与 SQLite 仓库一样按主键排序并转换为 Decimal"""
+    quotes = [make_quote('000002.SZ', date(2023, 1, 3), '20.5'), make_quote('000001.SZ', date(2023, 1, 4), '10.1'),
+              make_quote('000001.SZ', date(2023, 1, 3), '10.0'), make_quote('000001.SZ', date(2022, 12, 30), '9.9')]
+    assert repo.save_many(quotes) == UpsertResult(inserted=4)
+    assert [quote.trade_date for quote in repo.find_by_code('000001.SZ')] == \
+        [date(2022, 12, 30), date(2023, 1, 3), date(2023, 1, 4)]
+    assert repo.find_by_code_and_date('000002.SZ', date(2023, 1, 3)) == quotes[0]
+    assert repo.find_by_code_and_date('000002.SZ', date(2023, 1, 4)) is None
+    assert [quote.ts_code for quote in repo.find_by_date(date(2023, 1, 3))] == ['000001.SZ', '000002.SZ']
+    assert repo.find_latest_trade_date() == date(2023, 1, 4)
+    assert repo.find_latest_trade_dates() == {'000001.SZ': date(2023, 1, 4), '000002.SZ': date(2023, 1, 3)}
+    assert repo.find_ts_codes() == {'000001.SZ', '000002.SZ'}
+    assert partition_files(repo, 2022) == ['data.parquet']
+
+def test_empty_repository(repo):
+    """测试没有数据时的查询"""
+    assert repo.find_by_code('000001.SZ') == []
+    assert repo.find_latest_trade_date() is None
+    assert repo.find_latest_trade_dates() == {}
+    assert repo.find_ts_codes() == set()
+    assert repo.read_frame(['ts_code', 'close']).empty
+
+def test_append_new_days_and_new_stocks(repo):
+    """测试新的交易日和新股票写为追加文件，不重写已有分区，compact 后合并为一个文件"""
+    repo.save_many([make_quote('000001.SZ', date(2023, 1, 3), '10.0')])
+    assert repo.save_many([make_quote('000001.SZ', date(2023, 1, 4), '10.1')]) == UpsertResult(inserted=1)
+    assert repo.save_many([make_quote('000002.SZ', date(2023, 1, 3), '20.0')]) == UpsertResult(inserted=1)
+    assert len(partition_files(repo, 2023)) == 3
+    repo.compact()
+    assert partition_files(repo, 2023) == ['data.parquet']
+    assert len(repo.find_by_code('000001.SZ')) == 2
+
+def test_upsert_counts_and_rewrite(repo):
+    """测试与已有记录重叠时按主键合并：内容相同的不计入写入，有变化的覆盖旧值"""
+    repo.save_many([make_quote('000001.SZ', date(2023, 1, 3), '10.0'),
+                    make_quote('000001.SZ', date(2023, 1, 4), '10.1')])
+    result = repo.save_many([make_quote('000001.SZ', date(2023, 1, 3), '10.0'),
+                             make_quote('000001.SZ', date(2023, 1, 4), '10.5'),
+                             make_quote('000001.SZ', date(2023, 1, 2), '9.5')])
+    assert result == UpsertResult(inserted=1, updated=1, unchanged=1)
+    assert [quote.close for quote in repo.find_by_code('000001.SZ')] == \
+        [Decimal('9.5'), Decimal('10.0'), Decimal('10.5')]
+    assert partition_files(repo, 2023) == ['data.parquet']
+    assert repo.save_many([make_quote('000001.SZ', date(2023, 1, 3), '10.0')]) == UpsertResult(unchanged=1)
+
+def test_save_frame_and_read_frame(tmp_path):
+    """测试直接保存 tushare 原始数据，按列和条件读取"""
+    repo = ParquetDailyIndicatorRepository(str(tmp_path / 'parquet'))
+    df = pd.DataFrame({
+        'ts_code': ['000001.SZ', '000002.SZ', '000001.SZ'],
+        'trade_date': ['20221230', '20230103', '20230103'],
+    })
+    for name in DailyIndicatorRepository.VALUE_COLUMNS:
+        df[name] = [1.0, 2.0, None]
+    assert repo.save_frame(df) == UpsertResult(inserted=3)
+    assert repo.save_frame(df) == UpsertResult(unchanged=3)
+    frame = repo.read_frame(['ts_code', 'trade_date', 'pe'], ts_codes=['000001.SZ'], start=date(2023, 1, 1))
+    assert list(frame.columns) == ['ts_code', 'trade_date', 'pe']
+    assert frame['trade_date'].tolist() == [pd.Timestamp('2023-01-03')]
+    assert frame['pe'].isna().all()
+    assert repo.find_by_code_and_date('000001.SZ', date(2023, 1, 3)).pe is None
+    assert len(repo.read_frame(['close'], end=date(2022, 12, 31))) == 1
+
+def test_find_by_code_arrays(repo, tmp_path):
+    """测试按列读取的结果与 SQLite 数据仓库相同"""
+    quotes = [make_quote('000001.SZ', date(2022, 12, 30), '9.9'), make_quote('000001.SZ', date(2023, 1, 3), '10.0'),
+              make_quote('000002.SZ', date(2023, 1, 3), '20.0')]
+    repo.save_many(quotes)
+    sqlite_repo = DailyQuoteRepository(str(tmp_path / 'quotes.db'))
+    sqlite_repo.save_many(quotes)
+    for start in (None, date(2023, 1, 1)):
+        arrays = repo.find_by_code_arrays('000001.SZ', start=start, columns=['close', 'vol'])
+        expected = sqlite_repo.find_by_code_arrays('000001.SZ', start=start, columns=['close', 'vol'])
+        assert list(arrays) == list(expected)
+        for name in expected:
+            assert arrays[name].dtype == expected[name].dtype
+            np.testing.assert_array_equal(arrays[name], expected[name])
+    with pytest.raises(ValueError):
+        repo.find_by_code_arrays('000001.SZ', columns=['pe'])
+
+def test_load_panel(repo, tmp_path):
+    """测试面板与 SQLite 数据仓库的结果相同"""
+    quotes = [make_quote('000001.SZ', date(2022, 12, 30), '9.9'), make_quote('000001.SZ', date(2023, 1, 3), '10.0'),
+              make_quote('000002.SZ', date(2023, 1, 3), '20.0')]
+    repo.save_many(quotes)
+    sqlite_repo = DailyQuoteRepository(str(tmp_path / 'quotes.db'))
+    sqlite_repo.save_many(quotes)
+    for kwargs in ({}, {'ts_codes': ['000002.SZ', '000001.SZ'], 'start': date(2023, 1, 1)}):
+        panel = repo.load_panel('close', **kwargs)
+        expected = sqlite_repo.load_panel('close', **kwargs)
+        np.testing.assert_array_equal(panel.trade_dates, expected.trade_dates)
+        np.testing.assert_array_equal(panel.ts_codes, expected.ts_codes)
+        np.testing.assert_array_equal(panel.values, expected.values)
@@ -0,0 +1,94 @@
+import threading
+import pytest
+from ..models.rate_limiter import TokenBucket, RateLimiter
+
+class FakeClock:
+    """可控的时钟，sleep 直接推进时间"""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_token_bucket_paces_calls(clock):
+    """测试令牌耗尽后按速率等待"""
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.now == pytest.approx(2.0)
+
+def test_token_bucket_refills_over_time(clock):
+    """测试空闲一段时间后无需等待"""
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    clock.now += 5
+    assert bucket.acquire() == 0.0
+
+def test_token_bucket_burst(clock):
+    """测试桶容量允许突发调用"""
+    bucket = TokenBucket(60, burst=3, clock=clock, sleep=clock.sleep)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(1.0)
+
+def test_token_bucket_invalid_rate():
+    """测试非法速率"""
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+def test_rate_limiter_per_endpoint_quotas(clock):
+    """测试不同接口使用各自的配额"""
+    limiter = RateLimiter({'daily': 120, 'income': 30}, default_calls_per_minute=60,
+                          safety_factor=1.0, clock=clock, sleep=clock.sleep)
+    limiter.acquire('daily')
+    assert limiter.acquire('daily') == pytest.approx(0.5)
+    limiter.acquire('income')
+    assert limiter.acquire('income') == pytest.approx(2.0)
+    limiter.acquire('dividend')
+    assert limiter.acquire('dividend') == pytest.approx(1.0)
+
+def test_rate_limiter_safety_factor(clock):
+    """测试安全系数降低实际速率"""
+    limiter = RateLimiter({'daily': 60}, safety_factor=0.5, clock=clock, sleep=clock.sleep)
+    limiter.acquire('daily')
+    assert limiter.acquire('daily') == pytest.approx(2.0)
+
+def test_rate_limiter_stats(clock):
+    """测试等待统计"""
+    limiter = RateLimiter({'daily': 60}, safety_factor=1.0, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        limiter.acquire('daily')
+    stats = limiter.get_stats()['daily']
+    assert stats['calls'] == 3
+    assert stats['waited_calls'] == 2
+    assert stats['total_wait'] == pytest.approx(2.0)
+
+def test_rate_limiter_configure_resets_buckets(clock):
+    """测试重新配置配额"""
+    limiter = RateLimiter({'daily': 60}, safety_factor=1.0, clock=clock, sleep=clock.sleep)
+    limiter.acquire('daily')
+    limiter.configure({'daily': 600}, safety_factor=1.0)
+    limiter.acquire('daily')
+    assert limiter.acquire('daily') == pytest.approx(0.1)
+
+def test_rate_limiter_shared_between_threads():
+    """测试多线程共享配额时总等待时间符合速率"""
+    waits = []
+    limiter = RateLimiter({'daily': 6000}, safety_factor=1.0, sleep=lambda s: None)
+    threads = [threading.Thread(target=lambda: waits.append(limiter.acquire('daily'))) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert limiter.get_stats()['daily']['calls'] == 10
+    # 预占令牌后排队：第 n 个调用需等待约 (n-1) * 0.01 秒
+    assert max(waits) == pytest.approx(0.09, abs=0.01)
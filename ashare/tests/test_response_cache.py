@@ -0,0 +1,98 @@
+import time
+from datetime import date
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+from ..models.response_cache import ResponseCache, CacheMode, CacheMissError
+from ..models.tushare_api import TushareAPI
+from ..models.rate_limiter import RateLimiter
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({'ts_code': ['000001.SZ'], 'trade_date': ['20230103'], 'close': [10.5]})
+
+def test_key_normalization(cache_dir):
+    """测试等价参数得到相同的键"""
+    cache = ResponseCache(cache_dir)
+    key = cache.make_key('daily', {'ts_code': '000001.SZ', 'start_date': '20230103'})
+    assert key == cache.make_key('daily', {'start_date': date(2023, 1, 3), 'ts_code': '000001.SZ'})
+    assert key == cache.make_key('daily', {'ts_code': '000001.SZ', 'start_date': '20230103', 'fields': '', 'end_date': None})
+    assert cache.make_key('daily', {'fields': 'a, b'}) == cache.make_key('daily', {'fields': 'a,b'})
+    assert key != cache.make_key('daily_basic', {'ts_code': '000001.SZ', 'start_date': '20230103'})
+
+def test_put_and_get(cache_dir, sample_df):
+    """测试写入和读取缓存"""
+    cache = ResponseCache(cache_dir)
+    assert cache.get('daily', {'ts_code': '000001.SZ'}) is None
+    cache.put('daily', {'ts_code': '000001.SZ'}, sample_df)
+    pd.testing.assert_frame_equal(cache.get('daily', {'ts_code': '000001.SZ'}), sample_df)
+
+def test_empty_result_not_cached(cache_dir, sample_df):
+    """测试空结果（数据尚未发布）不写入缓存，之后的请求仍会访问接口"""
+    cache = ResponseCache(cache_dir)
+    cache.put('daily', {'trade_date': '20230103'}, sample_df.iloc[0:0])
+    assert cache.get('daily', {'trade_date': '20230103'}) is None
+    cache.put('daily', {'trade_date': '20230103'}, sample_df)
+    pd.testing.assert_frame_equal(cache.get('daily', {'trade_date': '20230103'}), sample_df)
+
+def test_ttl_per_endpoint(cache_dir, sample_df):
+    """测试按接口设置的过期时间"""
+    now = [time.time()]
+    cache = ResponseCache(cache_dir, ttls={'stock_basic': 10, 'daily': None}, default_ttl=100,
+                          clock=lambda: now[0])
+    cache.put('stock_basic', {}, sample_df)
+    cache.put('daily', {}, sample_df)
+    cache.put('income', {}, sample_df)
+    now[0] += 50
+    assert cache.get('stock_basic', {}) is None
+    assert cache.get('income', {}) is not None
+    now[0] += 100
+    assert cache.get('income', {}) is None
+    assert cache.get('daily', {}) is not None
+
+def test_replay_mode(cache_dir, sample_df):
+    """测试回放模式：忽略过期，未命中时抛出异常，不写入"""
+    ResponseCache(cache_dir).put('daily', {'ts_code': '000001.SZ'}, sample_df)
+    replay = ResponseCache(cache_dir, mode=CacheMode.REPLAY, default_ttl=0,
+                           clock=lambda: time.time() + 3600)
+    assert replay.get('daily', {'ts_code': '000001.SZ'}) is not None
+    with pytest.raises(CacheMissError):
+        replay.get('daily', {'ts_code': '000002.SZ'})
+    replay.put('daily', {'ts_code': '000002.SZ'}, sample_df)
+    with pytest.raises(CacheMissError):
+        replay.get('daily', {'ts_code': '000002.SZ'})
+
+def test_from_env(monkeypatch, cache_dir):
+    """测试按环境变量创建缓存"""
+    monkeypatch.delenv('TUSHARE_CACHE_DIR', raising=False)
+    assert ResponseCache.from_env() is None
+    monkeypatch.setenv('TUSHARE_CACHE_DIR', cache_dir)
+    monkeypatch.setenv('TUSHARE_CACHE_MODE', 'replay')
+    cache = ResponseCache.from_env()
+    assert cache.cache_dir == cache_dir
+    assert cache.replay_only
+
+def test_tushare_api_uses_cache(cache_dir, sample_df):
+    """测试 TushareAPI 命中缓存时不调用接口"""
+    limiter = RateLimiter({}, default_calls_per_minute=600000, safety_factor=1.0)
+    api = TushareAPI('fake-token', rate_limiter=limiter, cache=ResponseCache(cache_dir))
+    api.api = Mock()
+    api.api.daily.return_value = sample_df
+    first = api.daily(ts_code='000001.SZ', start_date='20230103')
+    second = api.daily(ts_code='000001.SZ', start_date='20230103')
+    assert api.api.daily.call_count == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert limiter.get_stats()['daily']['calls'] == 1
+
+def test_tushare_api_replay_without_token(cache_dir, sample_df):
+    """测试回放模式不需要 token 也不访问网络"""
+    ResponseCache(cache_dir).put('daily', {'ts_code': '000001.SZ'}, sample_df)
+    api = TushareAPI('', cache=ResponseCache(cache_dir, mode=CacheMode.REPLAY))
+    assert api.api is None
+    pd.testing.assert_frame_equal(api.daily(ts_code='000001.SZ'), sample_df)
+    with pytest.raises(CacheMissError):
+        api.daily(ts_code='000002.SZ')
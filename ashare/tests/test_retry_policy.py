@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+import requests
+from unittest.mock import Mock
+from ..models.retry_policy import (
+    RetryPolicy, ErrorKind, TushareError, classify_error, retry_after_of
+)
+
+@pytest.mark.parametrize("error, kind", [
+    (Exception('抱歉，您每分钟最多访问该接口500次，权限的具体详情访问：https://tushare.pro/document/1?doc_id=108。'),
+     ErrorKind.RATE_LIMIT),
+    (Exception('抱歉，您每天最多访问该接口20000次，权限的具体详情访问：https://tushare.pro/document/1?doc_id=108。'),
+     ErrorKind.PERMANENT),
+    (Exception('抱歉，您没有访问该接口的权限'), ErrorKind.PERMANENT),
+    (Exception('您的token不对，请确认。'), ErrorKind.PERMANENT),
+    (TushareError('参数错误', code=40101), ErrorKind.PERMANENT),
+    (ValueError('bad value'), ErrorKind.PERMANENT),
+    (Exception('无数据'), ErrorKind.EMPTY),
+    (requests.exceptions.ConnectionError('connection reset'), ErrorKind.TRANSIENT),
+    (requests.exceptions.ReadTimeout('read timed out'), ErrorKind.TRANSIENT),
+    (asyncio.TimeoutError(), ErrorKind.TRANSIENT),
+    (ConnectionResetError(), ErrorKind.TRANSIENT),
+    (Exception('网络错误'), ErrorKind.TRANSIENT),
+])
+def test_classify_error(error, kind):
+    """测试错误分类"""
+    assert classify_error(error) == kind
+
+def test_classify_http_status():
+    """测试按 HTTP 状态码分类"""
+    def http_error(status):
+        error = requests.exceptions.HTTPError(f"{status} error")
+        error.response = Mock(status_code=status, headers={})
+        return error
+    assert classify_error(http_error(429)) == ErrorKind.RATE_LIMIT
+    assert classify_error(http_error(503)) == ErrorKind.TRANSIENT
+    assert classify_error(http_error(403)) == ErrorKind.PERMANENT
+
+def test_retry_after_of():
+    """测试取出服务端建议的等待时间"""
+    assert retry_after_of(TushareError('限流', retry_after=12.0)) == 12.0
+    error = requests.exceptions.HTTPError('429')
+    error.response = Mock(status_code=429, headers={'Retry-After': '30'})
+    assert retry_after_of(error) == 30.0
+    assert retry_after_of(Exception('网络错误')) is None
+
+def test_should_retry():
+    """测试只有限流和临时错误重试，且不超过最大次数"""
+    policy = RetryPolicy(max_retries=3)
+    assert policy.should_retry(ErrorKind.TRANSIENT, 0)
+    assert policy.should_retry(ErrorKind.RATE_LIMIT, 1)
+    assert not policy.should_retry(ErrorKind.TRANSIENT, 2)
+    assert not policy.should_retry(ErrorKind.PERMANENT, 0)
+    assert not policy.should_retry(ErrorKind.EMPTY, 0)
+
+def test_delay_with_jitter_and_cap():
+    """测试退避时间指数增长、有上限并带抖动"""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rate_limit_delay=4.0, random_func=lambda: 0.5)
+    assert [policy.backoff(ErrorKind.TRANSIENT, i) for i in range(4)] == [1.0, 2.0, 4.0, 5.0]
+    assert [policy.backoff(ErrorKind.RATE_LIMIT, i) for i in range(2)] == [4.0, 5.0]
+    assert policy.delay(ErrorKind.TRANSIENT, 2) == 3.0
+    assert RetryPolicy(random_func=lambda: 0.0).delay(ErrorKind.TRANSIENT, 0) == 0.5
+    assert policy.delay(ErrorKind.RATE_LIMIT, 0, retry_after=3.0) == 3.0
+    # 服务端给出的等待时间也不超过 max_delay
+    assert policy.delay(ErrorKind.RATE_LIMIT, 0, retry_after=42.0) == 5.0
+
+def test_max_retries_validation():
+    """测试 max_retries 不能为负数，为0时仍调用一次"""
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+    assert RetryPolicy(max_retries=0).attempts == 1
+    assert not RetryPolicy(max_retries=0).should_retry(ErrorKind.TRANSIENT, 0)
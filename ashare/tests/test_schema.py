@@ -0,0 +1,78 @@
+import sqlite3
+import pytest
+from unittest.mock import patch
+from ..models import schema
+from ..models.schema import LATEST_VERSION, MIGRATIONS, Migration, current_version, migrate
+from ..models.connection_manager import ConnectionManager
+from ..models.daily_quote_repository import DailyQuoteRepository
+from ..models.stock_repository import StockRepository
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'schema.db')
+
+def _tables(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'index')")}
+
+def test_migrate_new_database(db_path):
+    """测试新库建出所有表并记录每个版本"""
+    conn = sqlite3.connect(db_path)
+    assert current_version(conn) == 0
+    assert migrate(conn) == LATEST_VERSION
+    assert current_version(conn) == LATEST_VERSION
+    assert {'stocks', 'daily_quotes', 'adj_factors', 'sync_checkpoints',
+            'idx_dividends_ann_date'} <= _tables(conn)
+    versions = [row[0] for row in conn.execute('SELECT version FROM schema_version ORDER BY version')]
+    assert versions == [migration.version for migration in MIGRATIONS]
+
+def test_migrate_applies_once(db_path):
+    """测试已是最新版本时不再执行任何变更"""
+    conn = sqlite3.connect(db_path)
+    migrate(conn)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    migrate(conn)
+    assert not any(statement.lstrip().startswith(('CREATE INDEX', 'INSERT')) for statement in statements)
+    assert conn.execute('SELECT COUNT(*) FROM schema_version').fetchone()[0] == len(MIGRATIONS)
+
+def test_upgrade_legacy_database(db_path):
+    """测试引入版本表之前建的库保留数据并升级到最新版本"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE dividends (
+            ts_code TEXT NOT NULL, end_date TEXT NOT NULL, ann_date TEXT, div_proc TEXT,
+            stk_div DECIMAL(20,4), stk_bo_rate DECIMAL(20,4), stk_co_rate DECIMAL(20,4),
+            cash_div DECIMAL(20,4), cash_div_tax DECIMAL(20,4), record_date TEXT, ex_date TEXT,
+            pay_date TEXT, div_listdate TEXT, imp_ann_date TEXT, base_date TEXT, base_share DECIMAL(20,4),
+            PRIMARY KEY (ts_code, end_date)
+        )
+    ''')
+    conn.execute("INSERT INTO dividends (ts_code, end_date, ann_date) VALUES ('000001.SZ', '2023-12-31', '2024-03-15')")
+    conn.commit()
+    assert migrate(conn) == LATEST_VERSION
+    assert 'idx_dividends_ann_date' in _tables(conn)
+    assert conn.execute('SELECT COUNT(*) FROM dividends').fetchone()[0] == 1
+
+def test_migrate_rolls_back_failed_version(db_path):
+    """测试某个版本执行失败时整体回滚，版本号停留在上一个版本"""
+    conn = sqlite3.connect(db_path)
+    migrate(conn)
+    broken = MIGRATIONS + (Migration(LATEST_VERSION + 1, '失败的变更', (
+        'CREATE INDEX idx_stocks_name ON stocks(name)',
+        'CREATE INDEX idx_missing ON missing_table(col)',
+    )),)
+    with patch.object(schema, 'MIGRATIONS', broken):
+        with pytest.raises(sqlite3.OperationalError):
+            migrate(conn, LATEST_VERSION + 1)
+    assert current_version(conn) == LATEST_VERSION
+    assert 'idx_stocks_name' not in _tables(conn)
+
+def test_repository_construction_checks_schema_once(db_path):
+    """测试同一数据库文件只在第一次创建仓库时升级表结构"""
+    with patch('ashare.models.connection_manager.migrate', wraps=migrate) as mocked:
+        StockRepository(db_path)
+        DailyQuoteRepository(db_path)
+        StockRepository(db_path)
+    assert mocked.call_count == 1
+    conn = ConnectionManager.for_database(db_path).connection()
+    assert current_version(conn) == LATEST_VERSION
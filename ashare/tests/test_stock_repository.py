@@ -1,8 +1,10 @@
 import os
 import pytest
+from dataclasses import replace
 from datetime import date
 from ashare.models.stock import Stock
 from ashare.models.stock_repository import StockRepository
+from ashare.models.sqlite_repository import UpsertResult
 
 @pytest.fixture
 def db_path(tmp_path):
@@ -143,4 +145,12 @@ def test_find_by_industry_not_found(repo, sample_stocks):
     """测试查询不存在的行业"""
     repo.save_many(sample_stocks)
     stocks = repo.find_by_industry("不存在的行业")
-    assert len(stocks) == 0
\ No newline at end of file
+    assert len(stocks) == 0
+
+def test_save_many_reports_changes(repo, sample_stocks):
+    """测试批量保存返回新增、更新和未变化的记录数"""
+    assert repo.save_many(sample_stocks) == UpsertResult(inserted=len(sample_stocks))
+    renamed = replace(sample_stocks[0], name="新名称")
+    assert repo.save_many([renamed] + sample_stocks[1:]) == \
+        UpsertResult(updated=1, unchanged=len(sample_stocks) - 1)
+    assert repo.find_by_ts_code(renamed.ts_code).name == "新名称"
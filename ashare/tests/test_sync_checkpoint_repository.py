@@ -0,0 +1,41 @@
+import pytest
+from ..models.sync_checkpoint_repository import SyncCheckpointRepository
+from ..models.sync_type import SyncType
+
+@pytest.fixture
+def repository(tmp_path):
+    """创建仓库实例"""
+    return SyncCheckpointRepository(str(tmp_path / "test_checkpoint.db"))
+
+def test_no_checkpoints(repository):
+    """测试没有检查点"""
+    assert repository.get_done_codes(SyncType.DAILY_QUOTE, '2023-01-03') == set()
+
+def test_mark_done_and_get(repository):
+    """测试记录和查询已完成的股票"""
+    repository.mark_done(SyncType.DAILY_QUOTE, ['000001.SZ', '000002.SZ'], '2023-01-03')
+    assert repository.get_done_codes(SyncType.DAILY_QUOTE, '2023-01-03') == {'000001.SZ', '000002.SZ'}
+    assert repository.get_done_codes(SyncType.DIVIDEND, '2023-01-03') == set()
+
+def test_other_run_checkpoints_ignored(repository):
+    """测试其他轮次遗留的检查点不计入"""
+    repository.mark_done(SyncType.DAILY_QUOTE, ['000001.SZ'], '2023-01-03')
+    assert repository.get_done_codes(SyncType.DAILY_QUOTE, '2023-01-04') == set()
+    repository.mark_done(SyncType.DAILY_QUOTE, ['000001.SZ'], '2023-01-04')
+    assert repository.get_done_codes(SyncType.DAILY_QUOTE, '2023-01-04') == {'000001.SZ'}
+
+def test_clear(repository):
+    """测试清除检查点"""
+    repository.mark_done(SyncType.DAILY_QUOTE, ['000001.SZ'], '2023-01-03')
+    repository.mark_done(SyncType.DIVIDEND, ['000001.SZ'], '2023-01-03')
+    repository.clear(SyncType.DAILY_QUOTE)
+    assert repository.get_done_codes(SyncType.DAILY_QUOTE, '2023-01-03') == set()
+    assert repository.get_done_codes(SyncType.DIVIDEND, '2023-01-03') == {'000001.SZ'}
+
+def test_run_persists_until_clear(repository):
+    """测试轮次开始后一直沿用到 clear，与新传入的标识无关"""
+    assert repository.start_run(SyncType.DIVIDEND, '2023-01-03') == '2023-01-03'
+    assert repository.start_run(SyncType.DIVIDEND, '2023-01-04') == '2023-01-03'
+    assert repository.start_run(SyncType.DAILY_QUOTE, '2023-01-04') == '2023-01-04'
+    repository.clear(SyncType.DIVIDEND)
+    assert repository.start_run(SyncType.DIVIDEND, '2023-01-04') == '2023-01-04'
@@ -0,0 +1,53 @@
+import json
+import pytest
+from ..models.sync_metrics import SyncMetrics
+from ..models.rate_limiter import RateLimiter
+
+@pytest.fixture
+def metrics():
+    metrics = SyncMetrics()
+    metrics.record_call('daily', 0.2, 100, key='000001.SZ', started_at=0.0)
+    metrics.record_call('daily', 0.6, 300, key='000002.SZ', retries=2, rate_limit_wait=1.5, started_at=10.0)
+    metrics.record_call('daily', 0.01, 100, key='000001.SZ', cached=True, started_at=20.0)
+    metrics.record_call('income', 0.1, 0, key='000001.SZ', error='超时', started_at=30.0)
+    metrics.record_write('daily_quote', 0.5, 400, 250)
+    metrics.record_write('daily_quote', 0.1, 0)
+    return metrics
+
+def test_endpoint_summary(metrics):
+    """测试按接口汇总，缓存命中不计入耗时统计，按累计耗时排序"""
+    daily, income = metrics.endpoint_summary()
+    assert daily['endpoint'] == 'daily'
+    assert (daily['calls'], daily['cached'], daily['retries'], daily['rows']) == (3, 1, 2, 500)
+    assert daily['total_latency'] == pytest.approx(0.8)
+    assert daily['avg_latency'] == pytest.approx(0.4)
+    assert daily['rate_limit_wait'] == pytest.approx(1.5)
+    assert daily['rows_per_second'] == pytest.approx(500 / 0.8)
+    assert daily['quota_usage'] is None
+    assert income['errors'] == 1
+
+def test_quota_usage(metrics):
+    """测试配额使用率按实际每分钟调用次数与配额之比计算，跨度不足一分钟按一分钟计"""
+    limiter = RateLimiter({'daily': 4, 'income': 200})
+    daily = metrics.endpoint_summary(limiter)[0]
+    assert daily['quota_usage'] == pytest.approx(0.5)
+
+def test_write_summary(metrics):
+    """测试按同步类型汇总写入，提交事务不计入批次"""
+    summary, = metrics.write_summary()
+    assert (summary['sync_type'], summary['batches'], summary['rows'], summary['written']) == \
+        ('daily_quote', 1, 400, 250)
+    assert summary['seconds'] == pytest.approx(0.6)
+
+def test_format_and_export(metrics, tmp_path):
+    """测试汇总表和 JSON 导出"""
+    table = metrics.format_summary()
+    assert 'daily' in table and 'daily_quote' in table and 'daily(000002.SZ)' in table
+    path = tmp_path / 'metrics.json'
+    data = json.loads(metrics.to_json(str(path)))
+    assert json.loads(path.read_text(encoding='utf-8')) == data
+    assert len(data['calls']) == 4
+    assert data['calls'][1]['key'] == '000002.SZ'
+    assert data['writes'][0]['written'] == 250
+    metrics.reset()
+    assert not metrics.calls and not metrics.writes
@@ -0,0 +1,145 @@
+import pytest
+from datetime import date, datetime, time, timedelta
+from unittest.mock import Mock
+import pandas as pd
+from ..models.sync_scheduler import SyncScheduler, SyncSchedule
+from ..models.sync_lock import SyncLock, SyncLockedError
+from ..models.sync_type import SyncType
+from ..models.sync_task_repository import SyncTaskRepository
+from ..models.trade_cal import TradeCal
+from ..models.trade_calendar_repository import TradeCalendarRepository
+from ..models.daily_quote_repository import DailyQuoteRepository
+
+# 2023-01-02（周一）元旦休市
+HOLIDAYS = {date(2023, 1, 2)}
+
+@pytest.fixture
+def db_path(tmp_path):
+    """保存 2022-12-01 至 2023-01-31 交易日历的临时数据库"""
+    db_path = str(tmp_path / 'scheduler.db')
+    days = pd.date_range('2022-12-01', '2023-01-31').date
+    TradeCalendarRepository(db_path).save_many([
+        TradeCal('SSE', day, day.weekday() < 5 and day not in HOLIDAYS, None) for day in days
+    ])
+    return db_path
+
+@pytest.fixture
+def sync_service(db_path):
+    """sync_all 成功时记录各类型的同步完成时间"""
+    service = Mock()
+    service.include_today = False
+    service.sync_task_repo = SyncTaskRepository(db_path)
+
+    def sync_all(sync_types, force=False):
+        for sync_type in sync_types:
+            service.sync_task_repo.update_sync_time(sync_type)
+    service.sync_all.side_effect = sync_all
+    return service
+
+@pytest.fixture
+def scheduler(sync_service, db_path):
+    schedule = {
+        SyncType.DAILY_QUOTE: SyncSchedule(time(16, 30)),
+        SyncType.DIVIDEND: SyncSchedule(time(19, 0), trading_days_only=False),
+    }
+    return SyncScheduler(sync_service, db_path, schedule=schedule)
+
+def test_last_run_time_follows_trading_calendar(scheduler):
+    """测试交易日才触发，节假日和周末沿用之前最近一个交易日的触发时间"""
+    assert scheduler.last_run_time(SyncType.DAILY_QUOTE, datetime(2023, 1, 2, 20, 0)) == \
+        datetime(2022, 12, 30, 16, 30)
+    assert scheduler.last_run_time(SyncType.DAILY_QUOTE, datetime(2023, 1, 3, 16, 0)) == \
+        datetime(2022, 12, 30, 16, 30)
+    assert scheduler.last_run_time(SyncType.DAILY_QUOTE, datetime(2023, 1, 3, 16, 30)) == \
+        datetime(2023, 1, 3, 16, 30)
+    assert scheduler.last_run_time(SyncType.DIVIDEND, datetime(2023, 1, 2, 20, 0)) == \
+        datetime(2023, 1, 2, 19, 0)
+
+def test_missed_runs_are_coalesced(scheduler, sync_service):
+    """测试错过的多次触发合并为一次同步，完成后不再到期"""
+    now = datetime(2023, 1, 5, 20, 0)
+    assert scheduler.due_types(now) == [SyncType.DAILY_QUOTE, SyncType.DIVIDEND]
+    assert scheduler.run_pending(now) == [SyncType.DAILY_QUOTE, SyncType.DIVIDEND]
+    sync_service.sync_all.assert_called_once_with([SyncType.DAILY_QUOTE, SyncType.DIVIDEND], force=True)
+    assert scheduler.run_pending(now) == []
+    assert sync_service.sync_all.call_count == 1
+
+def test_skips_when_locked(scheduler, sync_service, db_path):
+    """测试其他进程持有同步锁时跳过本轮"""
+    with SyncLock.for_database(db_path):
+        assert scheduler.run_pending(datetime(2023, 1, 5, 20, 0)) == []
+    sync_service.sync_all.assert_not_called()
+    assert not scheduler.lock.locked
+
+def test_failed_sync_retries_after_interval(scheduler, sync_service):
+    """测试同步失败的类型在重试间隔之后才再次执行"""
+    sync_service.sync_all.side_effect = Exception("网络错误")
+    now = datetime(2023, 1, 5, 20, 0)
+    assert scheduler.run_pending(now) == [SyncType.DAILY_QUOTE, SyncType.DIVIDEND]
+    assert scheduler.due_types(now + timedelta(minutes=10)) == []
+    assert scheduler.due_types(now + scheduler.retry_interval) == [SyncType.DAILY_QUOTE, SyncType.DIVIDEND]
+
+def _save_quote(db_path, trade_date):
+    DailyQuoteRepository(db_path).save_frame(pd.DataFrame({
+        'ts_code': ['000001.SZ'], 'trade_date': [trade_date],
+        **{name: [1.0] for name in DailyQuoteRepository.VALUE_COLUMNS}
+    }))
+
+def test_stale_after_sync_retries(scheduler, sync_service, db_path):
+    """测试同步完成但最新交易日仍未达到应有的交易日时，该次触发不算完成，等待后有限次重试"""
+    scheduler.max_stale_retries = 2
+    now = datetime(2023, 1, 5, 20, 0)
+    _save_quote(db_path, '20230103')
+    assert scheduler.run_pending(now) == [SyncType.DAILY_QUOTE, SyncType.DIVIDEND]
+    assert scheduler.due_types(now + timedelta(minutes=10)) == []
+    # 行情仍停留在1月3日，应有1月4日的数据；分红不按交易日组织，同步完成即可
+    now += scheduler.retry_interval
+    assert scheduler.due_types(now) == [SyncType.DAILY_QUOTE]
+    assert scheduler.run_pending(now) == [SyncType.DAILY_QUOTE]
+    # 达到重试次数上限后不再重试
+    assert scheduler.due_types(now + scheduler.retry_interval) == []
+
+    # 下一次触发重新计数，数据入库后同步完成即不再到期
+    def sync_all(sync_types, force=False):
+        _save_quote(db_path, '20230105')
+        for sync_type in sync_types:
+            sync_service.sync_task_repo.update_sync_time(sync_type)
+
+    now = datetime(2023, 1, 6, 17, 0)
+    sync_service.sync_all.side_effect = sync_all
+    assert scheduler.run_pending(now) == [SyncType.DAILY_QUOTE]
+    assert scheduler.due_types(now + scheduler.retry_interval) == []
+
+def test_freshness(scheduler, sync_service, db_path):
+    """测试新鲜度：触发时间加 SLA 之后，最新交易日应达到触发日之前的交易日"""
+    _save_quote(db_path, '20221230')
+    sync_service.sync_task_repo.update_sync_time(SyncType.DAILY_QUOTE)
+
+    # 1月3日的触发加 SLA 后应有 12月30日（1月2日休市）的数据
+    quote, dividend = scheduler.freshness(datetime(2023, 1, 3, 19, 0))
+    assert (quote.latest_date, quote.expected_date, quote.is_fresh) == (date(2022, 12, 30), date(2022, 12, 30), True)
+    assert dividend.latest_date is None and dividend.expected_date is None
+    assert not dividend.is_fresh
+
+    quote, _ = scheduler.freshness(datetime(2023, 1, 4, 19, 0))
+    assert quote.expected_date == date(2023, 1, 3)
+    assert not quote.is_fresh
+
+    # 同步到当天时，应有触发当天的数据
+    sync_service.include_today = True
+    quote, _ = scheduler.freshness(datetime(2023, 1, 3, 19, 0))
+    assert quote.expected_date == date(2023, 1, 3)
+
+def test_sync_lock(tmp_path):
+    """测试同步锁互斥，释放后可以再次获取"""
+    path = str(tmp_path / 'db.lock')
+    first, second = SyncLock(path), SyncLock(path)
+    assert first.acquire()
+    assert not second.acquire()
+    with pytest.raises(SyncLockedError):
+        with second:
+            pass
+    first.release()
+    with second:
+        assert second.locked
+    assert not second.locked
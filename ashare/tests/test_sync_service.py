@@ -1,8 +1,32 @@
 import os
+import threading
 import pytest
-from datetime import datetime, date
-from unittest.mock import Mock, patch
-from ..models.sync_service import SyncService
+import pandas as pd
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from unittest.mock import ANY, Mock, patch
+from ..models.sync_service import (
+    SyncService, TradeCalendarSync, DailyQuoteSync, AdjFactorSync, DailyIndicatorSync, DividendSync,
+    FinancialReportSync
+)
+from ..models.fake_tushare import FakeProApi
+from ..models.tushare_api import TushareAPI
+from ..models.rate_limiter import DEFAULT_QUOTAS
+from ..models.financial_report_repository import FinancialReportRepository
+from ..models.trade_calendar_repository import TradeCalendarRepository
+from ..models.trade_calendar_fetcher import TradeCalendarFetcher
+from ..models.trading_calendar import TradingCalendar
+from ..models.sync_session import SyncSession
+from ..models.stock import Stock
+from ..models.stock_repository import StockRepository
+from ..models.daily_quote import DailyQuote
+from ..models.daily_quote_repository import DailyQuoteRepository
+from ..models.adj_factor import AdjFactor
+from ..models.adj_factor_repository import AdjFactorRepository
+from ..models.daily_indicator import DailyIndicator
+from ..models.daily_indicator_repository import DailyIndicatorRepository
+from ..models.dividend import Dividend
+from ..models.dividend_repository import DividendRepository
 from ..models.sync_type import SyncType
 from ..models.sync_task import SyncTask
 
@@ -101,4 +125,485 @@ def test_sync_with_error(sync_service):
         
         # 验证同步时间没有更新
         task = sync_service.sync_task_repo.get_task(SyncType.STOCK_LIST)
-        assert task is None
\ No newline at end of file
+        assert task is None
+
+def _make_stock(ts_code, list_date):
+    return Stock(
+        ts_code=ts_code, symbol=ts_code[:6], name=ts_code, area=None, industry=None,
+        fullname=None, enname=None, cnspell=None, market=None, exchange=None,
+        curr_type=None, list_status='L', list_date=list_date, delist_date=None,
+        is_hs=None, act_name=None, act_ent_type=None
+    )
+
+def _make_quote(ts_code, trade_date):
+    value = Decimal("10")
+    return DailyQuote(
+        ts_code=ts_code, trade_date=trade_date, open=value, high=value, low=value,
+        close=value, pre_close=value, change=value, pct_chg=value, vol=value, amount=value
+    )
+
+def _make_dividend(ts_code, end_date, div_proc):
+    return Dividend(
+        ts_code=ts_code, end_date=end_date, ann_date=end_date + timedelta(days=100), div_proc=div_proc,
+        stk_div=None, stk_bo_rate=None, stk_co_rate=None, cash_div=Decimal("1.5"), cash_div_tax=Decimal("1.5"),
+        record_date=None, ex_date=None, pay_date=None, div_listdate=None, imp_ann_date=None,
+        base_date=None, base_share=None
+    )
+
+@pytest.fixture
+def local_db_path(tmp_path):
+    """不依赖 tushare token 的临时数据库"""
+    return str(tmp_path / "test_sync_local.db")
+
+@pytest.fixture
+def fake_backend():
+    """
+    返回安装离线后端的函数：按传入的参数创建 FakeProApi，让 TushareAPI 使用它并取消限流，
+    测试结束后恢复真实后端和默认限流配额
+    """
+    def install(**kwargs) -> FakeProApi:
+        backend = FakeProApi(**kwargs)
+        TushareAPI.use_backend(backend)
+        TushareAPI.configure_rate_limits({}, default_calls_per_minute=600000, safety_factor=1.0)
+        return backend
+    yield install
+    TushareAPI.use_backend(None)
+    TushareAPI.configure_rate_limits(DEFAULT_QUOTAS)
+
+def test_daily_quote_sync_by_trade_date(local_db_path):
+    """测试已有行情的股票按交易日截面增量同步，新股逐只拉取"""
+    StockRepository(local_db_path).save_many([
+        _make_stock('000001.SZ', date(1991, 4, 3)),
+        _make_stock('000002.SZ', date(1991, 1, 29)),
+        _make_stock('301999.SZ', date(2024, 1, 2)),
+    ])
+    yesterday = date.today() - timedelta(days=1)
+    # 最近一个工作日的前一天作为已保存的最新交易日，保证恰好缺一个交易日
+    last_weekday = yesterday
+    while last_weekday.weekday() >= 5:
+        last_weekday -= timedelta(days=1)
+    latest = last_weekday - timedelta(days=1)
+    DailyQuoteRepository(local_db_path).save_many([
+        _make_quote('000001.SZ', latest),
+        _make_quote('000002.SZ', latest),
+    ])
+
+    fetcher = Mock()
+    fetcher.fetch_daily_quotes_frame_by_trade_date.side_effect = lambda trade_date: pd.DataFrame({
+        'ts_code': ['000001.SZ', '000002.SZ', '600000.SH'],
+        'trade_date': [trade_date.strftime('%Y%m%d')] * 3,
+        **{name: [10.0] * 3 for name in DailyQuoteRepository.VALUE_COLUMNS}
+    })
+    fetcher.fetch_daily_quotes.return_value = [_make_quote('301999.SZ', yesterday)]
+    with patch('ashare.models.sync_service.DailyQuoteFetcher', return_value=fetcher):
+        DailyQuoteSync(local_db_path, 'token').fetch_and_save()
+
+    trade_dates = [c.args[0] for c in fetcher.fetch_daily_quotes_frame_by_trade_date.call_args_list]
+    assert trade_dates == [last_weekday]
+    fetcher.fetch_daily_quotes.assert_called_once_with('301999.SZ', date(2024, 1, 2), yesterday)
+    repo = DailyQuoteRepository(local_db_path)
+    assert repo.find_ts_codes() == {'000001.SZ', '000002.SZ', '301999.SZ'}
+    assert len(repo.find_by_code('000001.SZ')) == 1 + len(trade_dates)
+
+def _last_weekday_and_previous_day():
+    """最近一个工作日（不晚于昨天）及其前一天，按前一天保存数据时恰好缺一个交易日"""
+    last_weekday = date.today() - timedelta(days=1)
+    while last_weekday.weekday() >= 5:
+        last_weekday -= timedelta(days=1)
+    return last_weekday, last_weekday - timedelta(days=1)
+
+def test_daily_quote_sync_catches_up_after_filtered_sync(local_db_path):
+    """测试只同步部分股票后再全量同步，落后于全表最新交易日的股票会被补齐"""
+    codes = ['000001.SZ', '000002.SZ', '000003.SZ']
+    StockRepository(local_db_path).save_many([_make_stock(code, date(1991, 4, 3)) for code in codes])
+    last_weekday, latest = _last_weekday_and_previous_day()
+    DailyQuoteRepository(local_db_path).save_many([_make_quote(code, latest) for code in codes])
+
+    fetcher = Mock()
+    fetcher.fetch_daily_quotes_frame_by_trade_date.side_effect = lambda trade_date: pd.DataFrame({
+        'ts_code': codes,
+        'trade_date': [trade_date.strftime('%Y%m%d')] * 3,
+        **{name: [10.0] * 3 for name in DailyQuoteRepository.VALUE_COLUMNS}
+    })
+    with patch('ashare.models.sync_service.DailyQuoteFetcher', return_value=fetcher):
+        DailyQuoteSync(local_db_path, 'token').fetch_and_save(ts_codes=['000001.SZ'])
+        DailyQuoteSync(local_db_path, 'token').fetch_and_save()
+
+    trade_dates = [c.args[0] for c in fetcher.fetch_daily_quotes_frame_by_trade_date.call_args_list]
+    assert trade_dates == [last_weekday, last_weekday]
+    repo = DailyQuoteRepository(local_db_path)
+    assert all([quote.trade_date for quote in repo.find_by_code(code)] == [latest, last_weekday] for code in codes)
+    sync = DailyQuoteSync(local_db_path, 'token')
+    assert sync.watermark_repo.get_watermarks(SyncType.DAILY_QUOTE) == {code: last_weekday for code in codes}
+
+def test_daily_quote_sync_advances_suspended_stocks(local_db_path):
+    """测试停牌股票不在截面中时高水位也随截面推进，下次同步不再重复拉取停牌以来的截面"""
+    codes = ['000001.SZ', '000002.SZ', '000003.SZ']
+    StockRepository(local_db_path).save_many([_make_stock(code, date(1991, 4, 3)) for code in codes])
+    last_weekday, latest = _last_weekday_and_previous_day()
+    DailyQuoteRepository(local_db_path).save_many([_make_quote(code, latest) for code in codes])
+
+    # 000002.SZ 停牌，不在截面中
+    fetcher = Mock()
+    fetcher.fetch_daily_quotes_frame_by_trade_date.side_effect = lambda trade_date: pd.DataFrame({
+        'ts_code': ['000001.SZ', '000003.SZ'],
+        'trade_date': [trade_date.strftime('%Y%m%d')] * 2,
+        **{name: [10.0] * 2 for name in DailyQuoteRepository.VALUE_COLUMNS}
+    })
+    with patch('ashare.models.sync_service.DailyQuoteFetcher', return_value=fetcher):
+        DailyQuoteSync(local_db_path, 'token').fetch_and_save()
+        DailyQuoteSync(local_db_path, 'token').fetch_and_save()
+
+    assert fetcher.fetch_daily_quotes_frame_by_trade_date.call_count == 1
+    fetcher.fetch_daily_quotes.assert_not_called()
+    assert len(DailyQuoteRepository(local_db_path).find_by_code('000002.SZ')) == 1
+    sync = DailyQuoteSync(local_db_path, 'token')
+    assert sync.watermark_repo.get_watermarks(SyncType.DAILY_QUOTE) == {code: last_weekday for code in codes}
+
+def test_adj_factor_sync_catches_up_after_filtered_sync(local_db_path):
+    """测试复权因子只同步部分股票后再全量同步，落后的股票会被补齐"""
+    codes = ['000001.SZ', '000002.SZ']
+    StockRepository(local_db_path).save_many([_make_stock(code, date(1991, 4, 3)) for code in codes])
+    last_weekday, latest = _last_weekday_and_previous_day()
+    AdjFactorRepository(local_db_path).save_many([AdjFactor(code, latest, Decimal("1.5")) for code in codes])
+
+    fetcher = Mock()
+    fetcher.fetch_adj_factors_frame_by_trade_date.side_effect = lambda trade_date: pd.DataFrame({
+        'ts_code': codes, 'trade_date': [trade_date.strftime('%Y%m%d')] * 2, 'adj_factor': [1.5, 2.0]
+    })
+    with patch('ashare.models.sync_service.AdjFactorFetcher', return_value=fetcher):
+        AdjFactorSync(local_db_path, 'token').fetch_and_save(ts_codes=['000002.SZ'])
+        AdjFactorSync(local_db_path, 'token').fetch_and_save()
+
+    assert fetcher.fetch_adj_factors_frame_by_trade_date.call_count == 2
+    repo = AdjFactorRepository(local_db_path)
+    assert [factor.trade_date for factor in repo.find_by_code('000001.SZ')] == [latest, last_weekday]
+    assert repo.find_by_code('000001.SZ')[-1].adj_factor == Decimal("1.5")
+    assert len(repo.find_by_code('000002.SZ')) == 2
+
+def test_daily_quote_sync_by_stock(local_db_path):
+    """测试关闭截面模式时逐只拉取"""
+    StockRepository(local_db_path).save_many([_make_stock('000001.SZ', date(1991, 4, 3))])
+    fetcher = Mock()
+    fetcher.fetch_daily_quotes.return_value = [_make_quote('000001.SZ', date(2023, 1, 3))]
+    with patch('ashare.models.sync_service.DailyQuoteFetcher', return_value=fetcher):
+        DailyQuoteSync(local_db_path, 'token', by_trade_date=False).fetch_and_save()
+
+    fetcher.fetch_daily_quotes_frame_by_trade_date.assert_not_called()
+    assert len(DailyQuoteRepository(local_db_path).find_by_code('000001.SZ')) == 1
+
+def test_daily_quote_sync_by_stock_uses_watermark(local_db_path):
+    """测试逐只拉取时只请求高水位之后的缺口"""
+    StockRepository(local_db_path).save_many([_make_stock('000001.SZ', date(1991, 4, 3))])
+    DailyQuoteRepository(local_db_path).save_many([_make_quote('000001.SZ', date(2023, 1, 3))])
+    fetcher = Mock()
+    fetcher.fetch_daily_quotes.return_value = [_make_quote('000001.SZ', date(2023, 1, 4))]
+    with patch('ashare.models.sync_service.DailyQuoteFetcher', return_value=fetcher):
+        sync = DailyQuoteSync(local_db_path, 'token', by_trade_date=False)
+        sync.fetch_and_save()
+
+    yesterday = date.today() - timedelta(days=1)
+    fetcher.fetch_daily_quotes.assert_called_once_with('000001.SZ', date(2023, 1, 4), yesterday)
+    assert sync.watermark_repo.get_watermark(SyncType.DAILY_QUOTE, '000001.SZ') == date(2023, 1, 4)
+
+def test_daily_indicator_sync_concurrent(local_db_path):
+    """测试并发拉取模式下所有股票数据都被写入并更新高水位"""
+    codes = [f'{i:06d}.SZ' for i in range(1, 21)]
+    StockRepository(local_db_path).save_many([_make_stock(code, date(2020, 1, 2)) for code in codes])
+    fetcher = Mock()
+    fetcher.fetch_daily_indicators.side_effect = lambda ts_code, start, end: [
+        DailyIndicator(ts_code, date(2023, 1, 3), *([Decimal("1")] * 16))
+    ]
+    with patch('ashare.models.sync_service.DailyIndicatorFetcher', return_value=fetcher):
+        sync = DailyIndicatorSync(local_db_path, 'token', concurrency=4, batch_size=7)
+        sync.fetch_and_save()
+
+    assert fetcher.fetch_daily_indicators.call_count == len(codes)
+    repo = DailyIndicatorRepository(local_db_path)
+    assert all(len(repo.find_by_code(code)) == 1 for code in codes)
+    assert sync.watermark_repo.get_watermarks(SyncType.DAILY_INDICATOR) == {code: date(2023, 1, 3) for code in codes}
+
+def test_sync_resumes_from_checkpoint(local_db_path):
+    """测试同步中断后重新执行只处理未完成的股票，全部完成后才更新同步时间"""
+    codes = [f'{i:06d}.SZ' for i in range(1, 6)]
+    StockRepository(local_db_path).save_many([_make_stock(code, date(2020, 1, 2)) for code in codes])
+    service = SyncService(local_db_path, 'token')
+
+    def failing_fetch(ts_code):
+        if ts_code == '000003.SZ':
+            raise Exception("网络中断")
+        return []
+
+    fetcher = Mock()
+    fetcher.fetch_dividends.side_effect = failing_fetch
+    with patch('ashare.models.sync_service.DividendFetcher', return_value=fetcher):
+        with pytest.raises(Exception, match="网络中断"):
+            service.sync(SyncType.DIVIDEND)
+    assert service.sync_task_repo.get_task(SyncType.DIVIDEND) is None
+
+    fetcher = Mock()
+    fetcher.fetch_dividends.return_value = []
+    with patch('ashare.models.sync_service.DividendFetcher', return_value=fetcher):
+        service.sync(SyncType.DIVIDEND)
+    fetched = [c.args[0] for c in fetcher.fetch_dividends.call_args_list]
+    assert fetched == ['000003.SZ', '000004.SZ', '000005.SZ']
+    assert service.sync_task_repo.get_task(SyncType.DIVIDEND) is not None
+    checkpoint_repo = service._fetcher_map[SyncType.DIVIDEND].checkpoint_repo
+    assert checkpoint_repo.get_done_codes(SyncType.DIVIDEND, (date.today() - timedelta(days=1)).isoformat()) == set()
+
+class _Tomorrow(date):
+    """今天为明天的日期类，模拟同步中断后跨过午夜再恢复"""
+
+    @classmethod
+    def today(cls):
+        return date.today() + timedelta(days=1)
+
+def test_sync_resumes_after_end_date_rolls_over(local_db_path):
+    """测试中断后截止日期已变化时恢复同步仍沿用原来的轮次，跳过已完成的股票"""
+    codes = [f'{i:06d}.SZ' for i in range(1, 6)]
+    StockRepository(local_db_path).save_many([_make_stock(code, date(2020, 1, 2)) for code in codes])
+    service = SyncService(local_db_path, 'token')
+
+    def failing_fetch(ts_code):
+        if ts_code == '000003.SZ':
+            raise Exception("网络中断")
+        return []
+
+    fetcher = Mock()
+    fetcher.fetch_dividends.side_effect = failing_fetch
+    with patch('ashare.models.sync_service.DividendFetcher', return_value=fetcher):
+        with pytest.raises(Exception, match="网络中断"):
+            service.sync(SyncType.DIVIDEND)
+
+    fetcher = Mock()
+    fetcher.fetch_dividends.return_value = []
+    with patch('ashare.models.sync_service.DividendFetcher', return_value=fetcher), \
+         patch('ashare.models.sync_service.date', _Tomorrow):
+        service.sync(SyncType.DIVIDEND)
+    fetched = [c.args[0] for c in fetcher.fetch_dividends.call_args_list]
+    assert fetched == ['000003.SZ', '000004.SZ', '000005.SZ']
+    # 完成后轮次结束，下一次同步开始新的轮次
+    checkpoint_repo = service._fetcher_map[SyncType.DIVIDEND].checkpoint_repo
+    assert checkpoint_repo.start_run(SyncType.DIVIDEND, 'next') == 'next'
+
+def test_financial_periods_to_refresh(local_db_path):
+    """测试只刷新仍在披露中的报告期和缺失的历史报告期"""
+    sync = FinancialReportSync(local_db_path, 'token', by_period=True,
+                               history_start=date(2022, 1, 1), grace_days=30)
+    saved = {date(2022, 3, 31), date(2022, 6, 30), date(2022, 9, 30), date(2022, 12, 31), date(2023, 3, 31)}
+    # 2023-05-15：年报截止日4月30日加30天宽限期内仍在披露，一季报同理；2023-06-30尚未结束
+    assert sync._periods_to_refresh(saved, date(2023, 5, 15)) == [date(2022, 12, 31), date(2023, 3, 31)]
+    # 2023-07-15：年报和一季报已结束且已有数据，半年报已结束但尚未截止
+    assert sync._periods_to_refresh(saved, date(2023, 7, 15)) == [date(2023, 6, 30)]
+    assert sync._periods_to_refresh(set(), date(2022, 7, 1)) == [date(2022, 3, 31), date(2022, 6, 30)]
+
+def test_financial_report_sync_by_period(local_db_path, fake_backend):
+    """测试按报告期同步全市场财报，每个报告期每张报表只调用一次接口"""
+    backend = fake_backend(num_stocks=3, start_date=date(2023, 1, 2), end_date=date.today())
+    sync = FinancialReportSync(local_db_path, 'token', by_period=True, history_start=date(2023, 1, 1))
+    sync.fetch_and_save(['000001.SZ', '600001.SH'])
+
+    periods = sync._periods_to_refresh(set(), date.today())
+    assert backend.calls['income_vip'] == len(periods)
+    assert backend.calls['income'] == 0
+    repo = FinancialReportRepository(local_db_path)
+    assert {report.ts_code for report in repo.get_all('000001.SZ')} == {'000001.SZ'}
+    assert repo.get_all('000003.SZ') == []
+    assert sync.watermark_repo.get_watermark(SyncType.FINANCIAL_REPORT, '000001.SZ') is not None
+
+def test_dividend_sync_backfills_by_stock_first(local_db_path, fake_backend):
+    """测试首次同步分红时逐只股票回补全部历史，完成后记录窗口高水位"""
+    backend = fake_backend(num_stocks=3, start_date=date(2022, 1, 3), end_date=date.today())
+    StockRepository(local_db_path).save_many([_make_stock(code, date(2000, 1, 4)) for code in backend.ts_codes])
+    sync = DividendSync(local_db_path, 'token')
+    sync.fetch_and_save()
+    assert backend.calls['dividend'] == 3
+    # 同一天再次同步时窗口为空，不再调用接口
+    sync.fetch_and_save()
+    assert backend.calls['dividend'] == 3
+
+    assert DividendRepository(local_db_path).find_by_code(backend.ts_codes[0])
+    yesterday = date.today() - timedelta(days=1)
+    assert sync.watermark_repo.get_watermark(SyncType.DIVIDEND, DividendSync.WINDOW_WATERMARK_KEY) == yesterday
+
+def test_dividend_sync_by_window(local_db_path):
+    """测试回补之后按公告日/除权除息日窗口拉取全市场分红，只写入有变化的记录"""
+    codes = [f'{i:06d}.SZ' for i in range(1, 11)]
+    StockRepository(local_db_path).save_many([_make_stock(code, date(2000, 1, 4)) for code in codes])
+    yesterday = date.today() - timedelta(days=1)
+    sync = DividendSync(local_db_path, 'token')
+    sync.watermark_repo.update_watermark(SyncType.DIVIDEND, DividendSync.WINDOW_WATERMARK_KEY,
+                                         yesterday - timedelta(days=2))
+    repository = DividendRepository(local_db_path)
+    unchanged = _make_dividend('000002.SZ', date(2022, 12, 31), '实施')
+    repository.save_many([unchanged])
+
+    def by_date(ann_date=None, ex_date=None):
+        if ann_date == yesterday:
+            return [_make_dividend('000001.SZ', date(2022, 12, 31), '预案')]
+        if ex_date == yesterday:
+            return [unchanged, _make_dividend('000003.SZ', date(2022, 12, 31), '实施')]
+        return []
+
+    fetcher = Mock()
+    fetcher.fetch_dividends_by_date.side_effect = by_date
+    with patch('ashare.models.sync_service.DividendFetcher', return_value=fetcher):
+        sync.fetch_and_save()
+
+    fetcher.fetch_dividends.assert_not_called()
+    # 两个窗口日，每天按公告日和除权除息日各调用一次
+    assert fetcher.fetch_dividends_by_date.call_count == 4
+    assert repository.find_by_code('000001.SZ')[0].div_proc == '预案'
+    assert repository.find_by_code('000003.SZ')
+    assert sync.watermark_repo.get_watermark(SyncType.DIVIDEND, DividendSync.WINDOW_WATERMARK_KEY) == yesterday
+
+def test_sync_all_runs_independent_types_concurrently(local_db_path):
+    """测试依赖完成后，互不依赖的同步类型并发执行并记录耗时"""
+    service = SyncService(local_db_path, 'token')
+    roots = [sync_type for sync_type in SyncType if not sync_type.dependencies]
+    dependents = [sync_type for sync_type in SyncType if sync_type.dependencies]
+    barriers = {
+        False: threading.Barrier(len(roots), timeout=5),
+        True: threading.Barrier(len(dependents), timeout=5),
+    }
+    events = []
+
+    def make_sync(sync_type):
+        def fetch_and_save(ts_codes=None):
+            events.append(('start', sync_type))
+            # 串行执行时第一个到达的同步会一直等到超时
+            barriers[bool(sync_type.dependencies)].wait()
+            events.append(('end', sync_type))
+        return Mock(fetch_and_save=Mock(side_effect=fetch_and_save))
+
+    with patch.dict(service._fetcher_map, {sync_type: make_sync(sync_type) for sync_type in SyncType}):
+        timings = service.sync_all()
+
+    # 没有依赖的类型全部结束后，依赖它们的类型才开始
+    assert {sync_type for _, sync_type in events[:2 * len(roots)]} == set(roots)
+    assert set(timings) == set(SyncType)
+    assert all(service.sync_task_repo.get_task(sync_type) is not None for sync_type in SyncType)
+
+def test_sync_all_skips_dependents_of_failed_type(local_db_path):
+    """测试股票列表同步失败时不再执行依赖它的同步类型"""
+    service = SyncService(local_db_path, 'token')
+    syncs = {sync_type: Mock() for sync_type in SyncType}
+    syncs[SyncType.STOCK_LIST].fetch_and_save.side_effect = Exception("同步出错")
+    with patch.dict(service._fetcher_map, syncs):
+        with pytest.raises(Exception, match="同步出错"):
+            service.sync_all()
+    assert syncs[SyncType.TRADE_CALENDAR].fetch_and_save.called
+    assert all(not syncs[sync_type].fetch_and_save.called
+               for sync_type in SyncType if SyncType.STOCK_LIST in sync_type.dependencies)
+
+def test_sync_all_selected_types(local_db_path):
+    """测试只执行指定的同步类型，未选中的依赖视为已完成"""
+    service = SyncService(local_db_path, 'token')
+    syncs = {sync_type: Mock() for sync_type in SyncType}
+    with patch.dict(service._fetcher_map, syncs):
+        timings = service.sync_all([SyncType.DIVIDEND])
+    assert set(timings) == {SyncType.DIVIDEND}
+    assert not syncs[SyncType.STOCK_LIST].fetch_and_save.called
+
+def test_trade_calendar_sync_is_incremental(local_db_path, fake_backend):
+    """测试交易日历首次同步全部历史，之后只从今天起重新同步到明年年底，已公布的未来日期会被刷新"""
+    backend = fake_backend(num_stocks=1)
+    sync = TradeCalendarSync(local_db_path, 'token')
+    sync.fetch_and_save()
+    with patch.object(TradeCalendarFetcher, 'fetch_trade_calendar', autospec=True,
+                      side_effect=TradeCalendarFetcher.fetch_trade_calendar) as fetch:
+        sync.fetch_and_save()
+
+    assert backend.calls['trade_cal'] == 2
+    end_date = date(date.today().year + 1, 12, 31)
+    fetch.assert_called_once_with(ANY, date.today(), end_date)
+    assert TradeCalendarRepository(local_db_path).find_date_range() == (TradeCalendarSync.CALENDAR_START, end_date)
+    assert TradingCalendar(local_db_path).covers(date(2000, 1, 1), date.today())
+
+def test_trade_calendar_sync_invalidates_shared_calendar(local_db_path, fake_backend):
+    """测试共享的交易日历按数据库复用，交易日历同步后重新加载"""
+    fake_backend(num_stocks=1)
+    calendar = TradingCalendar.load(local_db_path)
+    assert TradingCalendar.load(local_db_path) is calendar
+    assert not calendar.covers(date.today())
+
+    TradeCalendarSync(local_db_path, 'token').fetch_and_save()
+    reloaded = TradingCalendar.load(local_db_path)
+    assert reloaded is not calendar
+    assert reloaded.covers(date(2000, 1, 1), date.today())
+
+def test_daily_indicator_sync_skips_stocks_up_to_last_trading_day(local_db_path, fake_backend):
+    """测试高水位已到最近交易日的股票不再请求接口，其余股票只请求到最近交易日"""
+    fake_backend(num_stocks=1)
+    TradeCalendarSync(local_db_path, 'token').fetch_and_save()
+    calendar = TradingCalendar(local_db_path)
+    yesterday = date.today() - timedelta(days=1)
+    last_trading_day = yesterday if calendar.is_trading_day(yesterday) else calendar.prev_trading_day(yesterday)
+
+    StockRepository(local_db_path).save_many([
+        _make_stock('000001.SZ', date(1991, 4, 3)),
+        _make_stock('000002.SZ', date(1991, 1, 29)),
+    ])
+    sync = DailyIndicatorSync(local_db_path, 'token')
+    sync.watermark_repo.update_watermarks(SyncType.DAILY_INDICATOR, {
+        '000001.SZ': last_trading_day,
+        '000002.SZ': date(2023, 1, 3),
+    })
+    fetcher = Mock()
+    fetcher.fetch_daily_indicators.return_value = []
+    with patch('ashare.models.sync_service.DailyIndicatorFetcher', return_value=fetcher):
+        sync.fetch_and_save()
+
+    fetcher.fetch_daily_indicators.assert_called_once_with('000002.SZ', date(2023, 1, 4), last_trading_day)
+
+def test_serial_sync_commits_in_batches(local_db_path):
+    """测试串行同步在一个会话中按 batch_size 条记录分批提交，数据和检查点一起提交"""
+    codes = [f'{i:06d}.SZ' for i in range(1, 6)]
+    StockRepository(local_db_path).save_many([_make_stock(code, date(2023, 1, 2)) for code in codes])
+    fetcher = Mock()
+    fetcher.fetch_daily_indicators.side_effect = lambda ts_code, start_date, end_date: [DailyIndicator(
+        ts_code=ts_code, trade_date=date(2023, 1, 3), close=Decimal("10"), turnover_rate=None,
+        turnover_rate_f=None, volume_ratio=None, pe=None, pe_ttm=None, pb=None, ps=None, ps_ttm=None,
+        dv_ratio=None, dv_ttm=None, total_share=None, float_share=None, free_share=None,
+        total_mv=None, circ_mv=None)]
+    sync = DailyIndicatorSync(local_db_path, 'token', batch_size=2)
+    with patch('ashare.models.sync_service.DailyIndicatorFetcher', return_value=fetcher), \
+         patch.object(SyncSession, 'commit', autospec=True, side_effect=SyncSession.commit) as commit:
+        sync.fetch_and_save()
+
+    # 5只股票每批2只共3批，加上会话结束时的一次提交
+    assert commit.call_count == 4
+    assert sync.session is None
+    repo = DailyIndicatorRepository(local_db_path)
+    assert all(len(repo.find_by_code(code)) == 1 for code in codes)
+    run_key = (date.today() - timedelta(days=1)).isoformat()
+    assert sync.checkpoint_repo.get_done_codes(SyncType.DAILY_INDICATOR, run_key) == set(codes)
+
+def test_serial_sync_save_error_is_not_committed(local_db_path):
+    """测试串行同步写入失败时直接抛出异常，该批次不会再次写入，也不会记录检查点"""
+    sync = DailyIndicatorSync(local_db_path, 'token', batch_size=1)
+    save = Mock(side_effect=RuntimeError("写入失败"))
+    committed = Mock()
+    with pytest.raises(RuntimeError, match="写入失败"):
+        sync._run_serial(['000001.SZ', '000002.SZ'], lambda stock: [stock], save, committed)
+    assert save.call_count == 1
+    committed.assert_not_called()
+
+def test_sync_force_ignores_interval(local_db_path):
+    """测试 force 时不检查同步间隔"""
+    service = SyncService(local_db_path, 'token')
+    stock_sync = Mock()
+    with patch.dict(service._fetcher_map, {SyncType.STOCK_LIST: stock_sync}):
+        service.sync(SyncType.STOCK_LIST)
+        service.sync(SyncType.STOCK_LIST)
+        assert stock_sync.fetch_and_save.call_count == 1
+        service.sync(SyncType.STOCK_LIST, force=True)
+        assert stock_sync.fetch_and_save.call_count == 2
+
+def test_include_today_moves_end_date(local_db_path):
+    """测试 include_today 时按交易日同步的截止日期为今天（今天是交易日时）"""
+    calendar = Mock()
+    calendar.covers.return_value = True
+    calendar.is_trading_day.return_value = True
+    assert DailyQuoteSync(local_db_path, 'token')._last_trading_day(calendar) == date.today() - timedelta(days=1)
+    assert DailyQuoteSync(local_db_path, 'token', include_today=True)._last_trading_day(calendar) == date.today()
@@ -0,0 +1,51 @@
+import pytest
+from datetime import date
+from ..models.sync_session import SyncSession
+from ..models.stock import Stock
+from ..models.stock_repository import StockRepository
+from ..models.sync_type import SyncType
+from ..models.sync_watermark_repository import SyncWatermarkRepository
+
+@pytest.fixture
+def db_path(tmp_path):
+    """创建临时数据库文件路径"""
+    return str(tmp_path / "test_sync_session.db")
+
+def _make_stock(ts_code):
+    return Stock(
+        ts_code=ts_code, symbol=ts_code[:6], name=ts_code, area=None, industry=None,
+        fullname=None, enname=None, cnspell=None, market=None, exchange=None,
+        curr_type=None, list_status='L', list_date=date(2020, 1, 2), delist_date=None,
+        is_hs=None, act_name=None, act_ent_type=None
+    )
+
+def test_repository_created_once(db_path):
+    """测试同一类型的数据仓库只创建一次，且共用会话的连接"""
+    with SyncSession(db_path) as session:
+        repo = session.repository(StockRepository)
+        assert session.repository(StockRepository) is repo
+        assert repo.connection is session.connection
+        assert session.repository(SyncWatermarkRepository).connection is session.connection
+
+def test_writes_visible_after_commit(db_path):
+    """测试会话中的写入在提交前对其他连接不可见，多个仓库的写入在同一个事务中提交"""
+    with SyncSession(db_path) as session:
+        session.repository(StockRepository).save_many([_make_stock('000001.SZ')])
+        session.repository(SyncWatermarkRepository).update_watermark(SyncType.STOCK_LIST, '000001.SZ', date(2023, 1, 3))
+        assert StockRepository(db_path).find_all() == []
+        session.commit()
+        assert len(StockRepository(db_path).find_all()) == 1
+        assert SyncWatermarkRepository(db_path).get_watermark(SyncType.STOCK_LIST, '000001.SZ') == date(2023, 1, 3)
+        session.repository(StockRepository).save_many([_make_stock('000002.SZ')])
+    # 正常退出时提交剩余的写入
+    assert len(StockRepository(db_path).find_all()) == 2
+
+def test_rollback_on_error(db_path):
+    """测试异常退出时回滚未提交的写入"""
+    with pytest.raises(RuntimeError):
+        with SyncSession(db_path) as session:
+            session.repository(StockRepository).save_many([_make_stock('000001.SZ')])
+            session.commit()
+            session.repository(StockRepository).save_many([_make_stock('000002.SZ')])
+            raise RuntimeError("中断")
+    assert [stock.ts_code for stock in StockRepository(db_path).find_all()] == ['000001.SZ']
@@ -0,0 +1,40 @@
+import pytest
+from datetime import date
+from ..models.sync_watermark_repository import SyncWatermarkRepository
+from ..models.sync_type import SyncType
+
+@pytest.fixture
+def repository(tmp_path):
+    """创建仓库实例"""
+    return SyncWatermarkRepository(str(tmp_path / "test_watermark.db"))
+
+def test_get_watermark_not_exists(repository):
+    """测试获取不存在的高水位"""
+    assert repository.get_watermark(SyncType.DAILY_QUOTE, '000001.SZ') is None
+    assert repository.get_watermarks(SyncType.DAILY_QUOTE) == {}
+
+def test_update_and_get_watermark(repository):
+    """测试更新和获取高水位"""
+    repository.update_watermark(SyncType.DAILY_QUOTE, '000001.SZ', date(2023, 1, 3))
+    assert repository.get_watermark(SyncType.DAILY_QUOTE, '000001.SZ') == date(2023, 1, 3)
+    # 不同同步类型互不影响
+    assert repository.get_watermark(SyncType.DAILY_INDICATOR, '000001.SZ') is None
+
+def test_watermark_never_moves_backward(repository):
+    """测试高水位只前移不回退"""
+    repository.update_watermark(SyncType.DAILY_QUOTE, '000001.SZ', date(2023, 1, 3))
+    repository.update_watermark(SyncType.DAILY_QUOTE, '000001.SZ', date(2022, 12, 30))
+    assert repository.get_watermark(SyncType.DAILY_QUOTE, '000001.SZ') == date(2023, 1, 3)
+    repository.update_watermark(SyncType.DAILY_QUOTE, '000001.SZ', date(2023, 1, 4))
+    assert repository.get_watermark(SyncType.DAILY_QUOTE, '000001.SZ') == date(2023, 1, 4)
+
+def test_update_watermarks_batch(repository):
+    """测试批量更新高水位"""
+    repository.update_watermarks(SyncType.FINANCIAL_REPORT, {
+        '000001.SZ': date(2023, 4, 28),
+        '000002.SZ': date(2023, 3, 31),
+    })
+    assert repository.get_watermarks(SyncType.FINANCIAL_REPORT) == {
+        '000001.SZ': date(2023, 4, 28),
+        '000002.SZ': date(2023, 3, 31),
+    }
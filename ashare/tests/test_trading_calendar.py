@@ -0,0 +1,86 @@
+import pytest
+from datetime import date
+from ..models.fake_tushare import FakeProApi
+from ..models.tushare_api import TushareAPI
+from ..models.rate_limiter import DEFAULT_QUOTAS
+from ..models.trade_cal import TradeCal
+from ..models.trade_calendar_fetcher import TradeCalendarFetcher
+from ..models.trade_calendar_repository import TradeCalendarRepository
+from ..models.trading_calendar import TradingCalendar
+
+@pytest.fixture
+def db_path(tmp_path):
+    """创建临时数据库文件路径"""
+    return str(tmp_path / "test_trade_calendar.db")
+
+@pytest.fixture
+def calendar(db_path):
+    """2023年1月1日至1月31日的交易日历，1月23日至27日春节休市"""
+    holidays = {date(2023, 1, day) for day in range(23, 28)}
+    days = []
+    for day in range(1, 32):
+        cal_date = date(2023, 1, day)
+        days.append(TradeCal(exchange='SSE', cal_date=cal_date,
+                             is_open=cal_date.weekday() < 5 and cal_date not in holidays,
+                             pretrade_date=None))
+    TradeCalendarRepository(db_path).save_many(days)
+    return TradingCalendar(db_path)
+
+def test_is_trading_day(calendar):
+    """测试判断交易日，周末和节假日不是交易日"""
+    assert calendar.is_trading_day(date(2023, 1, 3))
+    assert not calendar.is_trading_day(date(2023, 1, 7))
+    assert not calendar.is_trading_day(date(2023, 1, 24))
+
+def test_next_and_prev_trading_day(calendar):
+    """测试前后交易日跨过周末和节假日"""
+    assert calendar.next_trading_day(date(2023, 1, 20)) == date(2023, 1, 30)
+    assert calendar.prev_trading_day(date(2023, 1, 30)) == date(2023, 1, 20)
+    assert calendar.next_trading_day(date(2023, 1, 3)) == date(2023, 1, 4)
+    assert calendar.prev_trading_day(date(2023, 1, 2)) is None
+    assert calendar.next_trading_day(date(2023, 1, 31)) is None
+
+def test_trading_days(calendar):
+    """测试区间内的交易日包含两端"""
+    assert calendar.trading_days(date(2023, 1, 19), date(2023, 1, 30)) == \
+        [date(2023, 1, 19), date(2023, 1, 20), date(2023, 1, 30)]
+    assert calendar.trading_days(date(2023, 1, 21), date(2023, 1, 29)) == []
+    assert len(calendar.trading_days(date(2023, 1, 1), date(2023, 1, 31))) == 17
+
+def test_out_of_range(calendar):
+    """测试查询未同步的日期时报错"""
+    assert calendar.covers(date(2023, 1, 1), date(2023, 1, 31))
+    assert not calendar.covers(date(2023, 1, 1), date(2023, 2, 1))
+    with pytest.raises(ValueError, match="未覆盖"):
+        calendar.is_trading_day(date(2023, 2, 1))
+    with pytest.raises(ValueError, match="未覆盖"):
+        calendar.trading_days(date(2022, 12, 30), date(2023, 1, 5))
+
+def test_empty_calendar(db_path):
+    """测试没有同步日历时不覆盖任何日期"""
+    calendar = TradingCalendar(db_path)
+    assert not calendar.covers(date(2023, 1, 3))
+    assert TradeCalendarRepository(db_path).find_date_range() is None
+
+@pytest.fixture
+def fake_backend():
+    """让 TushareAPI 使用离线后端并取消限流，测试结束后恢复"""
+    backend = FakeProApi(num_stocks=1)
+    TushareAPI.use_backend(backend)
+    TushareAPI.configure_rate_limits({}, default_calls_per_minute=600000, safety_factor=1.0)
+    yield backend
+    TushareAPI.use_backend(None)
+    TushareAPI.configure_rate_limits(DEFAULT_QUOTAS)
+
+def test_fetch_and_reload(db_path, fake_backend):
+    """测试从接口获取日历保存后重新加载"""
+    calendar = TradingCalendar(db_path)
+    days = TradeCalendarFetcher('fake-token').fetch_trade_calendar(date(2023, 1, 1), date(2023, 1, 10))
+    assert len(days) == 10
+    assert days[0] == TradeCal(exchange='SSE', cal_date=date(2023, 1, 10), is_open=True,
+                               pretrade_date=date(2023, 1, 9))
+    TradeCalendarRepository(db_path).save_many(days)
+    calendar.reload()
+    assert calendar.trading_days(date(2023, 1, 1), date(2023, 1, 10)) == [
+        date(2023, 1, 2), date(2023, 1, 3), date(2023, 1, 4), date(2023, 1, 5), date(2023, 1, 6),
+        date(2023, 1, 9), date(2023, 1, 10)]
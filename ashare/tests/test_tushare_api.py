@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+from ..models.tushare_api import TushareAPI
+from ..models.rate_limiter import RateLimiter
+from ..models.retry_policy import TushareError
+from ..models.sync_metrics import SyncMetrics
+
+@pytest.fixture
+def limiter():
+    return RateLimiter({'daily': 60}, safety_factor=1.0, sleep=lambda s: None)
+
+@pytest.fixture
+def api(limiter):
+    """使用 Mock 替换底层 pro_api 的 TushareAPI"""
+    tushare_api = TushareAPI('fake-token', retry_delay=0, rate_limiter=limiter)
+    tushare_api.api = Mock()
+    return tushare_api
+
+def test_call_goes_through_rate_limiter(api, limiter):
+    """测试每次调用都经过限流器"""
+    api.api.daily.return_value = pd.DataFrame({'ts_code': ['000001.SZ']})
+    df = api.daily(ts_code='000001.SZ')
+    assert len(df) == 1
+    api.daily(ts_code='000001.SZ')
+    stats = limiter.get_stats()['daily']
+    assert stats['calls'] == 2
+    assert stats['waited_calls'] == 1
+
+def test_retry_acquires_token_per_attempt(api, limiter):
+    """测试重试时每次尝试都重新获取令牌"""
+    api.api.daily.side_effect = [Exception("网络错误"), pd.DataFrame()]
+    api.daily(ts_code='000001.SZ')
+    assert limiter.get_stats()['daily']['calls'] == 2
+
+def test_shared_rate_limiter_by_default():
+    """测试默认所有实例共享同一个限流器"""
+    first = TushareAPI('fake-token')
+    second = TushareAPI('fake-token')
+    assert first.rate_limiter is second.rate_limiter is TushareAPI.get_rate_limiter()
+
+def test_permanent_error_fails_fast(api, limiter):
+    """测试永久错误不重试"""
+    api.api.daily.side_effect = Exception("抱歉，您没有访问该接口的权限")
+    with pytest.raises(Exception, match="权限"):
+        api.daily(ts_code='000001.SZ')
+    assert api.api.daily.call_count == 1
+
+def test_empty_result_returns_empty_frame(api):
+    """测试没有数据时返回空 DataFrame 且不重试"""
+    api.api.daily.side_effect = [None]
+    df = api.daily(ts_code='000001.SZ')
+    assert df.empty
+    api.api.daily.side_effect = Exception("无数据")
+    assert api.daily(ts_code='000002.SZ').empty
+    assert api.api.daily.call_count == 2
+
+def test_retry_honors_retry_after(api, monkeypatch):
+    """测试重试等待时间优先使用服务端给出的 retry_after"""
+    sleeps = []
+    monkeypatch.setattr('ashare.models.tushare_api.time.sleep', sleeps.append)
+    api.api.daily.side_effect = [TushareError('每分钟最多访问该接口500次', retry_after=7.0), pd.DataFrame()]
+    api.daily(ts_code='000001.SZ')
+    assert sleeps == [7.0]
+
+def test_zero_max_retries_raises_error(limiter):
+    """测试 max_retries 为0时只调用一次，失败时抛出异常而不是返回 None"""
+    api = TushareAPI('fake-token', max_retries=0, retry_delay=0, rate_limiter=limiter)
+    api.api = Mock()
+    api.api.daily.side_effect = Exception("网络错误")
+    with pytest.raises(Exception, match="网络错误"):
+        api.daily(ts_code='000001.SZ')
+    assert api.api.daily.call_count == 1
+
+def test_records_call_metrics(limiter):
+    """测试每次调用记录接口、主要参数、行数、重试次数和失败信息"""
+    metrics = SyncMetrics()
+    api = TushareAPI('fake-token', retry_delay=0, rate_limiter=limiter, metrics=metrics)
+    api.api = Mock()
+    api.api.daily.side_effect = [Exception("网络错误"), pd.DataFrame({'ts_code': ['000001.SZ'] * 3})]
+    api.daily(ts_code='000001.SZ')
+    api.api.daily.side_effect = Exception("抱歉，您没有访问该接口的权限")
+    with pytest.raises(Exception):
+        api.daily(trade_date='20230103')
+    first, second = metrics.calls
+    assert (first.endpoint, first.key, first.rows, first.retries, first.error) == ('daily', '000001.SZ', 3, 1, None)
+    assert (second.key, second.rows, second.retries) == ('20230103', 0, 0)
+    assert "权限" in second.error